@@ -0,0 +1,137 @@
+"""
+Circuit breakers for the requests to remote APIs.
+
+Every API root has its own breaker. When too many of the recent requests failed
+or were too slow, the breaker opens and requests fail immediately, instead of
+blocking the workers until the remote API times out. After a while a single
+request is let through to check if the remote API recovered.
+
+The state is kept per process.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _("The remote API is temporarily unavailable.")
+    default_code = "remote-api-unavailable"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str):
+        self.name = name
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.calls = deque()
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == OPEN:
+                if (
+                    time.time() - self.opened_at
+                    < settings.REMOTE_API_CIRCUIT_RESET_TIMEOUT
+                ):
+                    return False
+                self.state = HALF_OPEN
+
+            if self.state == HALF_OPEN:
+                # only a single request checks if the remote API recovered
+                if self._trial_running:
+                    return False
+                self._trial_running = True
+
+            return True
+
+    def record(self, duration: float, error: bool) -> None:
+        failed = error or duration >= settings.REMOTE_API_CIRCUIT_SLOW_CALL
+        now = time.time()
+
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._trial_running = False
+                if failed:
+                    self._open(now)
+                else:
+                    self.state = CLOSED
+                    logger.info("Circuit for %s is closed again", self.name)
+                return
+
+            self.calls.append((now, failed))
+            while (
+                self.calls
+                and self.calls[0][0] < now - settings.REMOTE_API_CIRCUIT_WINDOW
+            ):
+                self.calls.popleft()
+
+            if len(self.calls) < settings.REMOTE_API_CIRCUIT_MIN_CALLS:
+                return
+
+            failures = sum(1 for _, call_failed in self.calls if call_failed)
+            if failures / len(self.calls) >= settings.REMOTE_API_CIRCUIT_ERROR_RATE:
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        logger.warning("Circuit for %s is open, the remote API is failing", self.name)
+        self.state = OPEN
+        self.opened_at = now
+        self.calls.clear()
+
+    def check(self) -> None:
+        """
+        Raise :class:`CircuitOpenError` if no requests are allowed.
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(
+                _("The remote API {api_root} is temporarily unavailable.").format(
+                    api_root=self.name
+                )
+            )
+
+
+class CircuitBreakerRegistry:
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, api_root: str) -> CircuitBreaker:
+        breaker = self._breakers.get(api_root)
+        if breaker is not None:
+            return breaker
+
+        with self._lock:
+            if api_root not in self._breakers:
+                self._breakers[api_root] = CircuitBreaker(api_root)
+            return self._breakers[api_root]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._breakers = {}
+
+
+breakers = CircuitBreakerRegistry()
+
+
+@receiver(setting_changed, dispatch_uid="circuit_breaker.reset_breakers")
+def reset_breakers(setting: str, **kwargs) -> None:
+    if setting.startswith("REMOTE_API_CIRCUIT_"):
+        breakers.clear()
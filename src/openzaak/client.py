@@ -1,15 +1,214 @@
 """
 Provide utilities to interact with other APIs as a client.
+
+Remote objects are requested through pooled :class:`requests.Session` instances,
+one per service, so connections are kept alive between requests. The pool size,
+timeouts and retry policy are configured in the settings.
+
+Every request goes through the circuit breaker of its API root and is counted
+in the latency and error metrics.
 """
-from zgw_consumers.client import UnknownService
+import copy
+import threading
+import time
+from typing import List, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from zds_client.client import ClientError, Object, get_headers
+from zgw_consumers.client import UnknownService, ZGWClient
 from zgw_consumers.models import Service
 
+from openzaak import metrics
+from openzaak.circuit_breaker import breakers
+
+SESSION_SETTINGS = (
+    "REMOTE_API_POOL_SIZE",
+    "REMOTE_API_MAX_RETRIES",
+    "REMOTE_API_RETRY_BACKOFF",
+)
+
+
+def get_timeout() -> Tuple[float, float]:
+    """
+    Return the (connect, read) timeout for requests to remote APIs.
+    """
+    return (settings.REMOTE_API_CONNECT_TIMEOUT, settings.REMOTE_API_READ_TIMEOUT)
+
+
+class SessionRegistry:
+    """
+    Keep a pooled session per API root.
+
+    Requests for URLs that don't belong to a configured service share a
+    default session.
+    """
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_session() -> requests.Session:
+        retries = Retry(
+            total=settings.REMOTE_API_MAX_RETRIES,
+            # only retry failed connections and unavailable services
+            read=0,
+            status_forcelist=(502, 503, 504),
+            backoff_factor=settings.REMOTE_API_RETRY_BACKOFF,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=settings.REMOTE_API_POOL_SIZE,
+            pool_maxsize=settings.REMOTE_API_POOL_SIZE,
+            max_retries=retries,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get(self, api_root: str = "") -> requests.Session:
+        session = self._sessions.get(api_root)
+        if session is not None:
+            return session
+
+        with self._lock:
+            if api_root not in self._sessions:
+                self._sessions[api_root] = self.build_session()
+            return self._sessions[api_root]
+
+    def clear(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+
+sessions = SessionRegistry()
+
+
+@receiver(setting_changed, dispatch_uid="client.reset_sessions")
+def reset_sessions(setting: str, **kwargs) -> None:
+    if setting in SESSION_SETTINGS:
+        sessions.clear()
+
+
+def get_session(service: Optional[Service]) -> requests.Session:
+    return sessions.get(service.api_root if service else "")
+
+
+def send_request(
+    api_root: str, session: requests.Session, method: str, url: str, **kwargs
+) -> requests.Response:
+    """
+    Send the request through the circuit breaker of the API root.
+
+    Connection errors and server errors count as failures.
+    """
+    breaker = None
+    if api_root and settings.REMOTE_API_CIRCUIT_BREAKER:
+        breaker = breakers.get(api_root)
+        breaker.check()
+
+    error = True
+    start = time.perf_counter()
+    try:
+        response = session.request(method, url, **kwargs)
+        error = response.status_code >= 500
+        return response
+    finally:
+        duration = time.perf_counter() - start
+        if breaker is not None:
+            breaker.record(duration, error)
+        if api_root:
+            metrics.observe(api_root, duration, error)
+
+
+class PooledClient(ZGWClient):
+    """
+    API client performing its requests through the pooled session of the API.
+
+    The session, circuit breaker and metrics are those of the API root of the
+    service, also when the requests go through NLX.
+    """
+
+    # set by the services index, clients built otherwise use their base URL
+    api_root: Optional[str] = None
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send the request through the pooled session of the API root.
+        """
+        kwargs.setdefault("timeout", get_timeout())
+        api_root = self.api_root or self.base_url
+        return send_request(api_root, sessions.get(api_root), method, url, **kwargs)
+
+    # Mirrors ``zds_client.client.Client.request`` of gemma-zds-client 0.13.0,
+    # which sends the request with ``requests.request``. The only change is the
+    # call to :meth:`_send`; keep the rest in sync when upgrading the client.
+    def request(
+        self, path: str, operation: str, method="GET", expected_status=200, **kwargs
+    ) -> Union[List[Object], Object]:
+        url = urljoin(self.base_url, path)
+
+        headers = kwargs.pop("headers", {})
+        headers.setdefault("Accept", "application/json")
+        headers.setdefault("Content-Type", "application/json")
+        headers.update(get_headers(self.schema, operation))
+
+        if self.auth:
+            headers.update(self.auth.credentials())
+
+        kwargs["headers"] = headers
+
+        pre_id = self.pre_request(method, url, **kwargs)
+
+        response = self._send(method, url, **kwargs)
+
+        try:
+            response_json = response.json()
+        except Exception:
+            response_json = None
+
+        self.post_response(pre_id, response_json)
+
+        self._log.add(
+            self.service,
+            url,
+            method,
+            headers,
+            copy.deepcopy(kwargs.get("data", kwargs.get("json", None))),
+            response.status_code,
+            dict(response.headers),
+            response_json,
+            params=kwargs.get("params"),
+        )
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            if response.status_code >= 500:
+                raise
+            raise ClientError(response_json) from exc
+
+        assert response.status_code == expected_status, response_json
+        return response_json
+
 
 def fetch_object(resource: str, url: str) -> dict:
     """
     Fetch a remote object by URL.
     """
-    client = Service.get_client(url)
+    from openzaak.config.cache import services_index
+
+    client = services_index.get_client(url)
     if not client:
         raise UnknownService(f"{url} API should be added to Service model")
     obj = client.retrieve(resource, url=url)
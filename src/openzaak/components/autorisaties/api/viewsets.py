@@ -1,14 +1,28 @@
 import logging
+from typing import Optional
+
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
 
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
 from vng_api_common.authorizations.models import Applicatie
+from vng_api_common.filters import Backend
 from vng_api_common.notifications.viewsets import NotificationViewSetMixin
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from ..cache import (
+    get_applicatie_key,
+    get_applicatie_version,
+    get_cached_response,
+    get_response_digest,
+    get_version_timestamp,
+    set_cached_response,
+)
 from ._schema_overrides import ApplicatieConsumerAutoSchema
 from .filters import ApplicatieFilter, ApplicatieRetrieveFilter
 from .kanalen import KANAAL_AUTORISATIES
@@ -128,6 +142,71 @@ class ApplicatieViewSet(
 
         return obj
 
+    def get_cache_key(self) -> Optional[str]:
+        """
+        Identify the requested applicatie without querying it.
+
+        Returns ``None`` if the response cannot be validated by the version of the
+        applicatie: when the object permissions depend on the applicatie itself,
+        or when the ``clientId`` query parameter does not select a single client.
+        """
+        if any(
+            getattr(permission, "permission_fields", ())
+            for permission in self.get_permissions()
+        ):
+            return None
+
+        if self.action != "consumer":
+            return get_applicatie_key(applicatie_uuid=self.kwargs[self.lookup_field])
+
+        filterset = Backend().get_filterset(self.request, self.get_queryset(), self)
+        if not filterset.is_valid():
+            return None
+        client_ids = filterset.form.cleaned_data["client_id"]
+        if not client_ids or len(client_ids) != 1:
+            return None
+        return get_applicatie_key(client_id=client_ids[0])
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Support conditional requests and cache the serialized applicatie.
+
+        Both the ETag and the cached response are derived from the version of the
+        applicatie, which changes whenever the applicatie or its autorisaties
+        change. ``Last-Modified`` is only sent if the version carries the time of
+        that change.
+
+        The 304 and cached responses skip :meth:`get_object`. Without permission
+        fields, the object permissions are the same scope check as the permissions
+        checked in :meth:`initial`, and the ``clientId`` query parameter is
+        validated by :meth:`get_cache_key`. A removed applicatie replaces its
+        version, so it is not served from the cache either.
+        """
+        key = self.get_cache_key()
+        version = get_applicatie_version(key) if key is not None else None
+        if version is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        digest = get_response_digest(version, request.build_absolute_uri())
+        etag = quote_etag(digest)
+        last_modified = get_version_timestamp(version)
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            data = get_cached_response(digest)
+            if data is not None:
+                response = Response(data)
+            else:
+                response = super().retrieve(request, *args, **kwargs)
+                set_cached_response(digest, dict(response.data))
+
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
     @property
     def paginator(self):
         if self.action == "consumer":
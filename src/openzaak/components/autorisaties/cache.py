@@ -0,0 +1,264 @@
+"""
+Shared cache of the compiled authorizations of API clients.
+
+The authorizations of a client change rarely, but are needed on every API
+call. The compiled :class:`AuthorizationsIndex` is therefore stored in the
+default cache, keyed by client ID.
+
+Rather than tracking which cache keys belong to which applicatie, all entries
+share a version token. Any change to an applicatie, its autorisaties or a JWT
+secret replaces the token, which invalidates every cached index at once.
+
+Additionally, every process keeps a bounded set of recently verified tokens,
+so the JWT secret lookup and signature check are done once per token rather
+than on every request.
+
+Every applicatie also has a version token per UUID and per client ID, which is
+replaced when the applicatie or its autorisaties change. It serves as validator
+for conditional requests to the applicatie, and the serialized applicatie is
+cached per version. Replaced tokens include the time of the change, to serve as
+modification date. Tokens created on a cache miss (after a flush or eviction)
+do not, since the time of the last change is unknown.
+"""
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from vng_api_common.authorizations.models import Applicatie
+
+from .index import AuthorizationsIndex
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "autorisaties:version"
+APPLICATIE_VERSION_KEY = "autorisaties:applicatie:{key}:version"
+INDEX_KEY = "autorisaties:index:{version}:{client_id}"
+RESPONSE_KEY = "autorisaties:response:{digest}"
+
+
+def _get_cache():
+    return caches["default"]
+
+
+def _get_version(key: str) -> Optional[str]:
+    cache = _get_cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def get_version() -> Optional[str]:
+    """
+    Return the current version token, ``None`` if the cache is not available.
+    """
+    return _get_version(VERSION_KEY)
+
+
+def get_applicatie_key(
+    applicatie_uuid: Optional[str] = None, client_id: str = ""
+) -> str:
+    """
+    Identify an applicatie by its UUID or one of its client IDs.
+    """
+    if applicatie_uuid:
+        return f"uuid:{applicatie_uuid}"
+    return f"client-id:{client_id}"
+
+
+def get_applicatie_version(key: str) -> Optional[str]:
+    """
+    Return the version token of the applicatie identified by ``key``.
+    """
+    return _get_version(APPLICATIE_VERSION_KEY.format(key=key))
+
+
+def _new_version(changed_at: Optional[float] = None) -> str:
+    token = uuid.uuid4().hex
+    if changed_at is None:
+        return token
+    return f"{int(changed_at)}.{token}"
+
+
+def get_version_timestamp(version: str) -> Optional[int]:
+    """
+    Return the time of the change that replaced the version token, as a UNIX
+    timestamp, or ``None`` if it is not known.
+    """
+    timestamp, _, token = version.partition(".")
+    if not token or not timestamp.isdigit():
+        return None
+    return int(timestamp)
+
+
+def get_authorizations_index(
+    client_id: str, get_applicaties: Callable[[], List[Applicatie]]
+) -> AuthorizationsIndex:
+    """
+    Retrieve the compiled authorizations for ``client_id``.
+
+    On a cache miss, the index is built from the applicaties returned by
+    ``get_applicaties`` and stored for the next requests.
+    """
+    timeout = settings.AUTORISATIES_CACHE_TIMEOUT
+    if not timeout:
+        return AuthorizationsIndex.build(get_applicaties())
+
+    version = get_version()
+    if version is None:
+        # the cache backend is not available
+        return AuthorizationsIndex.build(get_applicaties())
+
+    cache = _get_cache()
+    key = INDEX_KEY.format(version=version, client_id=client_id)
+    index = cache.get(key)
+    if index is not None:
+        return index
+
+    index = AuthorizationsIndex.build(get_applicaties())
+    cache.set(key, index, timeout=timeout)
+    return index
+
+
+class VerifiedToken:
+    """
+    The verified payload of a JWT and the authorizations it resolved to.
+    """
+
+    __slots__ = ("payload", "expires_at", "version", "index")
+
+    def __init__(self, payload: dict, expires_at: float, version: str):
+        self.payload = payload
+        self.expires_at = expires_at
+        self.version = version
+        self.index = None
+
+
+class VerifiedTokens:
+    """
+    Bounded, in-process cache of verified JWTs, keyed by token digest.
+
+    Entries expire at ``iat + JWT_EXPIRY`` and are discarded when the version
+    token changes, i.e. when a JWT secret or authorizations change.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(encoded: str) -> str:
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, encoded: str, version: Optional[str]) -> Optional[VerifiedToken]:
+        if not settings.JWT_CACHE_SIZE or version is None:
+            return None
+
+        key = self._get_key(encoded)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if entry.version != version or entry.expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self, encoded: str, payload: dict, version: Optional[str]
+    ) -> Optional[VerifiedToken]:
+        size = settings.JWT_CACHE_SIZE
+        iat = payload.get("iat")
+        if not size or version is None or iat is None:
+            return None
+
+        entry = VerifiedToken(payload, iat + settings.JWT_EXPIRY, version)
+        with self._lock:
+            self._entries[self._get_key(encoded)] = entry
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verified_tokens = VerifiedTokens()
+
+
+def get_response_digest(version: str, url: str) -> str:
+    """
+    Identify the representation of the resource at ``url`` for the version.
+    """
+    return hashlib.md5(f"{version} {url}".encode("utf-8")).hexdigest()
+
+
+def get_cached_response(digest: str) -> Optional[dict]:
+    if not settings.AUTORISATIES_CACHE_TIMEOUT:
+        return None
+    return _get_cache().get(RESPONSE_KEY.format(digest=digest))
+
+
+def set_cached_response(digest: str, data: dict) -> None:
+    timeout = settings.AUTORISATIES_CACHE_TIMEOUT
+    if timeout:
+        _get_cache().set(RESPONSE_KEY.format(digest=digest), data, timeout=timeout)
+
+
+def _replace_version() -> None:
+    _get_cache().set(VERSION_KEY, _new_version(), timeout=None)
+
+
+def _replace_applicatie_versions(keys: List[str]) -> None:
+    changed_at = time.time()
+    _get_cache().set_many(
+        {
+            APPLICATIE_VERSION_KEY.format(key=key): _new_version(changed_at)
+            for key in keys
+        },
+        timeout=None,
+    )
+
+
+def invalidate_applicatie_cache(
+    applicatie_uuid: str, client_ids: Iterable[str]
+) -> None:
+    """
+    Invalidate the validators and cached responses of an applicatie.
+
+    Like the authorizations, the versions are replaced immediately and again once
+    the surrounding transaction commits. The new versions carry the time they are
+    replaced, which is the modification date of the applicatie.
+    """
+    keys = [get_applicatie_key(applicatie_uuid=applicatie_uuid)] + [
+        get_applicatie_key(client_id=client_id) for client_id in set(client_ids)
+    ]
+    _replace_applicatie_versions(keys)
+    transaction.on_commit(lambda: _replace_applicatie_versions(keys))
+
+
+def invalidate_authorizations_cache() -> None:
+    """
+    Invalidate the compiled authorizations and verified tokens of all clients.
+
+    The cache is invalidated immediately and again once the surrounding
+    transaction commits, so that concurrent requests cannot store an index
+    built from the state before the commit.
+    """
+    logger.debug("Invalidating the authorizations cache")
+    _replace_version()
+    verified_tokens.clear()
+    transaction.on_commit(_replace_version)
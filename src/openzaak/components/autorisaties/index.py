@@ -0,0 +1,151 @@
+"""
+In-memory representation of the authorizations granted to a client.
+
+Permission checks and list filtering consult the authorizations of the client
+several times during a single request. Rather than querying the database for
+each check, the :class:`AuthorizationsIndex` is compiled once and all lookups
+are answered from memory.
+"""
+from collections import defaultdict
+from typing import Iterable, List, Optional
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from .models import COMPONENT_TO_FIELD
+
+
+def get_va_order(value: str) -> Optional[int]:
+    if not value:
+        return None
+    return VertrouwelijkheidsAanduiding.get_choice(value).order
+
+
+class CompiledAutorisatie:
+    """
+    Read-only, pre-processed copy of an :class:`Autorisatie`.
+
+    The scopes are stored as a set and the ``max_vertrouwelijkheidaanduiding``
+    is mapped to its order number, so that checks don't need to repeat the
+    conversion.
+    """
+
+    __slots__ = (
+        "applicatie_id",
+        "component",
+        "scopes",
+        "zaaktype",
+        "informatieobjecttype",
+        "besluittype",
+        "max_vertrouwelijkheidaanduiding",
+        "max_va_order",
+    )
+
+    def __init__(self, autorisatie: Autorisatie):
+        self.applicatie_id = autorisatie.applicatie_id
+        self.component = autorisatie.component
+        self.scopes = frozenset(autorisatie.scopes)
+        self.zaaktype = autorisatie.zaaktype
+        self.informatieobjecttype = autorisatie.informatieobjecttype
+        self.besluittype = autorisatie.besluittype
+        self.max_vertrouwelijkheidaanduiding = (
+            autorisatie.max_vertrouwelijkheidaanduiding
+        )
+        self.max_va_order = get_va_order(autorisatie.max_vertrouwelijkheidaanduiding)
+
+    def __repr__(self):
+        return "<%s: component=%r, type=%r>" % (
+            self.__class__.__name__,
+            self.component,
+            self.type_url,
+        )
+
+    def __getstate__(self):
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+    def __setstate__(self, state):
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    @property
+    def type_url(self) -> Optional[str]:
+        field = COMPONENT_TO_FIELD.get(self.component)
+        return getattr(self, field) if field else None
+
+    def matches(self, **fields) -> bool:
+        for name, value in fields.items():
+            if value is None:
+                continue
+
+            if name == "vertrouwelijkheidaanduiding":
+                # the authorization must allow at least the confidentiality
+                # level of the object being checked
+                if self.max_va_order is None:
+                    return False
+                if self.max_va_order < get_va_order(value):
+                    return False
+                continue
+
+            if getattr(self, name) != value:
+                return False
+
+        return True
+
+
+class AuthorizationsIndex:
+    """
+    Index the authorizations of a client by component and type URL.
+    """
+
+    def __init__(
+        self, applicaties: List[Applicatie], autorisaties: Iterable[Autorisatie]
+    ):
+        self.applicatie_ids = [applicatie.id for applicatie in applicaties]
+        self.heeft_alle_autorisaties = any(
+            applicatie.heeft_alle_autorisaties for applicatie in applicaties
+        )
+
+        self._by_component = defaultdict(list)
+        self._by_type = defaultdict(list)
+
+        for autorisatie in autorisaties:
+            compiled = CompiledAutorisatie(autorisatie)
+            self._by_component[compiled.component].append(compiled)
+            if compiled.type_url:
+                key = (compiled.component, compiled.type_url)
+                self._by_type[key].append(compiled)
+
+    @classmethod
+    def build(cls, applicaties: List[Applicatie]) -> "AuthorizationsIndex":
+        if not applicaties:
+            return cls([], [])
+
+        autorisaties = Autorisatie.objects.filter(
+            applicatie_id__in=[applicatie.id for applicatie in applicaties]
+        )
+        return cls(applicaties, autorisaties)
+
+    def get_autorisaties(self, component: str, **fields) -> List[CompiledAutorisatie]:
+        """
+        Return the authorizations for ``component`` matching ``fields``.
+        """
+        type_field = COMPONENT_TO_FIELD.get(component)
+        type_url = fields.get(type_field) if type_field else None
+
+        if type_url is not None:
+            candidates = self._by_type.get((component, type_url), [])
+        else:
+            candidates = self._by_component.get(component, [])
+
+        if not fields:
+            return list(candidates)
+
+        return [
+            autorisatie for autorisatie in candidates if autorisatie.matches(**fields)
+        ]
+
+    def get_scopes(self, component: str, **fields) -> set:
+        scopes_provided = set()
+        for autorisatie in self.get_autorisaties(component, **fields):
+            scopes_provided.update(autorisatie.scopes)
+        return scopes_provided
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ...models import AutorisatieSpec
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the Autorisaties of all Applicaties from their AutorisatieSpecs, "
+        "for all existing ZaakTypen, InformatieObjectTypen and BesluitTypen"
+    )
+
+    @transaction.atomic
+    def handle(self, **options):
+        AutorisatieSpec.sync()
+        self.stdout.write(self.style.SUCCESS("Autorisaties synchronized"))
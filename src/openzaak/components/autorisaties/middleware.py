@@ -1,9 +1,6 @@
 from typing import List
 
-from django.db import models
-from django.db.models import Subquery
-
-from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.authorizations.models import Applicatie
 from vng_api_common.middleware import (
     AuthMiddleware as _AuthMiddleware,
     JWTAuth as _JWTAuth,
@@ -11,57 +8,96 @@ from vng_api_common.middleware import (
 
 from openzaak.utils.constants import COMPONENT_MAPPING
 
+from .cache import get_authorizations_index, get_version, verified_tokens
+from .index import AuthorizationsIndex, CompiledAutorisatie
+
 
 class JWTAuth(_JWTAuth):
     component = None
+    _verified_token = None
 
     def _request_auth(self) -> list:
         return []
 
-    def get_autorisaties(self, init_component: str) -> models.QuerySet:
+    @property
+    def payload(self):
         """
-        Retrieve all authorizations relevant to this component.
+        Verify the token once per process, rather than once per request.
+
+        See :class:`openzaak.components.autorisaties.cache.VerifiedTokens`.
+        """
+        if self.encoded is None:
+            return None
+
+        if not hasattr(self, "_payload"):
+            # read the version before verifying, so that changes made in the
+            # meantime invalidate the entry
+            version = get_version()
+            entry = verified_tokens.get(self.encoded, version)
+            if entry is not None:
+                self._payload = entry.payload
+            else:
+                payload = super().payload
+                entry = verified_tokens.set(self.encoded, payload, version)
+            self._verified_token = entry
+
+        return self._payload
+
+    @property
+    def applicaties(self) -> List[Applicatie]:
+        if self.client_id is None:
+            return []
+
+        if not hasattr(self, "_applicaties"):
+            self._applicaties = list(self._get_auth())
+        return self._applicaties
+
+    @property
+    def authorizations_index(self) -> AuthorizationsIndex:
+        """
+        Compile the authorizations of the client once per request.
+
+        The compiled authorizations are shared between requests through the
+        cache, see :mod:`openzaak.components.autorisaties.cache`.
         """
-        if not self.applicaties:
-            return Autorisatie.objects.none()
+        if not hasattr(self, "_authorizations_index"):
+            if self.client_id is None:
+                index = AuthorizationsIndex.build([])
+            elif self._verified_token and self._verified_token.index is not None:
+                index = self._verified_token.index
+            else:
+                index = get_authorizations_index(
+                    self.client_id, lambda: self.applicaties
+                )
+                if self._verified_token:
+                    self._verified_token.index = index
+            self._authorizations_index = index
+        return self._authorizations_index
 
+    def get_autorisaties(self, init_component: str) -> List[CompiledAutorisatie]:
+        """
+        Retrieve all authorizations relevant to this component.
+        """
         component = COMPONENT_MAPPING.get(init_component, init_component)
-        app_ids = self.applicaties.values("id")
-        return Autorisatie.objects.filter(
-            applicatie_id__in=Subquery(app_ids), component=component
-        )
+        return self.authorizations_index.get_autorisaties(component)
 
     def has_auth(self, scopes: List[str], init_component: str = None, **fields) -> bool:
         if scopes is None:
             return False
 
-        if not self.applicaties:
+        index = self.authorizations_index
+        if not index.applicatie_ids:
             return False
 
         # allow everything
-        if self.applicaties.filter(heeft_alle_autorisaties=True).exists():
+        if index.heeft_alle_autorisaties:
             return True
 
         if not init_component:
             return False
 
-        autorisaties = self.get_autorisaties(init_component)
-        scopes_provided = set()
-
-        # filter on all additional components
-        for field_name, field_value in fields.items():
-            if hasattr(self, f"filter_{field_name}"):
-                autorisaties = getattr(self, f"filter_{field_name}")(
-                    autorisaties, field_value
-                )
-            else:
-                autorisaties = self.filter_default(
-                    autorisaties, field_name, field_value
-                )
-
-        for autorisatie in autorisaties:
-            scopes_provided.update(autorisatie.scopes)
-
+        component = COMPONENT_MAPPING.get(init_component, init_component)
+        scopes_provided = index.get_scopes(component, **fields)
         return scopes.is_contained_in(list(scopes_provided))
 
 
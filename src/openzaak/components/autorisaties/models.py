@@ -1,4 +1,5 @@
 from collections import defaultdict
+from typing import Iterable, List, Tuple
 
 from django.apps import apps
 from django.contrib.postgres.fields import ArrayField
@@ -17,6 +18,10 @@ COMPONENT_TO_MODEL = {
     ComponentTypes.brc: "catalogi.BesluitType",
 }
 
+MODEL_TO_COMPONENT = {
+    model: component for component, model in COMPONENT_TO_MODEL.items()
+}
+
 COMPONENT_TO_FIELD = {
     ComponentTypes.zrc: "zaaktype",
     ComponentTypes.drc: "informatieobjecttype",
@@ -73,12 +78,11 @@ class AutorisatieSpec(models.Model):
         """
         Synchronize the Autorisaties for all Applicaties.
 
-        Invoke this method whenever a ZaakType/InformatieObjectType/BesluitType
-        is created to set up the appropriate Autorisatie objects. This is best
-        called as part of `transaction.on_commit`.
+        All ZaakTypen/InformatieObjectTypen/BesluitTypen are checked against the
+        specs, which scales with the number of specs times the number of types.
+        This is exposed as the ``sync_autorisaties`` management command - when
+        types are created, use :meth:`sync_types` instead.
         """
-        from .utils import send_applicatie_changed_notification
-
         qs = cls.objects.select_related("applicatie").prefetch_related(
             "applicatie__autorisaties"
         )
@@ -110,43 +114,101 @@ class AutorisatieSpec(models.Model):
                 to_keep.append(autorisatie)
 
             TypeModel = apps.get_model(COMPONENT_TO_MODEL[spec.component])
-            field = COMPONENT_TO_FIELD[spec.component]
-
             for obj in TypeModel.objects.all():
-                url = build_absolute_url(obj.get_absolute_api_url())
-
-                autorisatie = Autorisatie(
-                    applicatie=spec.applicatie,
-                    component=spec.component,
-                    scopes=spec.scopes,
-                    max_vertrouwelijkheidaanduiding=spec.max_vertrouwelijkheidaanduiding,
-                    **{field: url}
-                )
-                to_add.append(autorisatie)
+                to_add.append(spec.build_autorisatie(obj))
 
-        Autorisatie.objects.filter(pk__in=[autorisatie.pk for autorisatie in to_delete])
+        Autorisatie.objects.filter(
+            pk__in=[autorisatie.pk for autorisatie in to_delete]
+        ).delete()
 
         # de-duplicate - whatever is in to_keep should not be added again
-        existing_urls = defaultdict(list)
-        for autorisatie in to_keep:
-            if autorisatie.component not in COMPONENT_TO_FIELD:
-                continue
-            url = getattr(autorisatie, COMPONENT_TO_FIELD[autorisatie.component])
-            existing_urls[autorisatie.component].append(url)
-
-        _to_add = []
-        for autorisatie in to_add:
-            if autorisatie.component not in COMPONENT_TO_FIELD:
-                continue
-            url = getattr(autorisatie, COMPONENT_TO_FIELD[autorisatie.component])
-            if url in existing_urls[autorisatie.component]:
-                continue
-            _to_add.append(autorisatie)
+        existing = {_get_key(autorisatie) for autorisatie in to_keep}
+        _to_add = [
+            autorisatie
+            for autorisatie in to_add
+            if _get_key(autorisatie) not in existing
+        ]
+
+        cls._add_autorisaties(_to_add, changed=to_delete)
+
+    @classmethod
+    def sync_types(cls, objects: Iterable[models.Model]) -> None:
+        """
+        Add the Autorisaties for newly created types to the Applicaties.
+
+        Invoke this method whenever a ZaakType/InformatieObjectType/BesluitType
+        is created to set up the appropriate Autorisatie objects. This is best
+        called as part of `transaction.on_commit`.
+        """
+        by_component = defaultdict(list)
+        for obj in objects:
+            by_component[MODEL_TO_COMPONENT[obj._meta.label]].append(obj)
+
+        specs = cls.objects.filter(component__in=by_component).select_related(
+            "applicatie"
+        )
+        if not specs:
+            return
+
+        # look up the Autorisaties that already exist for these types
+        existing = set()
+        for component, objs in by_component.items():
+            field = COMPONENT_TO_FIELD[component]
+            urls = [build_absolute_url(obj.get_absolute_api_url()) for obj in objs]
+            existing.update(
+                (applicatie_id, component, url)
+                for applicatie_id, url in Autorisatie.objects.filter(
+                    applicatie_id__in={spec.applicatie_id for spec in specs},
+                    component=component,
+                    **{f"{field}__in": urls},
+                ).values_list("applicatie_id", field)
+            )
+
+        to_add = [
+            autorisatie
+            for spec in specs
+            for autorisatie in (
+                spec.build_autorisatie(obj) for obj in by_component[spec.component]
+            )
+            if _get_key(autorisatie) not in existing
+        ]
+        cls._add_autorisaties(to_add)
+
+    @staticmethod
+    def _add_autorisaties(
+        autorisaties: List[Autorisatie], changed: List[Autorisatie] = ()
+    ) -> None:
+        from .cache import invalidate_authorizations_cache
+        from .utils import send_applicatie_changed_notification
 
         # created the de-duplicated, missing autorisaties
-        Autorisatie.objects.bulk_create(_to_add)
+        Autorisatie.objects.bulk_create(autorisaties)
 
         # determine which notifications to send
-        changed = {autorisatie.applicatie for autorisatie in (to_delete + _to_add)}
-        for applicatie in changed:
+        applicaties = {
+            autorisatie.applicatie for autorisatie in (*changed, *autorisaties)
+        }
+        if applicaties:
+            # bulk_create does not emit signals
+            invalidate_authorizations_cache()
+
+        for applicatie in applicaties:
             send_applicatie_changed_notification(applicatie)
+
+    def build_autorisatie(self, obj: models.Model) -> Autorisatie:
+        """
+        Build the (unsaved) Autorisatie for the type ``obj`` according to the spec.
+        """
+        field = COMPONENT_TO_FIELD[self.component]
+        return Autorisatie(
+            applicatie=self.applicatie,
+            component=self.component,
+            scopes=self.scopes,
+            max_vertrouwelijkheidaanduiding=self.max_vertrouwelijkheidaanduiding,
+            **{field: build_absolute_url(obj.get_absolute_api_url())},
+        )
+
+
+def _get_key(autorisatie: Autorisatie) -> Tuple[int, str, str]:
+    url = getattr(autorisatie, COMPONENT_TO_FIELD[autorisatie.component])
+    return (autorisatie.applicatie_id, autorisatie.component, url)
@@ -0,0 +1,76 @@
+from django.db.models.base import ModelBase
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.models import JWTSecret
+
+from .cache import invalidate_applicatie_cache, invalidate_authorizations_cache
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Applicatie,
+    dispatch_uid="autorisaties.invalidate_applicatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Autorisatie,
+    dispatch_uid="autorisaties.invalidate_autorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=JWTSecret,
+    dispatch_uid="autorisaties.invalidate_jwtsecret",
+)
+def invalidate_authorizations(sender: ModelBase, **kwargs) -> None:
+    """
+    Drop the cached authorizations and verified tokens when an applicatie,
+    autorisatie or JWT secret changes.
+    """
+    invalidate_authorizations_cache()
+
+
+@receiver(pre_save, sender=Applicatie, dispatch_uid="autorisaties.store_client_ids")
+def store_client_ids(sender: ModelBase, instance: Applicatie, **kwargs) -> None:
+    """
+    Remember the stored client IDs, so the removed ones are invalidated too.
+    """
+    if instance.pk is None:
+        instance._stored_client_ids = []
+        return
+
+    instance._stored_client_ids = (
+        Applicatie.objects.filter(pk=instance.pk)
+        .values_list("client_ids", flat=True)
+        .first()
+        or []
+    )
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Applicatie,
+    dispatch_uid="autorisaties.invalidate_applicatie_responses",
+)
+def invalidate_applicatie_responses(
+    sender: ModelBase, instance: Applicatie, **kwargs
+) -> None:
+    client_ids = instance.client_ids + getattr(instance, "_stored_client_ids", [])
+    invalidate_applicatie_cache(instance.uuid, client_ids)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Autorisatie,
+    dispatch_uid="autorisaties.invalidate_autorisatie_responses",
+)
+def invalidate_autorisatie_responses(
+    sender: ModelBase, instance: Autorisatie, **kwargs
+) -> None:
+    try:
+        applicatie = instance.applicatie
+    except Applicatie.DoesNotExist:
+        # deleted with its applicatie
+        return
+    invalidate_applicatie_cache(applicatie.uuid, applicatie.client_ids)
@@ -0,0 +1,149 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import override_settings
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_AUTORISATIES_LEZEN
+from ..api.viewsets import ApplicatieViewSet
+from .factories import ApplicatieFactory, AutorisatieFactory
+from .utils import get_operation_url
+
+
+@override_settings(AUTORISATIES_CACHE_TIMEOUT=60)
+class ApplicatieConditionalRequestTests(JWTAuthMixin, APITestCase):
+    scopes = [str(SCOPE_AUTORISATIES_LEZEN)]
+    component = ComponentTypes.ac
+
+    def setUp(self):
+        super().setUp()
+
+        self.applicatie = ApplicatieFactory.create(client_ids=["consumer"])
+        self.autorisatie = AutorisatieFactory.create(
+            applicatie=self.applicatie,
+            component=ComponentTypes.zrc,
+            scopes=["zaken.lezen"],
+            zaaktype="https://example.com/zaaktypen/1",
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        self.consumer_url = get_operation_url("applicatie_consumer")
+
+    def test_detail_not_modified(self):
+        url = reverse(self.applicatie)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_last_modified_is_change_time(self):
+        with freeze_time("2020-01-01T12:00:00Z"):
+            self.autorisatie.save()
+
+        with freeze_time("2020-01-01T13:00:00Z"):
+            response = self.client.get(reverse(self.applicatie))
+
+        self.assertEqual(response["Last-Modified"], "Wed, 01 Jan 2020 12:00:00 GMT")
+
+    def test_no_last_modified_after_cache_flush(self):
+        caches["default"].clear()
+
+        response = self.client.get(reverse(self.applicatie))
+
+        self.assertIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+
+    def test_consumer_not_modified(self):
+        response = self.client.get(self.consumer_url, {"clientId": "consumer"})
+        etag = response["ETag"]
+
+        response = self.client.get(
+            self.consumer_url, {"clientId": "consumer"}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_changes_with_autorisaties(self):
+        response = self.client.get(self.consumer_url, {"clientId": "consumer"})
+        etag = response["ETag"]
+
+        self.autorisatie.scopes = ["zaken.lezen", "zaken.bijwerken"]
+        self.autorisatie.save()
+
+        response = self.client.get(
+            self.consumer_url, {"clientId": "consumer"}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(
+            response.json()["autorisaties"][0]["scopes"],
+            ["zaken.lezen", "zaken.bijwerken"],
+        )
+
+    def test_response_cached(self):
+        response = self.client.get(self.consumer_url, {"clientId": "consumer"})
+
+        with patch.object(ApplicatieViewSet, "get_object") as mock_get_object:
+            cached_response = self.client.get(
+                self.consumer_url, {"clientId": "consumer"}
+            )
+
+        mock_get_object.assert_not_called()
+        self.assertEqual(cached_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached_response.json(), response.json())
+
+    def test_etag_kept_on_other_applicatie_change(self):
+        response = self.client.get(self.consumer_url, {"clientId": "consumer"})
+        etag = response["ETag"]
+
+        other = ApplicatieFactory.create(client_ids=["other"])
+        AutorisatieFactory.create(applicatie=other, component=ComponentTypes.drc)
+
+        response = self.client.get(
+            self.consumer_url, {"clientId": "consumer"}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_removed_client_id_not_cached(self):
+        response = self.client.get(self.consumer_url, {"clientId": "consumer"})
+        etag = response["ETag"]
+
+        self.applicatie.client_ids = ["renamed"]
+        self.applicatie.save()
+
+        response = self.client.get(
+            self.consumer_url, {"clientId": "consumer"}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_deleted_applicatie_not_cached(self):
+        url = reverse(self.applicatie)
+        self.client.get(url)
+
+        self.applicatie.delete()
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_client_id_required_with_cached_response(self):
+        self.client.get(self.consumer_url, {"clientId": "consumer"})
+
+        response = self.client.get(self.consumer_url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
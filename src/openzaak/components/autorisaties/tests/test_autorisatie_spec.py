@@ -0,0 +1,100 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+
+from openzaak.components.catalogi.tests.factories import (
+    InformatieObjectTypeFactory,
+    ZaakTypeFactory,
+)
+from openzaak.utils import build_absolute_url
+
+from ..models import AutorisatieSpec
+from .factories import ApplicatieFactory, AutorisatieSpecFactory
+
+
+@patch("openzaak.components.autorisaties.utils.send_applicatie_changed_notification")
+class AutorisatieSpecSyncTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.spec = AutorisatieSpecFactory.create(
+            component=ComponentTypes.zrc,
+            scopes=["zaken.lezen"],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        cls.other_spec = AutorisatieSpecFactory.create(
+            component=ComponentTypes.drc,
+            scopes=["documenten.lezen"],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+    def test_sync_types_adds_new_type(self, mock_notify):
+        zaaktype = ZaakTypeFactory.create()
+
+        AutorisatieSpec.sync_types([zaaktype])
+
+        autorisatie = Autorisatie.objects.get()
+        self.assertEqual(autorisatie.applicatie, self.spec.applicatie)
+        self.assertEqual(autorisatie.component, ComponentTypes.zrc)
+        self.assertEqual(autorisatie.scopes, ["zaken.lezen"])
+        self.assertEqual(
+            autorisatie.zaaktype, build_absolute_url(zaaktype.get_absolute_api_url())
+        )
+        mock_notify.assert_called_once_with(self.spec.applicatie)
+
+    def test_sync_types_only_considers_given_types(self, mock_notify):
+        ZaakTypeFactory.create()
+        informatieobjecttype = InformatieObjectTypeFactory.create()
+
+        AutorisatieSpec.sync_types([informatieobjecttype])
+
+        self.assertEqual(
+            list(Autorisatie.objects.values_list("component", flat=True)),
+            [ComponentTypes.drc],
+        )
+        mock_notify.assert_called_once_with(self.other_spec.applicatie)
+
+    def test_sync_types_existing_autorisatie(self, mock_notify):
+        zaaktype = ZaakTypeFactory.create()
+        AutorisatieSpec.sync_types([zaaktype])
+        mock_notify.reset_mock()
+
+        AutorisatieSpec.sync_types([zaaktype])
+
+        self.assertEqual(Autorisatie.objects.count(), 1)
+        mock_notify.assert_not_called()
+
+    def test_full_sync_command(self, mock_notify):
+        zaaktype1, zaaktype2 = ZaakTypeFactory.create_batch(2)
+        applicatie = ApplicatieFactory.create()
+        # outdated autorisatie, the spec was changed
+        Autorisatie.objects.create(
+            applicatie=self.spec.applicatie,
+            component=ComponentTypes.zrc,
+            scopes=["zaken.bijwerken"],
+            zaaktype=build_absolute_url(zaaktype1.get_absolute_api_url()),
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        # another applicatie having access should not prevent the sync
+        Autorisatie.objects.create(
+            applicatie=applicatie,
+            component=ComponentTypes.zrc,
+            scopes=["zaken.lezen"],
+            zaaktype=build_absolute_url(zaaktype2.get_absolute_api_url()),
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        call_command("sync_autorisaties", stdout=StringIO())
+
+        autorisaties = self.spec.applicatie.autorisaties.all()
+        self.assertEqual(autorisaties.count(), 2)
+        for autorisatie in autorisaties:
+            with self.subTest(autorisatie=autorisatie):
+                self.assertEqual(autorisatie.scopes, ["zaken.lezen"])
+        mock_notify.assert_called_once_with(self.spec.applicatie)
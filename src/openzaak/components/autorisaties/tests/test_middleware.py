@@ -0,0 +1,217 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+from rest_framework.exceptions import PermissionDenied
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.models import JWTSecret
+from vng_api_common.scopes import Scope
+from vng_api_common.tests import generate_jwt_auth
+
+from openzaak.utils.tests import ClearCachesMixin
+
+from ..cache import get_version, verified_tokens
+from ..middleware import JWTAuth
+from .factories import ApplicatieFactory, AutorisatieFactory
+
+SCOPE_READ = Scope("test.lezen", private=True)
+SCOPE_WRITE = Scope("test.bijwerken", private=True)
+
+ZAAKTYPE = "http://testserver/catalogi/api/v1/zaaktypen/1"
+OTHER_ZAAKTYPE = "http://testserver/catalogi/api/v1/zaaktypen/2"
+
+
+@override_settings(AUTORISATIES_CACHE_TIMEOUT=0, JWT_CACHE_SIZE=0)
+class JWTAuthIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        JWTSecret.objects.create(identifier="index-test", secret="letmein")
+        applicatie = ApplicatieFactory.create(client_ids=["index-test"])
+        AutorisatieFactory.create(
+            applicatie=applicatie,
+            component=ComponentTypes.zrc,
+            zaaktype=ZAAKTYPE,
+            scopes=["test.lezen"],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern,
+        )
+        AutorisatieFactory.create(
+            applicatie=applicatie,
+            component=ComponentTypes.zrc,
+            zaaktype=OTHER_ZAAKTYPE,
+            scopes=["test.lezen", "test.bijwerken"],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+    def _get_jwt_auth(self) -> JWTAuth:
+        token = generate_jwt_auth("index-test", "letmein")
+        return JWTAuth(token.split(" ")[1])
+
+    def test_authorizations_compiled_once(self):
+        jwt_auth = self._get_jwt_auth()
+
+        # secret lookup, applicaties and autorisaties
+        with self.assertNumQueries(3):
+            jwt_auth.has_auth(SCOPE_READ, "zaken")
+            jwt_auth.has_auth(SCOPE_WRITE, "zaken", zaaktype=ZAAKTYPE)
+            jwt_auth.get_autorisaties("zaken")
+
+        with self.assertNumQueries(0):
+            jwt_auth.has_auth(SCOPE_READ, "zaken")
+
+    def test_has_auth_type_and_vertrouwelijkheidaanduiding(self):
+        jwt_auth = self._get_jwt_auth()
+
+        self.assertTrue(
+            jwt_auth.has_auth(
+                SCOPE_READ,
+                "zaken",
+                zaaktype=ZAAKTYPE,
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern,
+            )
+        )
+        self.assertFalse(
+            jwt_auth.has_auth(
+                SCOPE_READ,
+                "zaken",
+                zaaktype=ZAAKTYPE,
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+            )
+        )
+        self.assertFalse(jwt_auth.has_auth(SCOPE_WRITE, "zaken", zaaktype=ZAAKTYPE))
+        self.assertTrue(
+            jwt_auth.has_auth(SCOPE_WRITE, "zaken", zaaktype=OTHER_ZAAKTYPE)
+        )
+        self.assertFalse(jwt_auth.has_auth(SCOPE_READ, "documenten"))
+
+    def test_get_autorisaties_order(self):
+        jwt_auth = self._get_jwt_auth()
+
+        autorisaties = jwt_auth.get_autorisaties("zaken")
+
+        orders = {
+            autorisatie.zaaktype: autorisatie.max_va_order
+            for autorisatie in autorisaties
+        }
+        self.assertEqual(
+            orders,
+            {
+                ZAAKTYPE: VertrouwelijkheidsAanduiding.get_choice("intern").order,
+                OTHER_ZAAKTYPE: VertrouwelijkheidsAanduiding.get_choice("geheim").order,
+            },
+        )
+
+
+@override_settings(JWT_CACHE_SIZE=0)
+class AuthorizationsCacheTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        JWTSecret.objects.create(identifier="cache-test", secret="letmein")
+        cls.applicatie = ApplicatieFactory.create(client_ids=["cache-test"])
+        cls.autorisatie = AutorisatieFactory.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.zrc,
+            zaaktype=ZAAKTYPE,
+            scopes=["test.lezen"],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern,
+        )
+
+    def _get_jwt_auth(self) -> JWTAuth:
+        token = generate_jwt_auth("cache-test", "letmein")
+        return JWTAuth(token.split(" ")[1])
+
+    def test_authorizations_shared_between_requests(self):
+        self.assertTrue(self._get_jwt_auth().has_auth(SCOPE_READ, "zaken"))
+
+        # only the secret lookup remains
+        with self.assertNumQueries(1):
+            self.assertTrue(self._get_jwt_auth().has_auth(SCOPE_READ, "zaken"))
+
+    def test_cache_invalidated_on_autorisatie_change(self):
+        self.assertFalse(self._get_jwt_auth().has_auth(SCOPE_WRITE, "zaken"))
+
+        self.autorisatie.scopes = ["test.lezen", "test.bijwerken"]
+        self.autorisatie.save()
+
+        self.assertTrue(self._get_jwt_auth().has_auth(SCOPE_WRITE, "zaken"))
+
+    def test_cache_invalidated_on_applicatie_change(self):
+        self.assertFalse(self._get_jwt_auth().has_auth(SCOPE_WRITE, "zaken"))
+
+        self.applicatie.heeft_alle_autorisaties = True
+        self.applicatie.save()
+
+        self.assertTrue(self._get_jwt_auth().has_auth(SCOPE_WRITE, "zaken"))
+
+
+class VerifiedTokensTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.jwt_secret = JWTSecret.objects.create(
+            identifier="token-test", secret="letmein"
+        )
+        cls.applicatie = ApplicatieFactory.create(client_ids=["token-test"])
+        AutorisatieFactory.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.zrc,
+            zaaktype=ZAAKTYPE,
+            scopes=["test.lezen"],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern,
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        verified_tokens.clear()
+        self.encoded = generate_jwt_auth("token-test", "letmein").split(" ")[1]
+
+    def test_token_verified_once(self):
+        self.assertTrue(JWTAuth(self.encoded).has_auth(SCOPE_READ, "zaken"))
+
+        with self.assertNumQueries(0):
+            jwt_auth = JWTAuth(self.encoded)
+            self.assertEqual(jwt_auth.client_id, "token-test")
+            self.assertTrue(jwt_auth.has_auth(SCOPE_READ, "zaken"))
+
+    def test_invalidated_on_secret_change(self):
+        self.assertTrue(JWTAuth(self.encoded).has_auth(SCOPE_READ, "zaken"))
+
+        self.jwt_secret.secret = "changed"
+        self.jwt_secret.save()
+
+        with self.assertRaises(PermissionDenied):
+            JWTAuth(self.encoded).payload
+
+    def test_invalidated_on_applicatie_change(self):
+        self.assertFalse(JWTAuth(self.encoded).has_auth(SCOPE_WRITE, "zaken"))
+
+        self.applicatie.heeft_alle_autorisaties = True
+        self.applicatie.save()
+
+        self.assertTrue(JWTAuth(self.encoded).has_auth(SCOPE_WRITE, "zaken"))
+
+    def test_entry_expires_with_token(self):
+        JWTAuth(self.encoded).payload
+        self.assertIsNotNone(verified_tokens.get(self.encoded, get_version()))
+
+        with freeze_time(timezone.now() + timedelta(seconds=settings.JWT_EXPIRY)):
+            self.assertIsNone(verified_tokens.get(self.encoded, get_version()))
+
+    @override_settings(JWT_CACHE_SIZE=1)
+    def test_cache_bounded(self):
+        JWTAuth(self.encoded).payload
+        other = generate_jwt_auth("token-test", "letmein", user_id="other")
+        other = other.split(" ")[1]
+        JWTAuth(other).payload
+
+        version = get_version()
+        self.assertIsNone(verified_tokens.get(self.encoded, version))
+        self.assertIsNotNone(verified_tokens.get(other, version))
@@ -209,8 +209,10 @@ class BesluitInformatieObjectViewSet(
     """
 
     queryset = (
-        BesluitInformatieObject.objects.select_related("besluit", "_informatieobject")
-        .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
+        BesluitInformatieObject.objects.select_related(
+            "besluit", "_informatieobject__latest_version"
+        )
+        .prefetch_loose_fk("informatieobject")
         .all()
     )
     serializer_class = BesluitInformatieObjectSerializer
@@ -6,5 +6,6 @@ from openzaak.components.autorisaties.models import AutorisatieSpec
 class SyncAutorisatieManager(models.Manager):
     @transaction.atomic
     def bulk_create(self, *args, **kwargs):
-        transaction.on_commit(AutorisatieSpec.sync)
-        return super().bulk_create(*args, **kwargs)
+        objs = super().bulk_create(*args, **kwargs)
+        transaction.on_commit(lambda: AutorisatieSpec.sync_types(objs))
+        return objs
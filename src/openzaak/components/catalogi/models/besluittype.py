@@ -141,7 +141,7 @@ class BesluitType(APIMixin, GeldigheidMixin, ConceptMixin, models.Model):
     @transaction.atomic
     def save(self, *args, **kwargs):
         if not self.pk:
-            transaction.on_commit(AutorisatieSpec.sync)
+            transaction.on_commit(lambda: AutorisatieSpec.sync_types([self]))
         super().save(*args, **kwargs)
 
     def get_absolute_api_url(self, request=None, **kwargs) -> str:
@@ -285,7 +285,7 @@ class ZaakType(APIMixin, ConceptMixin, GeldigheidMixin, models.Model):
     def save(self, *args, **kwargs):
         # sync after creating new objects
         if not self.pk:
-            transaction.on_commit(AutorisatieSpec.sync)
+            transaction.on_commit(lambda: AutorisatieSpec.sync_types([self]))
 
         if not self.identificatie:
             self.identificatie = generate_unique_identification(self, "versiedatum")
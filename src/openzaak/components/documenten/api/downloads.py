@@ -0,0 +1,177 @@
+"""
+Send the content of documents, with support for conditional and range requests.
+
+The ``nginx`` sendfile backend leaves serving the requested range to nginx,
+the other backends get the range from Open Zaak.
+"""
+import os
+import re
+import unicodedata
+from typing import Iterator, Optional, Tuple
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+from django_sendfile import sendfile
+
+from ..models import EnkelvoudigInformatieObject
+from ..storages import BLOB_DIR
+
+NGINX_BACKEND = "django_sendfile.backends.nginx"
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def get_etag(eio: EnkelvoudigInformatieObject) -> str:
+    """
+    Return a strong ETag of the content of the document version.
+
+    Content in the content-addressed storage is identified by its digest,
+    other content by the version, since the content of a version never changes.
+    """
+    name = eio.inhoud.name
+    if name.startswith(f"{BLOB_DIR}/"):
+        return f'"{os.path.basename(name)}"'
+    return f'"{eio.uuid}-{eio.versie}"'
+
+
+def get_filename(eio: EnkelvoudigInformatieObject) -> str:
+    """
+    Return the name the document version is downloaded as.
+
+    Content in the content-addressed storage is stored by its digest, so its
+    name is only used for content stored before.
+    """
+    if eio.bestandsnaam:
+        return eio.bestandsnaam
+
+    name = eio.inhoud.name
+    if name.startswith(f"{BLOB_DIR}/"):
+        return f"{eio.uuid}.bin"
+    return os.path.basename(name)
+
+
+def get_content_disposition(filename: str) -> str:
+    # like django-sendfile, with an ASCII fallback for non-ASCII names
+    ascii_filename = unicodedata.normalize("NFKD", filename)
+    ascii_filename = ascii_filename.encode("ascii", "ignore").decode()
+    parts = ["attachment", f'filename="{ascii_filename}"']
+    if ascii_filename != filename:
+        parts.append(f"filename*=UTF-8''{quote(filename)}")
+    return "; ".join(parts)
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Return the first and last position of the requested range.
+
+    Invalid headers and requests for multiple ranges are ignored, in which
+    case the whole file is sent.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    if not first:
+        # the last N bytes
+        if size == 0 or int(last) == 0:
+            raise RangeNotSatisfiable
+        return max(size - int(last), 0), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def if_range_passes(request, etag: str, last_modified: int) -> bool:
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+
+    # only strong validators match
+    if if_range.startswith('"'):
+        return if_range == etag
+    if if_range.startswith("W/"):
+        return False
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def read_range(path: str, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def send_document(request, eio: EnkelvoudigInformatieObject) -> HttpResponse:
+    path = eio.inhoud.path
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise Http404(f'"{path}" does not exist')
+
+    etag = get_etag(eio)
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _send_file(
+            request, path, get_filename(eio), stat.st_size, etag, last_modified
+        )
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def _send_file(
+    request, path: str, filename: str, size: int, etag: str, last_modified: int
+) -> HttpResponse:
+    header = request.META.get("HTTP_RANGE")
+    byte_range = None
+    if header and if_range_passes(request, etag, last_modified):
+        try:
+            byte_range = parse_range(header, size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None or settings.SENDFILE_BACKEND == NGINX_BACKEND:
+        return sendfile(
+            request,
+            path,
+            attachment=True,
+            attachment_filename=filename,
+            mimetype="application/octet-stream",
+        )
+
+    start, end = byte_range
+    response = StreamingHttpResponse(
+        read_range(path, start, end),
+        status=206,
+        content_type="application/octet-stream",
+    )
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response["Content-Length"] = end - start + 1
+    response["Content-Disposition"] = get_content_disposition(filename)
+    return response
@@ -0,0 +1,30 @@
+import uuid
+
+from rest_framework.parsers import FileUploadParser
+
+from ..checksums import ChecksumReader, get_configured_algorithm
+from ..storages import DIGEST_ALGORITHM
+
+
+class BinaryFileParser(FileUploadParser):
+    """
+    Parse the raw request body as a file.
+
+    The body is passed in chunks to the upload handlers, which write files
+    larger than ``FILE_UPLOAD_MAX_MEMORY_SIZE`` to a temporary file on disk.
+    The checksums are computed from the same chunks.
+    """
+
+    media_type = "application/octet-stream"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        # the digest of the blob storage and the configured checksum
+        algoritmes = {DIGEST_ALGORITHM, get_configured_algorithm()} - {None}
+
+        reader = ChecksumReader(stream, algoritmes)
+        data_and_files = super().parse(reader, media_type, parser_context)
+        data_and_files.files["file"].checksums = reader.get_checksums()
+        return data_and_files
+
+    def get_filename(self, stream, media_type, parser_context):
+        return f"{uuid.uuid4()}.bin"
@@ -4,15 +4,20 @@ from django.conf import settings
 
 from drf_yasg import openapi
 from humanize import naturalsize
-from rest_framework import status
-from vng_api_common.inspectors.view import HTTP_STATUS_CODE_TITLES
+from rest_framework import exceptions, status
+from vng_api_common.inspectors.view import (
+    AUDIT_REQUEST_HEADERS,
+    DEFAULT_ACTION_ERRORS,
+    HTTP_STATUS_CODE_TITLES,
+)
 from vng_api_common.notifications.utils import notification_documentation
-from vng_api_common.serializers import FoutSerializer
+from vng_api_common.serializers import FoutSerializer, ValidatieFoutSerializer
 
 from openzaak.utils.apidoc import DOC_AUTH_JWT
 from openzaak.utils.schema import AutoSchema
 
 from .kanalen import KANAAL_DOCUMENTEN
+from .parsers import BinaryFileParser
 
 min_upload_size = naturalsize(settings.MIN_UPLOAD_SIZE, binary=True)
 
@@ -40,6 +45,10 @@ overhead van base64, die ongeveer 33% bedraagt in worst-case scenario's. Dit
 betekent dat bij een limiet van 4GB het bestand maximaal ongeveer 3GB groot
 mag zijn.
 
+De binaire data van een bestaand INFORMATIEOBJECT kan ook zonder base64-encoding
+geupload worden, met een `PUT` op het `upload` endpoint. Het bestand wordt dan
+in delen ontvangen en weggeschreven.
+
 **Afhankelijkheden**
 
 Deze API is afhankelijk van:
@@ -80,17 +89,64 @@ class EIOAutoSchema(AutoSchema):
     """
     Add the HTTP 413 error response to the schema.
 
-    This is only relevant for endpoints that support file uploads.
+    This is only relevant for endpoints that support file uploads. The body of
+    the upload endpoint is the binary content itself.
     """
 
+    def get_request_body_parameters(self, consumes):
+        if getattr(self.view, "action", None) == "upload":
+            schema = openapi.Schema(
+                type=openapi.TYPE_STRING, format=openapi.FORMAT_BINARY
+            )
+            return [self.make_body_parameter(schema)]
+        return super().get_request_body_parameters(consumes)
+
+    def add_manual_parameters(self, parameters):
+        result = super().add_manual_parameters(parameters)
+        # the upload endpoint creates an audit trail like a partial update
+        if getattr(self.view, "action", None) == "upload":
+            result += AUDIT_REQUEST_HEADERS
+        return result
+
+    def get_consumes(self):
+        # drf-yasg leaves out the media types of file upload parsers
+        if getattr(self.view, "action", None) == "upload":
+            return [BinaryFileParser.media_type]
+        return super().get_consumes()
+
+    def _get_upload_error_responses(self, fout_schema) -> OrderedDict:
+        # the upload endpoint fails like a partial update
+        responses = {
+            exception_klass.status_code: fout_schema
+            for exception_klass in DEFAULT_ACTION_ERRORS["partial_update"]
+        }
+        responses[exceptions.ValidationError.status_code] = self.serializer_to_schema(
+            ValidatieFoutSerializer()
+        )
+        return OrderedDict(
+            [
+                (
+                    status_code,
+                    openapi.Response(
+                        description=HTTP_STATUS_CODE_TITLES.get(status_code, ""),
+                        schema=schema,
+                    ),
+                )
+                for status_code, schema in sorted(responses.items())
+            ]
+        )
+
     def _get_error_responses(self) -> OrderedDict:
         responses = super()._get_error_responses()
 
         if self.method not in ["POST", "PUT", "PATCH"]:
             return responses
 
-        status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
         fout_schema = self.serializer_to_schema(FoutSerializer())
+        if self.view.action == "upload":
+            responses = self._get_upload_error_responses(fout_schema)
+
+        status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
         responses[status_code] = openapi.Response(
             description=HTTP_STATUS_CODE_TITLES.get(status_code, ""), schema=fout_schema
         )
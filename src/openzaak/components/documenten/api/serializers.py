@@ -4,9 +4,12 @@ Serializers of the Document Registratie Component REST API
 import binascii
 import uuid
 from base64 import b64decode
+from datetime import date
+from typing import Optional
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.files import File
 from django.db import transaction
 from django.utils.http import urlencode
 from django.utils.translation import ugettext_lazy as _
@@ -32,6 +35,7 @@ from openzaak.utils.validators import (
     PublishValidator,
 )
 
+from ..checksums import get_checksum, get_configured_algorithm, is_supported
 from ..constants import ChecksumAlgoritmes, OndertekeningSoorten, Statussen
 from ..models import (
     EnkelvoudigInformatieObject,
@@ -58,6 +62,10 @@ class AnyBase64File(Base64FileField):
         return "bin"
 
     def to_internal_value(self, base64_data):
+        # files streamed by the upload endpoint are already on disk
+        if isinstance(base64_data, File):
+            return serializers.FileField.to_internal_value(self, base64_data)
+
         try:
             return super().to_internal_value(base64_data)
         except Exception:
@@ -294,6 +302,52 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             )
         return indicatie
 
+    def validate(self, attrs):
+        valid_attrs = super().validate(attrs)
+
+        inhoud = valid_attrs.get("inhoud")
+        if inhoud:
+            integriteit = self.get_integriteit(inhoud, valid_attrs.get("integriteit"))
+            if integriteit is not None:
+                valid_attrs["integriteit"] = integriteit
+        return valid_attrs
+
+    def get_integriteit(self, inhoud, integriteit: Optional[dict]) -> Optional[dict]:
+        """
+        Validate the provided checksum of the content, or compute the configured one.
+
+        Checksums of algorithms that are not supported are stored as provided.
+        """
+        algoritme = (integriteit or {}).get("algoritme")
+        if not algoritme:
+            algoritme = get_configured_algorithm()
+            if not algoritme:
+                return integriteit
+            return {
+                "algoritme": algoritme,
+                "waarde": get_checksum(inhoud, algoritme),
+                "datum": date.today(),
+            }
+
+        if not is_supported(algoritme):
+            return integriteit
+
+        waarde = get_checksum(inhoud, algoritme)
+        if integriteit.get("waarde") and integriteit["waarde"].lower() != waarde:
+            raise serializers.ValidationError(
+                {
+                    "integriteit": _(
+                        "De checksum komt niet overeen met de inhoud van het document."
+                    )
+                },
+                code="checksum-mismatch",
+            )
+        return {
+            "algoritme": algoritme,
+            "waarde": waarde,
+            "datum": integriteit.get("datum") or date.today(),
+        }
+
     @transaction.atomic
     def create(self, validated_data):
         """
@@ -317,6 +371,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         eio.save()
         return eio
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         """
         Instead of updating an existing EnkelvoudigInformatieObject,
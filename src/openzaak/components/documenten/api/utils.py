@@ -2,8 +2,8 @@ from django.conf import settings
 
 from rest_framework.reverse import reverse
 from zgw_consumers.client import UnknownService
-from zgw_consumers.models import Service
 
+from openzaak.config.cache import services_index
 from openzaak.utils import build_absolute_url
 
 
@@ -17,7 +17,7 @@ def get_absolute_url(url_name: str, uuid: str) -> str:
 
 
 def create_remote_oio(io_url: str, object_url: str, object_type: str = "zaak") -> dict:
-    client = Service.get_client(io_url)
+    client = services_index.get_client(io_url)
     if client is None:
         raise UnknownService(f"{io_url} API should be added to Service model")
 
@@ -28,7 +28,7 @@ def create_remote_oio(io_url: str, object_url: str, object_type: str = "zaak") -
 
 
 def delete_remote_oio(oio_url: str) -> None:
-    client = Service.get_client(oio_url)
+    client = services_index.get_client(oio_url)
     if client is None:
         raise UnknownService(f"{oio_url} API should be added to Service model")
 
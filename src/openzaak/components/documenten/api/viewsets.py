@@ -1,8 +1,8 @@
 from django.db import transaction
+from django.db.models import F
 from django.utils.translation import ugettext_lazy as _
 
 from django_loose_fk.virtual_models import ProxyMixin
-from django_sendfile import sendfile
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, status, viewsets
@@ -15,6 +15,7 @@ from vng_api_common.audittrails.viewsets import (
     AuditTrailViewSet,
     AuditTrailViewsetMixin,
 )
+from vng_api_common.constants import CommonResourceAction
 from vng_api_common.notifications.viewsets import NotificationViewSetMixin
 from vng_api_common.serializers import FoutSerializer
 from vng_api_common.viewsets import CheckQueryParamsMixin
@@ -22,6 +23,7 @@ from vng_api_common.viewsets import CheckQueryParamsMixin
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.permissions import get_permission_fields
 
 from ..models import (
     EnkelvoudigInformatieObject,
@@ -29,6 +31,7 @@ from ..models import (
     ObjectInformatieObject,
 )
 from .audits import AUDIT_DRC
+from .downloads import send_document
 from .filters import (
     EnkelvoudigInformatieObjectDetailFilter,
     EnkelvoudigInformatieObjectListFilter,
@@ -36,6 +39,7 @@ from .filters import (
     ObjectInformatieObjectFilter,
 )
 from .kanalen import KANAAL_DOCUMENTEN
+from .parsers import BinaryFileParser
 from .permissions import InformationObjectAuthRequired
 from .renderers import BinaryFileRenderer
 from .scopes import (
@@ -69,6 +73,13 @@ REGISTRATIE_QUERY_PARAM = openapi.Parameter(
     "kortst hiervoor zit wordt opgehaald.",
     type=openapi.TYPE_STRING,
 )
+LOCK_QUERY_PARAM = openapi.Parameter(
+    "lock",
+    openapi.IN_QUERY,
+    description="De `lock` waarde van het vergrendelde INFORMATIEOBJECT.",
+    type=openapi.TYPE_STRING,
+    required=True,
+)
 
 
 class EnkelvoudigInformatieObjectViewSet(
@@ -154,6 +165,22 @@ class EnkelvoudigInformatieObjectViewSet(
 
     Download de binaire data van het (ENKELVOUDIG) INFORMATIEOBJECT.
 
+    Een deel van de binaire data kan opgevraagd worden met de `Range` header,
+    om onderbroken downloads te hervatten. Met de `ETag` van een eerdere download
+    in de `If-None-Match` of `If-Range` header wordt de binaire data alleen
+    verstuurd als deze gewijzigd is.
+
+    upload:
+    Upload de binaire data van het (ENKELVOUDIG) INFORMATIEOBJECT.
+
+    De binaire data wordt zonder base64-encoding als request body verstuurd,
+    waardoor ook grote bestanden geupload kunnen worden. Dit creëert altijd een
+    nieuwe versie van het (ENKELVOUDIG) INFORMATIEOBJECT.
+
+    **Er wordt gevalideerd op**
+    - correcte `lock` waarde
+    - status NIET `definitief`
+
     lock:
     Vergrendel een (ENKELVOUDIG) INFORMATIEOBJECT.
 
@@ -169,13 +196,9 @@ class EnkelvoudigInformatieObjectViewSet(
     ontgrendeld wordt.
     """
 
-    queryset = (
-        EnkelvoudigInformatieObject.objects.select_related(
-            "canonical", "_informatieobjecttype"
-        )
-        .order_by("canonical", "-versie")
-        .distinct("canonical")
-    )
+    queryset = EnkelvoudigInformatieObject.objects.select_related(
+        "canonical", "_informatieobjecttype"
+    ).order_by("canonical", "-versie")
     lookup_field = "uuid"
     serializer_class = EnkelvoudigInformatieObjectSerializer
     pagination_class = PageNumberPagination
@@ -188,6 +211,7 @@ class EnkelvoudigInformatieObjectViewSet(
         "update": SCOPE_DOCUMENTEN_BIJWERKEN,
         "partial_update": SCOPE_DOCUMENTEN_BIJWERKEN,
         "download": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "upload": SCOPE_DOCUMENTEN_BIJWERKEN,
         "lock": SCOPE_DOCUMENTEN_LOCK,
         "unlock": SCOPE_DOCUMENTEN_LOCK | SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK,
     }
@@ -202,6 +226,13 @@ class EnkelvoudigInformatieObjectViewSet(
 
         return EIOAutoSchema
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # the versie and registratieOp filters select an earlier version
+        if self.detail:
+            return queryset.distinct("canonical")
+        return queryset.filter(canonical__latest_version=F("pk"))
+
     def get_renderers(self):
         if self.action == "download":
             return [BinaryFileRenderer]
@@ -237,7 +268,7 @@ class EnkelvoudigInformatieObjectViewSet(
         """
         To validate that a lock id is sent only with PUT and PATCH operations
         """
-        if getattr(self, "action", None) in ["update", "partial_update"]:
+        if getattr(self, "action", None) in ["update", "partial_update", "upload"]:
             return EnkelvoudigInformatieObjectWithLockSerializer
         return super().get_serializer_class()
 
@@ -286,12 +317,39 @@ class EnkelvoudigInformatieObjectViewSet(
     @action(methods=["get"], detail=True, name="enkelvoudiginformatieobject_download")
     def download(self, request, *args, **kwargs):
         eio = self.get_object()
-        return sendfile(
-            request,
-            eio.inhoud.path,
-            attachment=True,
-            mimetype="application/octet-stream",
-        )
+        return send_document(request, eio)
+
+    @swagger_auto_schema(manual_parameters=[LOCK_QUERY_PARAM])
+    @action(
+        methods=["put"],
+        detail=True,
+        parser_classes=[BinaryFileParser],
+        name="enkelvoudiginformatieobject_upload",
+    )
+    def upload(self, request, *args, **kwargs):
+        eio = self.get_object()
+
+        # stream the body to disk before starting the transaction
+        data = {
+            "inhoud": request.data.get("file"),
+            "lock": request.query_params.get("lock", ""),
+        }
+
+        with transaction.atomic():
+            version_before_edit = self.get_serializer(eio).data
+            serializer = self.get_serializer(eio, data=data, partial=True)
+            serializer.is_valid(raise_exception=True)
+            self.perform_update(serializer)
+
+            self.create_audittrail(
+                status.HTTP_200_OK,
+                CommonResourceAction.partial_update,
+                version_before_edit=version_before_edit,
+                version_after_edit=serializer.data,
+                unique_representation=eio.unique_representation(),
+            )
+            self.notify(status.HTTP_200_OK, serializer.data)
+        return Response(serializer.data)
 
     @swagger_auto_schema(
         request_body=LockEnkelvoudigInformatieObjectSerializer,
@@ -369,16 +427,17 @@ class EnkelvoudigInformatieObjectViewSet(
     @action(detail=True, methods=["post"])
     def unlock(self, request, *args, **kwargs):
         eio = self.get_object()
-        eio_data = self.get_serializer(eio).data
+        fields = get_permission_fields(
+            eio, InformationObjectAuthRequired.permission_fields, self.request
+        )
         canonical = eio.canonical
 
         # check if it's a force unlock by administrator
         force_unlock = False
         if self.request.jwt_auth.has_auth(
             scopes=SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK,
-            informatieobjecttype=eio_data["informatieobjecttype"],
-            vertrouwelijkheidaanduiding=eio_data["vertrouwelijkheidaanduiding"],
             init_component=self.queryset.model._meta.app_label,
+            **fields,
         ):
             force_unlock = True
 
@@ -438,11 +497,9 @@ class GebruiksrechtenViewSet(
       `null` gezet.
     """
 
-    queryset = (
-        Gebruiksrechten.objects.select_related("informatieobject")
-        .prefetch_related("informatieobject__enkelvoudiginformatieobject_set")
-        .all()
-    )
+    queryset = Gebruiksrechten.objects.select_related(
+        "informatieobject__latest_version"
+    ).all()
     serializer_class = GebruiksrechtenSerializer
     filterset_class = GebruiksrechtenFilter
     lookup_field = "uuid"
@@ -527,9 +584,9 @@ class ObjectInformatieObjectViewSet(
 
     queryset = (
         ObjectInformatieObject.objects.select_related(
-            "_zaak", "_besluit", "informatieobject"
+            "_zaak", "_besluit", "informatieobject__latest_version"
         )
-        .prefetch_related("informatieobject__enkelvoudiginformatieobject_set")
+        .prefetch_loose_fk("zaak", "besluit")
         .all()
     )
     serializer_class = ObjectInformatieObjectSerializer
@@ -0,0 +1,93 @@
+"""
+Compute the checksums of document content while it is received.
+
+Only the algorithms of :class:`ChecksumAlgoritmes` available in the standard
+library are supported; checksums of other algorithms are stored as provided.
+"""
+import hashlib
+import zlib
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from .constants import ChecksumAlgoritmes
+
+HASHLIB_ALGORITHMS = {
+    ChecksumAlgoritmes.md5: "md5",
+    ChecksumAlgoritmes.sha_1: "sha1",
+    ChecksumAlgoritmes.sha_256: "sha256",
+    ChecksumAlgoritmes.sha_512: "sha512",
+    ChecksumAlgoritmes.sha_3: "sha3_256",
+}
+
+
+class CRC32:
+    def __init__(self):
+        self.value = 0
+
+    def update(self, data: bytes) -> None:
+        self.value = zlib.crc32(data, self.value)
+
+    def hexdigest(self) -> str:
+        return f"{self.value:08x}"
+
+
+def is_supported(algoritme: str) -> bool:
+    return algoritme in HASHLIB_ALGORITHMS or algoritme == ChecksumAlgoritmes.crc_32
+
+
+def get_hasher(algoritme: str):
+    if algoritme == ChecksumAlgoritmes.crc_32:
+        return CRC32()
+    return hashlib.new(HASHLIB_ALGORITHMS[algoritme])
+
+
+def get_configured_algorithm() -> Optional[str]:
+    algoritme = settings.DOCUMENTEN_CHECKSUM_ALGORITHM
+    if algoritme and not is_supported(algoritme):
+        raise ImproperlyConfigured(
+            f"DOCUMENTEN_CHECKSUM_ALGORITHM {algoritme!r} is not supported"
+        )
+    return algoritme or None
+
+
+class ChecksumReader:
+    """
+    Wrap a stream, updating the checksums with everything read from it.
+    """
+
+    def __init__(self, stream, algoritmes: Iterable[str]):
+        self.stream = stream
+        self.hashers = {algoritme: get_hasher(algoritme) for algoritme in algoritmes}
+
+    def read(self, *args) -> bytes:
+        data = self.stream.read(*args)
+        for hasher in self.hashers.values():
+            hasher.update(data)
+        return data
+
+    def get_checksums(self) -> Dict[str, str]:
+        return {
+            algoritme: hasher.hexdigest() for algoritme, hasher in self.hashers.items()
+        }
+
+
+def get_checksum(file, algoritme: str) -> str:
+    """
+    Return the checksum of the uploaded file.
+
+    Checksums computed while the file was received are used. Files kept in
+    memory (such as base64 decoded content) are hashed directly.
+    """
+    checksums = getattr(file, "checksums", {})
+    if algoritme in checksums:
+        return checksums[algoritme]
+
+    hasher = get_hasher(algoritme)
+    for chunk in file.chunks():
+        hasher.update(chunk)
+    file.seek(0)
+
+    file.checksums = {**checksums, algoritme: hasher.hexdigest()}
+    return file.checksums[algoritme]
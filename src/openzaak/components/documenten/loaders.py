@@ -2,11 +2,11 @@ from urllib.parse import urlparse
 
 from django.db.models.base import ModelBase
 
-from django_loose_fk.virtual_models import ProxyMixin, get_model_instance
+from django_loose_fk.virtual_models import ProxyMixin
 from vng_api_common.utils import get_resource_for_path
 
 from openzaak.components.catalogi.models import InformatieObjectType
-from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.loaders import AuthorizedRequestsLoader, get_model_instance, identity_map
 
 
 class EIOLoader(AuthorizedRequestsLoader):
@@ -14,19 +14,27 @@ class EIOLoader(AuthorizedRequestsLoader):
     Load the EIO directly instead of going through EIOCanonical.
     """
 
-    def load(self, url: str, model: ModelBase):
+    def get_remote_model(self, model: ModelBase) -> ModelBase:
         from openzaak.components.documenten.models import (
             EnkelvoudigInformatieObject,
             EnkelvoudigInformatieObjectCanonical,
         )
 
         if model is EnkelvoudigInformatieObjectCanonical:
-            model = EnkelvoudigInformatieObject
+            return EnkelvoudigInformatieObject
+        return model
+
+    def load(self, url: str, model: ModelBase):
+        model = self.get_remote_model(model)
 
         if model is InformatieObjectType:
             return self.resolve_io_type(url)
 
-        data = self.fetch_object(url)
+        return identity_map.get_or_load(
+            url, model, lambda: self.load_remote(url, model)
+        )
+
+    def build_instance(self, model: ModelBase, data: dict):
         model_instance = get_model_instance(model, data, loader=self)
         self.add_missing_props(model, model_instance, data)
         return model_instance
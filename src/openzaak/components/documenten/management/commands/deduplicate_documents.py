@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from humanize import naturalsize
+
+from ...checksums import get_checksum
+from ...models import EnkelvoudigInformatieObject
+from ...storages import BLOB_DIR, DIGEST_ALGORITHM, blob_storage
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the content of documents uploaded before the content-addressed "
+        "storage to it, so that identical files are stored once"
+    )
+
+    def handle(self, **options):
+        names = (
+            EnkelvoudigInformatieObject.objects.exclude(inhoud="")
+            .exclude(inhoud__startswith=f"{BLOB_DIR}/")
+            .order_by()
+            .values_list("inhoud", flat=True)
+            .distinct()
+        )
+
+        moved, freed = 0, 0
+        for name in names.iterator():
+            if not blob_storage.exists(name):
+                self.stderr.write(f"File {name} does not exist, skipping")
+                continue
+
+            size = blob_storage.size(name)
+            with transaction.atomic():
+                with blob_storage.open(name) as file:
+                    # hash the file once, for both the check and the storage
+                    get_checksum(file, DIGEST_ALGORITHM)
+                    shared = blob_storage.exists(blob_storage.get_blob_name(file))
+                    blob_name = blob_storage.save(name, file)
+
+                EnkelvoudigInformatieObject.objects.filter(inhoud=name).update(
+                    inhoud=blob_name
+                )
+
+            blob_storage.delete(name)
+            moved += 1
+            if shared:
+                freed += size
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Moved {moved} files, freed {naturalsize(freed)} of duplicate files"
+            )
+        )
@@ -0,0 +1,51 @@
+from django.db import migrations, models
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+import openzaak.utils.fields
+
+
+def set_va_order(apps, _):
+    EnkelvoudigInformatieObject = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObject"
+    )
+    EnkelvoudigInformatieObject.objects.update(
+        _va_order=VertrouwelijkheidsAanduiding.get_order_expression(
+            "vertrouwelijkheidaanduiding"
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0003_auto_20200124_1021"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="_va_order",
+            field=openzaak.utils.fields.VertrouwelijkheidsAanduidingOrderField(
+                editable=False,
+                help_text="De volgorde van de vertrouwelijkheidaanduiding, gebruikt om te filteren op de maximale vertrouwelijkheidaanduiding.",
+                null=True,
+                verbose_name="vertrouwelijkheidaanduiding volgorde",
+            ),
+        ),
+        migrations.RunPython(set_va_order, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=["_informatieobjecttype", "_va_order"],
+                name="documenten_iotype_va_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=["_informatieobjecttype_url", "_va_order"],
+                name="documenten_iotype_url_va_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+import privates.fields
+
+import openzaak.components.documenten.storages
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0004_enkelvoudiginformatieobject_va_order"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="enkelvoudiginformatieobject",
+            name="inhoud",
+            field=privates.fields.PrivateMediaFileField(
+                storage=openzaak.components.documenten.storages.BlobStorage(),
+                upload_to="",
+            ),
+        ),
+    ]
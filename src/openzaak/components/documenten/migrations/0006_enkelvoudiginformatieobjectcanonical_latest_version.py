@@ -0,0 +1,42 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def set_latest_version(apps, _):
+    EnkelvoudigInformatieObjectCanonical = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObjectCanonical"
+    )
+    EnkelvoudigInformatieObject = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObject"
+    )
+    latest = (
+        EnkelvoudigInformatieObject.objects.filter(canonical=OuterRef("pk"))
+        .order_by("-versie")
+        .values("pk")[:1]
+    )
+    EnkelvoudigInformatieObjectCanonical.objects.update(latest_version=Subquery(latest))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0005_blob_storage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="latest_version",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="De laatste versie van het INFORMATIEOBJECT",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="documenten.EnkelvoudigInformatieObject",
+            ),
+        ),
+        migrations.RunPython(set_latest_version, migrations.RunPython.noop),
+    ]
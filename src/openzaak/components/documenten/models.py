@@ -14,6 +14,7 @@ from vng_api_common.models import APIMixin
 from vng_api_common.utils import generate_unique_identification
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
+from openzaak.utils.fields import VertrouwelijkheidsAanduidingOrderField
 from openzaak.utils.mixins import AuditTrailMixin
 
 from .constants import ChecksumAlgoritmes, OndertekeningSoorten, Statussen
@@ -22,6 +23,7 @@ from .query import (
     InformatieobjectRelatedQuerySet,
     ObjectInformatieObjectQuerySet,
 )
+from .storages import blob_storage
 from .validators import validate_status
 
 logger = logging.getLogger(__name__)
@@ -67,6 +69,13 @@ class InformatieObject(models.Model):
         help_text="Aanduiding van de mate waarin het INFORMATIEOBJECT voor de "
         "openbaarheid bestemd is.",
     )
+    _va_order = VertrouwelijkheidsAanduidingOrderField(
+        _("vertrouwelijkheidaanduiding volgorde"),
+        help_text=_(
+            "De volgorde van de vertrouwelijkheidaanduiding, gebruikt om te "
+            "filteren op de maximale vertrouwelijkheidaanduiding."
+        ),
+    )
     auteur = models.CharField(
         max_length=200,
         help_text="De persoon of organisatie die in de eerste plaats "
@@ -222,16 +231,21 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
         max_length=100,
         help_text="Hash string, wordt gebruikt als ID voor de lock",
     )
+    # maintained by EnkelvoudigInformatieObject.save, to avoid looking up the
+    # highest versie
+    latest_version = models.ForeignKey(
+        "EnkelvoudigInformatieObject",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        help_text="De laatste versie van het INFORMATIEOBJECT",
+    )
 
     def __str__(self):
         return str(self.latest_version)
 
-    @property
-    def latest_version(self):
-        # there is implicit sorting by versie desc in EnkelvoudigInformatieObject.Meta.ordering
-        versies = self.enkelvoudiginformatieobject_set.all()
-        return versies.first()
-
 
 class EnkelvoudigInformatieObject(AuditTrailMixin, APIMixin, InformatieObject):
     """
@@ -277,8 +291,7 @@ class EnkelvoudigInformatieObject(AuditTrailMixin, APIMixin, InformatieObject):
             "informatieobject is vastgelegd, inclusief extensie."
         ),
     )
-    inhoud = PrivateMediaFileField(upload_to="uploads/%Y/%m/")
-    # inhoud = models.FileField(upload_to='uploads/%Y/%m/')
+    inhoud = PrivateMediaFileField(storage=blob_storage)
     link = models.URLField(
         max_length=200,
         blank=True,
@@ -337,7 +350,17 @@ class EnkelvoudigInformatieObject(AuditTrailMixin, APIMixin, InformatieObject):
         unique_together = ("uuid", "versie")
         verbose_name = _("Document")
         verbose_name_plural = _("Documenten")
-        indexes = [models.Index(fields=["canonical", "-versie"])]
+        indexes = [
+            models.Index(fields=["canonical", "-versie"]),
+            models.Index(
+                fields=["_informatieobjecttype", "_va_order"],
+                name="documenten_iotype_va_idx",
+            ),
+            models.Index(
+                fields=["_informatieobjecttype_url", "_va_order"],
+                name="documenten_iotype_url_va_idx",
+            ),
+        ]
         ordering = ["canonical", "-versie"]
 
     def _get_locked(self) -> bool:
@@ -350,6 +373,27 @@ class EnkelvoudigInformatieObject(AuditTrailMixin, APIMixin, InformatieObject):
 
     locked = property(_get_locked, _set_locked)
 
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        created = self._state.adding
+        super().save(*args, **kwargs)
+        if created:
+            self.update_latest_version()
+
+    def update_latest_version(self) -> None:
+        """
+        Point the canonical to this version, unless it has a higher version.
+        """
+        is_older = Q(latest_version__isnull=True) | Q(
+            latest_version__versie__lt=self.versie
+        )
+        updated = EnkelvoudigInformatieObjectCanonical.objects.filter(
+            is_older, pk=self.canonical_id
+        ).update(latest_version=self)
+
+        if updated and EnkelvoudigInformatieObject.canonical.is_cached(self):
+            self.canonical.latest_version = self
+
 
 class Gebruiksrechten(models.Model):
     uuid = models.UUIDField(
@@ -2,13 +2,18 @@ from typing import Dict, Tuple
 
 from django.apps import apps
 from django.db import models
+from django.db.models.base import ModelBase
 
 from django_loose_fk.virtual_models import ProxyMixin
-from vng_api_common.constants import ObjectTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.constants import ObjectTypes
 
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
-from openzaak.utils.query import BlockChangeMixin, LooseFkAuthorizationsFilterMixin
+from openzaak.utils.query import (
+    BlockChangeMixin,
+    LooseFkAuthorizationsFilterMixin,
+    LooseFkPrefetchMixin,
+)
 
 from .typing import IORelation
 
@@ -47,29 +52,27 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
         return ""
 
     def build_queryset(self, filters) -> models.QuerySet:
-        order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-            "vertrouwelijkheidaanduiding"
-        )
-        annotations = {"_va_order": order_case}
-
         if self.authorizations_lookup:
             # If the current queryset is not an InformatieObjectQuerySet, first
             # retrieve the canonical IDs of EnkelvoudigInformatieObjects
             # for which the user is authorized and then return the objects
             # related to those EnkelvoudigInformatieObjectCanonicals
             model = apps.get_model("documenten", "EnkelvoudigInformatieObject")
-            filtered = (
-                model.objects.annotate(**annotations)
-                .filter(**filters)
-                .values("canonical")
-            )
+            filtered = model.objects.filter(**filters).values("canonical")
             queryset = self.filter(informatieobject__in=filtered)
-            # bring it all together now to build the resulting queryset
         else:
-            queryset = self.annotate(**annotations).filter(**filters)
+            queryset = self.filter(**filters)
 
         return queryset
 
+    def get_authorizations_model(self) -> ModelBase:
+        return apps.get_model("documenten", "EnkelvoudigInformatieObject")
+
+    def filter_authorized(self, authorized: models.QuerySet) -> models.QuerySet:
+        # authorizations apply to the EnkelvoudigInformatieObject versions, the
+        # related objects point to the canonical
+        return self.filter(informatieobject__in=authorized.values("canonical"))
+
 
 class InformatieobjectQuerySet(
     InformatieobjectAuthorizationsFilterMixin, models.QuerySet
@@ -83,7 +86,9 @@ class InformatieobjectRelatedQuerySet(
     authorizations_lookup = "informatieobject"
 
 
-class ObjectInformatieObjectQuerySet(BlockChangeMixin, InformatieobjectRelatedQuerySet):
+class ObjectInformatieObjectQuerySet(
+    BlockChangeMixin, LooseFkPrefetchMixin, InformatieobjectRelatedQuerySet
+):
 
     RELATIONS = {
         BesluitInformatieObject: ObjectTypes.besluit,
@@ -1,5 +1,7 @@
 import logging
 
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
 from django.db.models.base import ModelBase
 from django.db.models.signals import ModelSignal, post_delete, post_save
 from django.dispatch import receiver
@@ -7,7 +9,12 @@ from django.dispatch import receiver
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
 
-from .models import ObjectInformatieObject
+from .models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+    ObjectInformatieObject,
+)
+from .storages import blob_storage, lock_blob
 from .typing import IORelation
 
 logger = logging.getLogger(__name__)
@@ -50,3 +57,47 @@ def sync_oio(
 
     else:
         raise NotImplementedError(f"Signal {signal} is not supported")
+
+
+def delete_unreferenced_file(name: str) -> None:
+    with transaction.atomic():
+        lock_blob(name)
+        if EnkelvoudigInformatieObject.objects.filter(inhoud=name).exists():
+            return
+        logger.debug("Deleting unreferenced file %s", name)
+        blob_storage.delete(name)
+
+
+@receiver(
+    post_delete,
+    sender=EnkelvoudigInformatieObject,
+    dispatch_uid="documenten.delete_unreferenced_file",
+)
+def delete_file(sender: ModelBase, instance: EnkelvoudigInformatieObject, **kwargs):
+    """
+    Delete the content of the document if no other version references it.
+    """
+    name = instance.inhoud.name
+    if name:
+        transaction.on_commit(lambda: delete_unreferenced_file(name))
+
+
+@receiver(
+    post_delete,
+    sender=EnkelvoudigInformatieObject,
+    dispatch_uid="documenten.update_latest_version",
+)
+def update_latest_version(
+    sender: ModelBase, instance: EnkelvoudigInformatieObject, **kwargs
+) -> None:
+    """
+    Point the canonical to the highest remaining version, if the latest is deleted.
+    """
+    latest = (
+        EnkelvoudigInformatieObject.objects.filter(canonical=OuterRef("pk"))
+        .order_by("-versie")
+        .values("pk")[:1]
+    )
+    EnkelvoudigInformatieObjectCanonical.objects.filter(
+        pk=instance.canonical_id, latest_version__isnull=True
+    ).update(latest_version=Subquery(latest))
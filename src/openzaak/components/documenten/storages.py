@@ -0,0 +1,59 @@
+"""
+Content-addressed storage of the document content.
+
+Files are stored under the SHA-256 digest of their content, so that versions
+of a document with unchanged content, and identical uploads of different
+documents, share a single file on disk. The number of references to a file is
+the number of document versions pointing to it, a file is removed when the
+last of those is deleted.
+"""
+import hashlib
+
+from django.core.files import File
+from django.db import connection
+
+from privates.storages import PrivateMediaFileSystemStorage
+
+from .checksums import get_checksum
+from .constants import ChecksumAlgoritmes
+
+BLOB_DIR = "blobs"
+DIGEST_ALGORITHM = ChecksumAlgoritmes.sha_256
+
+
+def lock_blob(name: str) -> None:
+    """
+    Lock the file until the end of the transaction.
+
+    This prevents a file from being removed while a transaction which starts
+    referencing it is not committed yet.
+    """
+    lock_id = int(hashlib.md5(name.encode("utf-8")).hexdigest()[:15], 16)
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_id])
+
+
+class BlobStorage(PrivateMediaFileSystemStorage):
+    """
+    Private media storage that stores files by the digest of their content.
+
+    The provided file names are ignored. Files should be saved in a transaction,
+    see :func:`lock_blob`.
+    """
+
+    def get_blob_name(self, content: File) -> str:
+        digest = get_checksum(content, DIGEST_ALGORITHM)
+        return f"{BLOB_DIR}/{digest[:2]}/{digest[2:4]}/{digest}"
+
+    def save(self, name, content, max_length=None):
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+
+        name = self.get_blob_name(content)
+        lock_blob(name)
+        if self.exists(name):
+            return name
+        return self._save(name, content)
+
+
+blob_storage = BlobStorage()
@@ -14,3 +14,21 @@ class LastVersionTests(TestCase):
         eio3 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=3)
 
         self.assertEqual(canonical.latest_version, eio3)
+
+    def test_older_version_does_not_replace_latest_version(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.latest_version, eio2)
+
+    def test_delete_latest_version(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio1 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+
+        eio2.delete()
+
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.latest_version, eio1)
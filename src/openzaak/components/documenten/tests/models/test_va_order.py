@@ -0,0 +1,22 @@
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from ..factories import EnkelvoudigInformatieObjectFactory
+
+
+class VertrouwelijkheidsAanduidingOrderTests(TestCase):
+    def test_order_follows_vertrouwelijkheidaanduiding(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern
+        )
+        eio.refresh_from_db()
+        self.assertEqual(
+            eio._va_order, VertrouwelijkheidsAanduiding.get_choice("intern").order
+        )
+
+        eio.vertrouwelijkheidaanduiding = ""
+        eio.save()
+
+        eio.refresh_from_db()
+        self.assertIsNone(eio._va_order)
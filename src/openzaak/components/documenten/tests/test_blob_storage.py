@@ -0,0 +1,93 @@
+import hashlib
+from base64 import b64encode
+from io import StringIO
+
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+
+from privates.storages import PrivateMediaFileSystemStorage
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..models import EnkelvoudigInformatieObject
+from ..signals import delete_unreferenced_file
+from ..storages import blob_storage
+from .factories import EnkelvoudigInformatieObjectFactory
+
+DIGEST = hashlib.sha256(b"some data").hexdigest()
+
+
+@temp_private_root()
+class BlobStorageTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def test_identical_content_stored_once(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create()
+        eio2 = EnkelvoudigInformatieObjectFactory.create()
+
+        self.assertEqual(eio1.inhoud.name, f"blobs/{DIGEST[:2]}/{DIGEST[2:4]}/{DIGEST}")
+        self.assertEqual(eio1.inhoud.name, eio2.inhoud.name)
+        with eio2.inhoud.open("rb") as inhoud:
+            self.assertEqual(inhoud.read(), b"some data")
+
+    def test_new_version_with_same_content_shares_file(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = reverse(eio)
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+
+        response = self.client.patch(
+            eio_url,
+            {
+                "inhoud": b64encode(b"some data").decode("utf-8"),
+                "titel": "another titel",
+                "lock": lock,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        names = set(
+            EnkelvoudigInformatieObject.objects.filter(uuid=eio.uuid).values_list(
+                "inhoud", flat=True
+            )
+        )
+        self.assertEqual(names, {eio.inhoud.name})
+
+    def test_delete_unreferenced_file(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        name = eio.inhoud.name
+        other_name = blob_storage.save(None, ContentFile(b"other data"))
+
+        delete_unreferenced_file(name)
+        delete_unreferenced_file(other_name)
+
+        self.assertTrue(blob_storage.exists(name))
+        self.assertFalse(blob_storage.exists(other_name))
+
+    def test_deduplicate_existing_files(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create()
+        eio2 = EnkelvoudigInformatieObjectFactory.create()
+        blob_name = eio1.inhoud.name
+        blob_storage.delete(blob_name)
+
+        storage = PrivateMediaFileSystemStorage()
+        old_name1 = storage.save("uploads/2020/01/file1.bin", ContentFile(b"some data"))
+        old_name2 = storage.save("uploads/2020/02/file2.bin", ContentFile(b"some data"))
+        EnkelvoudigInformatieObject.objects.filter(pk=eio1.pk).update(inhoud=old_name1)
+        EnkelvoudigInformatieObject.objects.filter(pk=eio2.pk).update(inhoud=old_name2)
+
+        stdout = StringIO()
+        call_command("deduplicate_documents", stdout=stdout)
+
+        eio1.refresh_from_db()
+        eio2.refresh_from_db()
+        self.assertEqual(eio1.inhoud.name, blob_name)
+        self.assertEqual(eio2.inhoud.name, blob_name)
+        self.assertTrue(storage.exists(blob_name))
+        self.assertFalse(storage.exists(old_name1))
+        self.assertFalse(storage.exists(old_name2))
+        self.assertIn("Moved 2 files", stdout.getvalue())
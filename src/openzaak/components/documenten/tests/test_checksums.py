@@ -0,0 +1,153 @@
+import hashlib
+import io
+import uuid
+import zlib
+from base64 import b64encode
+from datetime import date
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase, override_settings
+
+from freezegun import freeze_time
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import get_validation_errors, reverse, reverse_lazy
+
+from openzaak.components.catalogi.tests.factories import InformatieObjectTypeFactory
+from openzaak.utils.tests import JWTAuthMixin
+
+from .. import checksums
+from ..checksums import ChecksumReader, get_checksum, get_configured_algorithm
+from ..constants import ChecksumAlgoritmes
+from ..models import EnkelvoudigInformatieObject
+from .factories import EnkelvoudigInformatieObjectCanonicalFactory
+
+CONTENT = b"some file content"
+
+
+class ChecksumTests(SimpleTestCase):
+    def test_reader_computes_checksums_while_reading(self):
+        reader = ChecksumReader(
+            io.BytesIO(CONTENT), [ChecksumAlgoritmes.sha_256, ChecksumAlgoritmes.crc_32]
+        )
+
+        while reader.read(4):
+            pass
+
+        self.assertEqual(
+            reader.get_checksums(),
+            {
+                ChecksumAlgoritmes.sha_256: hashlib.sha256(CONTENT).hexdigest(),
+                ChecksumAlgoritmes.crc_32: f"{zlib.crc32(CONTENT):08x}",
+            },
+        )
+
+    def test_get_checksum_uses_computed_checksums(self):
+        file = ContentFile(CONTENT)
+        file.checksums = {ChecksumAlgoritmes.sha_256: "computed"}
+
+        with patch.object(file, "chunks") as mock_chunks:
+            checksum = get_checksum(file, ChecksumAlgoritmes.sha_256)
+
+        self.assertEqual(checksum, "computed")
+        mock_chunks.assert_not_called()
+
+    def test_get_checksum_in_memory_file(self):
+        checksum = get_checksum(ContentFile(CONTENT), ChecksumAlgoritmes.sha_3)
+
+        self.assertEqual(checksum, hashlib.sha3_256(CONTENT).hexdigest())
+
+    @override_settings(DOCUMENTEN_CHECKSUM_ALGORITHM=ChecksumAlgoritmes.hmac)
+    def test_unsupported_algorithm_configured(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_configured_algorithm()
+
+
+@freeze_time("2020-03-04")
+@temp_private_root()
+class ChecksumAPITests(JWTAuthMixin, APITestCase):
+
+    list_url = reverse_lazy(EnkelvoudigInformatieObject)
+    heeft_alle_autorisaties = True
+
+    def create(self, integriteit=None):
+        informatieobjecttype = InformatieObjectTypeFactory.create(concept=False)
+        content = {
+            "identificatie": uuid.uuid4().hex,
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2020-03-04",
+            "titel": "Voorbeelddocument",
+            "auteur": "test_auteur",
+            "formaat": "text/plain",
+            "taal": "eng",
+            "bestandsnaam": "dummy.txt",
+            "vertrouwelijkheidaanduiding": "openbaar",
+            "inhoud": b64encode(CONTENT).decode("utf-8"),
+            "informatieobjecttype": f"http://testserver{reverse(informatieobjecttype)}",
+            "integriteit": integriteit,
+        }
+        return self.client.post(self.list_url, content)
+
+    @override_settings(DOCUMENTEN_CHECKSUM_ALGORITHM=ChecksumAlgoritmes.sha_256)
+    def test_create_computes_checksum(self):
+        response = self.create()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(
+            EnkelvoudigInformatieObject.objects.get().integriteit,
+            {
+                "algoritme": ChecksumAlgoritmes.sha_256,
+                "waarde": hashlib.sha256(CONTENT).hexdigest(),
+                "datum": date(2020, 3, 4),
+            },
+        )
+
+    def test_create_checksum_mismatch(self):
+        response = self.create(
+            {"algoritme": "sha_256", "waarde": "0" * 64, "datum": "2020-03-04"}
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+        )
+        error = get_validation_errors(response, "integriteit")
+        self.assertEqual(error["code"], "checksum-mismatch")
+
+    def test_create_unsupported_algorithm_stored_as_provided(self):
+        response = self.create(
+            {"algoritme": "crc_16", "waarde": "abcd", "datum": "2020-03-04"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(
+            EnkelvoudigInformatieObject.objects.get().integriteit["waarde"], "abcd"
+        )
+
+    @override_settings(
+        DOCUMENTEN_CHECKSUM_ALGORITHM=ChecksumAlgoritmes.sha_256,
+        FILE_UPLOAD_MAX_MEMORY_SIZE=10,
+    )
+    def test_upload_computes_checksum_while_receiving(self):
+        lock = uuid.uuid4().hex
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create(lock=lock)
+        url = reverse(
+            "enkelvoudiginformatieobject-upload",
+            kwargs={"uuid": canonical.latest_version.uuid},
+        )
+
+        with patch.object(
+            checksums, "get_hasher", wraps=checksums.get_hasher
+        ) as mock_get_hasher:
+            response = self.client.put(
+                f"{url}?lock={lock}", CONTENT, content_type="application/octet-stream"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            response.data["integriteit"]["waarde"], hashlib.sha256(CONTENT).hexdigest()
+        )
+        # the content is hashed once, by the parser
+        mock_get_hasher.assert_called_once()
@@ -0,0 +1,129 @@
+import hashlib
+
+from django.test import override_settings
+
+from django_sendfile.sendfile import _get_sendfile
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from openzaak.utils.tests import JWTAuthMixin
+
+from .factories import EnkelvoudigInformatieObjectFactory
+from .utils import get_operation_url
+
+CONTENT = b"some binary content"
+
+
+@override_settings(SENDFILE_BACKEND="django_sendfile.backends.simple")
+@temp_private_root()
+class EioDownloadTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        # the sendfile backend is loaded once, use the one of the test
+        _get_sendfile.clear()
+        self.addCleanup(_get_sendfile.clear)
+
+        self.eio = EnkelvoudigInformatieObjectFactory.create(inhoud__data=CONTENT)
+        self.url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=self.eio.uuid
+        )
+        self.etag = f'"{hashlib.sha256(CONTENT).hexdigest()}"'
+
+    def test_download_headers(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), CONTENT)
+        self.assertEqual(response["ETag"], self.etag)
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("Last-Modified", response)
+
+    def test_if_none_match(self):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], self.etag)
+
+    def test_range(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=5-10")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), CONTENT[5:11])
+        self.assertEqual(response["Content-Range"], f"bytes 5-10/{len(CONTENT)}")
+        self.assertEqual(response["Content-Length"], "6")
+
+    def test_open_and_suffix_ranges(self):
+        for header, expected in [
+            ("bytes=12-", CONTENT[12:]),
+            ("bytes=-3", CONTENT[-3:]),
+        ]:
+            with self.subTest(range=header):
+                response = self.client.get(self.url, HTTP_RANGE=header)
+
+                self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+                self.assertEqual(b"".join(response.streaming_content), expected)
+
+    def test_if_range(self):
+        with self.subTest("matching etag"):
+            response = self.client.get(
+                self.url, HTTP_RANGE="bytes=5-", HTTP_IF_RANGE=self.etag
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+
+        with self.subTest("changed content"):
+            response = self.client.get(
+                self.url, HTTP_RANGE="bytes=5-", HTTP_IF_RANGE='"other"'
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.getvalue(), CONTENT)
+
+    def test_range_not_satisfiable(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=100-")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], f"bytes */{len(CONTENT)}")
+
+    def test_multiple_ranges_ignored(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=0-1,5-6")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), CONTENT)
+
+    @override_settings(SENDFILE_BACKEND="django_sendfile.backends.nginx")
+    def test_range_served_by_nginx(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=5-10")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("X-Accel-Redirect", response)
+        self.assertEqual(response["ETag"], self.etag)
+
+    def test_filename(self):
+        self.eio.bestandsnaam = "rapport é.pdf"
+        self.eio.save()
+
+        for header in ["", "bytes=5-10"]:
+            with self.subTest(range=header):
+                response = self.client.get(self.url, HTTP_RANGE=header)
+
+                self.assertEqual(
+                    response["Content-Disposition"],
+                    'attachment; filename="rapport e.pdf"; '
+                    "filename*=UTF-8''rapport%20%C3%A9.pdf",
+                )
+
+    def test_filename_without_bestandsnaam(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            response["Content-Disposition"],
+            f'attachment; filename="{self.eio.uuid}.bin"',
+        )
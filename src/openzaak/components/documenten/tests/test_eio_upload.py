@@ -0,0 +1,71 @@
+import uuid
+
+from django.test import override_settings
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import get_validation_errors, reverse
+
+from openzaak.utils.tests import JWTAuthMixin
+
+from .factories import EnkelvoudigInformatieObjectCanonicalFactory
+
+
+@temp_private_root()
+class EioUploadAPITests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.lock = uuid.uuid4().hex
+        self.canonical = EnkelvoudigInformatieObjectCanonicalFactory.create(
+            lock=self.lock
+        )
+
+    def upload(self, content: bytes, lock: str):
+        url = reverse(
+            "enkelvoudiginformatieobject-upload",
+            kwargs={"uuid": self.canonical.latest_version.uuid},
+        )
+        return self.client.put(
+            f"{url}?lock={lock}", content, content_type="application/octet-stream",
+        )
+
+    # write uploads of more than 10 bytes to a temporary file
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=10)
+    def test_upload_creates_new_version(self):
+        content = b"some binary content" * 1000
+
+        response = self.upload(content, self.lock)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        self.canonical.refresh_from_db()
+        eio = self.canonical.latest_version
+        self.assertEqual(eio.versie, 2)
+        self.assertEqual(response.data["bestandsomvang"], len(content))
+        with eio.inhoud.open("rb") as inhoud:
+            self.assertEqual(inhoud.read(), content)
+
+    def test_upload_wrong_lock(self):
+        response = self.upload(b"some content", "wrong")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+        )
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "incorrect-lock-id")
+        self.assertEqual(self.canonical.latest_version.versie, 1)
+
+    def test_upload_json_not_accepted(self):
+        url = reverse(
+            "enkelvoudiginformatieobject-upload",
+            kwargs={"uuid": self.canonical.latest_version.uuid},
+        )
+
+        response = self.client.put(f"{url}?lock={self.lock}", {"inhoud": "aGVsbG8="})
+
+        self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
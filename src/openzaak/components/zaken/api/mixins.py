@@ -6,20 +6,22 @@ from rest_framework import serializers
 
 from openzaak.components.zaken.api.scopes import SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN
 from openzaak.components.zaken.models import Zaak
+from openzaak.utils.permissions import get_permission_fields
 
 from .exceptions import ZaakClosed
-from .serializers import ZaakSerializer
+from .permissions import ZaakAuthRequired
 
 
 class ClosedZaakMixin:
     def _has_override(self, zaak: Zaak) -> bool:
         jwt_auth = self.request.jwt_auth
-        zaak_data = ZaakSerializer(zaak, context={"request": self.request}).data
+        fields = get_permission_fields(
+            zaak, ZaakAuthRequired.permission_fields, self.request
+        )
         return jwt_auth.has_auth(
             scopes=SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
-            zaaktype=zaak_data["zaaktype"],
-            vertrouwelijkheidaanduiding=zaak_data["vertrouwelijkheidaanduiding"],
             init_component=self.queryset.model._meta.app_label,
+            **fields,
         )
 
     def _check_zaak_closed(self, zaak: Optional[Zaak] = None) -> None:
@@ -23,9 +23,7 @@ class ZaakNestedAuthRequired(ZaakAuthRequired):
         component = self.get_component(view)
 
         main_object = view._get_zaak()
-        main_object_data = self.format_data(main_object, request)
-
-        fields = self.get_fields(main_object_data)
+        fields = self.get_object_fields(main_object, request)
         return request.jwt_auth.has_auth(scopes_required, component, **fields)
 
     def has_object_permission(self, request: Request, view, obj) -> bool:
@@ -1,10 +1,11 @@
 from vng_api_common.utils import get_uuid_from_path
 from zgw_consumers.client import UnknownService
-from zgw_consumers.models import Service
+
+from openzaak.config.cache import services_index
 
 
 def create_remote_oio(io_url: str, object_url: str, object_type: str = "zaak") -> dict:
-    client = Service.get_client(io_url)
+    client = services_index.get_client(io_url)
     if client is None:
         raise UnknownService(f"{io_url} API should be added to Service model")
 
@@ -15,7 +16,7 @@ def create_remote_oio(io_url: str, object_url: str, object_type: str = "zaak") -
 
 
 def delete_remote_oio(oio_url: str) -> None:
-    client = Service.get_client(oio_url)
+    client = services_index.get_client(oio_url)
     if client is None:
         raise UnknownService(f"{oio_url} API should be added to Service model")
 
@@ -23,7 +24,7 @@ def delete_remote_oio(oio_url: str) -> None:
 
 
 def create_remote_zaakbesluit(besluit_url: str, zaak_url: str) -> dict:
-    client = Service.get_client(zaak_url)
+    client = services_index.get_client(zaak_url)
     if client is None:
         raise UnknownService(f"{zaak_url} API should be added to Service model")
 
@@ -36,7 +37,7 @@ def create_remote_zaakbesluit(besluit_url: str, zaak_url: str) -> dict:
 
 
 def delete_remote_zaakbesluit(zaakbesluit_url: str) -> None:
-    client = Service.get_client(zaakbesluit_url)
+    client = services_index.get_client(zaakbesluit_url)
     if client is None:
         raise UnknownService(f"{zaakbesluit_url} API should be added to Service model")
 
@@ -1,7 +1,9 @@
+from contextlib import closing
 from datetime import date
+from typing import ContextManager, Iterator
 
 from django.db import models
-from django.db.models import Max, Subquery
+from django.db.models import Subquery
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
@@ -12,6 +14,7 @@ from vng_api_common.validators import (
 )
 
 from openzaak.components.documenten.constants import Statussen
+from openzaak.components.documenten.loaders import EIOLoader
 from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
@@ -20,6 +23,23 @@ from openzaak.components.documenten.models import (
 from ..models import Zaak
 
 
+def load_remote_eios(
+    zaak: Zaak,
+) -> ContextManager[Iterator[EnkelvoudigInformatieObject]]:
+    """
+    Load the remote informatieobjecten of the zaak concurrently.
+
+    The documents are yielded as they arrive, so validators can stop at the
+    first document failing their check - the remaining requests are cancelled
+    when the context exits. Loaded documents are shared by the validators in
+    the same request.
+    """
+    urls = zaak.zaakinformatieobject_set.exclude(_informatieobject_url="").values_list(
+        "_informatieobject_url", flat=True
+    )
+    return closing(EIOLoader().load_many(urls, EnkelvoudigInformatieObject))
+
+
 class RolOccurenceValidator:
     """
     Validate that max x occurences of a field occur for a related object.
@@ -187,13 +207,9 @@ class ZaakArchiveIOsArchivedValidator:
         canonical_ids = self.instance.zaakinformatieobject_set.values(
             "_informatieobject_id"
         )
-        io_ids = (
-            EnkelvoudigInformatieObjectCanonical.objects.filter(
-                id__in=Subquery(canonical_ids)
-            )
-            .annotate(last=Max("enkelvoudiginformatieobject"))
-            .values("last")
-        )
+        io_ids = EnkelvoudigInformatieObjectCanonical.objects.filter(
+            id__in=Subquery(canonical_ids)
+        ).values("latest_version")
 
         if (
             EnkelvoudigInformatieObject.objects.filter(id__in=Subquery(io_ids))
@@ -205,17 +221,10 @@ class ZaakArchiveIOsArchivedValidator:
     def validate_remote_eios_archived(
         self, attrs: dict, error: serializers.ValidationError
     ):
-        remote_zios = self.instance.zaakinformatieobject_set.exclude(
-            _informatieobject_url=""
-        )
-        # This is a very naive approach to load all the remote objects - it happens
-        # sequentially, while futures.concurrent _could_ be used. Let's see first
-        # how performance is in this setup. Because we're looping and exiting as
-        # soon as an error condition is found, we can reduce unnecessary network
-        # calls.
-        for zio in remote_zios:
-            if zio.informatieobject.status != Statussen.gearchiveerd:
-                raise error
+        with load_remote_eios(self.instance) as eios:
+            for eio in eios:
+                if eio.status != Statussen.gearchiveerd:
+                    raise error
 
     def validate_extra_attributes(self, attrs: dict):
         for attr in ["archiefnominatie", "archiefactiedatum"]:
@@ -263,10 +272,10 @@ class EndStatusIOsUnlockedValidator:
         if local_zios.exclude(_informatieobject__lock="").exists():
             raise serializers.ValidationError(self.message, code=self.code)
 
-        remote_zios = zaak.zaakinformatieobject_set.exclude(_informatieobject_url="")
-        for zio in remote_zios:
-            if zio.informatieobject.locked:
-                raise serializers.ValidationError(self.message, code=self.code)
+        with load_remote_eios(zaak) as eios:
+            for eio in eios:
+                if eio.locked:
+                    raise serializers.ValidationError(self.message, code=self.code)
 
 
 class EndStatusIOsIndicatieGebruiksrechtValidator:
@@ -298,13 +307,9 @@ class EndStatusIOsIndicatieGebruiksrechtValidator:
 
     def validate_local_eios_indicatie_set(self, zaak: Zaak):
         canonical_ids = zaak.zaakinformatieobject_set.values("_informatieobject_id")
-        io_ids = (
-            EnkelvoudigInformatieObjectCanonical.objects.filter(
-                id__in=Subquery(canonical_ids)
-            )
-            .annotate(last=Max("enkelvoudiginformatieobject"))
-            .values("last")
-        )
+        io_ids = EnkelvoudigInformatieObjectCanonical.objects.filter(
+            id__in=Subquery(canonical_ids)
+        ).values("latest_version")
 
         if (
             EnkelvoudigInformatieObject.objects.filter(id__in=Subquery(io_ids))
@@ -314,7 +319,7 @@ class EndStatusIOsIndicatieGebruiksrechtValidator:
             raise serializers.ValidationError(self.message, self.code)
 
     def validate_remote_eios_indicatie_set(self, zaak: Zaak):
-        remote_zios = zaak.zaakinformatieobject_set.exclude(_informatieobject_url="")
-        for zio in remote_zios:
-            if zio.informatieobject.indicatie_gebruiksrecht is None:
-                raise serializers.ValidationError(self.message, self.code)
+        with load_remote_eios(zaak) as eios:
+            for eio in eios:
+                if eio.indicatie_gebruiksrecht is None:
+                    raise serializers.ValidationError(self.message, self.code)
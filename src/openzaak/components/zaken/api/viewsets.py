@@ -31,6 +31,7 @@ from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
 
 from openzaak.components.documenten.api.utils import delete_remote_oio
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.permissions import get_permission_fields
 
 from ..models import (
     KlantContact,
@@ -269,13 +270,14 @@ class ZaakViewSet(
 
         """
         zaak = self.get_object()
-        zaak_data = self.get_serializer(zaak).data
+        fields = get_permission_fields(
+            zaak, ZaakAuthRequired.permission_fields, self.request
+        )
 
         if not self.request.jwt_auth.has_auth(
             scopes=SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
-            zaaktype=zaak_data["zaaktype"],
-            vertrouwelijkheidaanduiding=zaak_data["vertrouwelijkheidaanduiding"],
             init_component=self.queryset.model._meta.app_label,
+            **fields,
         ):
             if zaak.is_closed:
                 msg = "Modifying a closed case with current scope is forbidden"
@@ -366,24 +368,22 @@ class StatusViewSet(
           insufficient permissions
         """
         zaak = serializer.validated_data["zaak"]
-        zaak_data = ZaakSerializer(zaak, context={"request": self.request}).data
+        fields = get_permission_fields(
+            zaak, ZaakAuthRequired.permission_fields, self.request
+        )
         component = self.queryset.model._meta.app_label
 
         if not self.request.jwt_auth.has_auth(
             scopes=SCOPE_STATUSSEN_TOEVOEGEN | SCOPEN_ZAKEN_HEROPENEN,
-            zaaktype=zaak_data["zaaktype"],
-            vertrouwelijkheidaanduiding=zaak_data["vertrouwelijkheidaanduiding"],
             init_component=component,
+            **fields,
         ):
             if zaak.status_set.exists():
                 msg = f"Met de '{SCOPE_ZAKEN_CREATE}' scope mag je slechts 1 status zetten"
                 raise PermissionDenied(detail=msg)
 
         if not self.request.jwt_auth.has_auth(
-            scopes=SCOPEN_ZAKEN_HEROPENEN,
-            zaaktype=zaak_data["zaaktype"],
-            vertrouwelijkheidaanduiding=zaak_data["vertrouwelijkheidaanduiding"],
-            init_component=component,
+            scopes=SCOPEN_ZAKEN_HEROPENEN, init_component=component, **fields,
         ):
             if zaak.is_closed:
                 msg = "Reopening a closed case with current scope is forbidden"
@@ -510,8 +510,10 @@ class ZaakInformatieObjectViewSet(
     """
 
     queryset = (
-        ZaakInformatieObject.objects.select_related("zaak", "_informatieobject")
-        .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
+        ZaakInformatieObject.objects.select_related(
+            "zaak", "_informatieobject__latest_version"
+        )
+        .prefetch_loose_fk("informatieobject")
         .order_by("-pk")
     )
     filterset_class = ZaakInformatieObjectFilter
@@ -0,0 +1,47 @@
+from django.db import migrations, models
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+import openzaak.utils.fields
+
+
+def set_va_order(apps, _):
+    Zaak = apps.get_model("zaken", "Zaak")
+    Zaak.objects.update(
+        _va_order=VertrouwelijkheidsAanduiding.get_order_expression(
+            "vertrouwelijkheidaanduiding"
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zaken", "0002_auto_20200124_1039"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaak",
+            name="_va_order",
+            field=openzaak.utils.fields.VertrouwelijkheidsAanduidingOrderField(
+                editable=False,
+                help_text="De volgorde van de vertrouwelijkheidaanduiding, gebruikt om te filteren op de maximale vertrouwelijkheidaanduiding.",
+                null=True,
+                verbose_name="vertrouwelijkheidaanduiding volgorde",
+            ),
+        ),
+        migrations.RunPython(set_va_order, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="zaak",
+            index=models.Index(
+                fields=["_zaaktype", "_va_order"], name="zaken_zaaktype_va_order_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="zaak",
+            index=models.Index(
+                fields=["_zaaktype_url", "_va_order"], name="zaken_zaaktype_url_va_idx"
+            ),
+        ),
+    ]
@@ -27,7 +27,7 @@ from vng_api_common.validators import alphanumeric_excluding_diacritic
 
 from openzaak.client import fetch_object
 from openzaak.components.documenten.loaders import EIOLoader
-from openzaak.utils.fields import DurationField
+from openzaak.utils.fields import DurationField, VertrouwelijkheidsAanduidingOrderField
 from openzaak.utils.mixins import AuditTrailMixin
 
 from ..constants import AardZaakRelatie, BetalingsIndicatie, IndicatieMachtiging
@@ -200,6 +200,13 @@ class Zaak(AuditTrailMixin, APIMixin, models.Model):
             "Aanduiding van de mate waarin het zaakdossier van de ZAAK voor de openbaarheid bestemd is."
         ),
     )
+    _va_order = VertrouwelijkheidsAanduidingOrderField(
+        _("vertrouwelijkheidaanduiding volgorde"),
+        help_text=_(
+            "De volgorde van de vertrouwelijkheidaanduiding, gebruikt om te "
+            "filteren op de maximale vertrouwelijkheidaanduiding."
+        ),
+    )
 
     betalingsindicatie = models.CharField(
         _("betalingsindicatie"),
@@ -317,6 +324,14 @@ class Zaak(AuditTrailMixin, APIMixin, models.Model):
         verbose_name = "zaak"
         verbose_name_plural = "zaken"
         unique_together = ("bronorganisatie", "identificatie")
+        indexes = [
+            models.Index(
+                fields=["_zaaktype", "_va_order"], name="zaken_zaaktype_va_order_idx"
+            ),
+            models.Index(
+                fields=["_zaaktype_url", "_va_order"], name="zaken_zaaktype_url_va_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.identificatie
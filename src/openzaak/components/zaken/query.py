@@ -5,7 +5,11 @@ from django.db import models
 from django_loose_fk.virtual_models import ProxyMixin
 
 from openzaak.components.besluiten.models import Besluit
-from openzaak.utils.query import BlockChangeMixin, LooseFkAuthorizationsFilterMixin
+from openzaak.utils.query import (
+    BlockChangeMixin,
+    LooseFkAuthorizationsFilterMixin,
+    LooseFkPrefetchMixin,
+)
 
 
 class ZaakAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin):
@@ -46,7 +50,9 @@ class ZaakRelatedQuerySet(ZaakAuthorizationsFilterMixin, models.QuerySet):
     authorizations_lookup = "zaak"
 
 
-class ZaakInformatieObjectQuerySet(BlockChangeMixin, ZaakRelatedQuerySet):
+class ZaakInformatieObjectQuerySet(
+    BlockChangeMixin, LooseFkPrefetchMixin, ZaakRelatedQuerySet
+):
     pass
 
 
@@ -0,0 +1,34 @@
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from ...models import Zaak
+from ..factories import ZaakFactory
+
+
+class VertrouwelijkheidsAanduidingOrderTests(TestCase):
+    def test_order_set_on_create(self):
+        zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.confidentieel
+        )
+
+        zaak.refresh_from_db()
+        self.assertEqual(
+            zaak._va_order,
+            VertrouwelijkheidsAanduiding.get_choice("confidentieel").order,
+        )
+
+    def test_order_updated_on_change(self):
+        zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        zaak.vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.geheim
+        zaak.save()
+
+        self.assertTrue(
+            Zaak.objects.filter(
+                pk=zaak.pk,
+                _va_order=VertrouwelijkheidsAanduiding.get_choice("geheim").order,
+            ).exists()
+        )
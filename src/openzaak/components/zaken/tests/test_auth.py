@@ -1,19 +1,25 @@
 """
 Guarantee that the proper authorization machinery is in place.
 """
-from django.test import override_settings, tag
+from unittest.mock import patch
+
+from django.test import RequestFactory, TestCase, override_settings, tag
 
 from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APITestCase
+from vng_api_common.authorizations.models import Autorisatie
 from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.tests import AuthCheckMixin, generate_jwt_auth, reverse
 
+from openzaak.components.autorisaties.index import CompiledAutorisatie
 from openzaak.components.besluiten.tests.factories import BesluitFactory
 from openzaak.components.catalogi.tests.factories import (
     EigenschapFactory,
     ZaakTypeFactory,
 )
+from openzaak.utils.constants import AuthorizationsFilterStrategies
+from openzaak.utils.permissions import get_permission_fields
 from openzaak.utils.tests import JWTAuthMixin
 
 from ..api.scopes import (
@@ -21,7 +27,8 @@ from ..api.scopes import (
     SCOPE_ZAKEN_BIJWERKEN,
     SCOPE_ZAKEN_CREATE,
 )
-from ..models import ZaakBesluit, ZaakInformatieObject
+from ..models import Zaak, ZaakBesluit, ZaakInformatieObject
+from ..query import ZaakQuerySet
 from .factories import (
     ResultaatFactory,
     RolFactory,
@@ -929,3 +936,131 @@ class JWTExpiredTests(JWTAuthMixin, APITestCase):
         response = self.client.get(zaak_url)
 
         self.assertEqual(response.data["code"], "jwt-expired")
+
+
+class PermissionFieldsTests(TestCase):
+    def test_local_zaaktype(self):
+        zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim
+        )
+        zaak.refresh_from_db()
+        request = RequestFactory().get("/")
+
+        # only the zaaktype is loaded, no serialization of the zaak
+        with self.assertNumQueries(1):
+            fields = get_permission_fields(
+                zaak, ("zaaktype", "vertrouwelijkheidaanduiding"), request
+            )
+
+        self.assertEqual(
+            fields,
+            {
+                "zaaktype": f"http://testserver{reverse(zaak.zaaktype)}",
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.geheim,
+            },
+        )
+
+    def test_external_zaaktype(self):
+        zaak = ZaakFactory.create(
+            zaaktype="https://externe.catalogus.nl/api/v1/zaaktypen/1"
+        )
+        zaak.refresh_from_db()
+        request = RequestFactory().get("/")
+
+        with self.assertNumQueries(0):
+            fields = get_permission_fields(zaak, ("zaaktype",), request)
+
+        self.assertEqual(
+            fields, {"zaaktype": "https://externe.catalogus.nl/api/v1/zaaktypen/1"}
+        )
+
+
+class AuthorizationsFilterStrategyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.zaaktype = ZaakTypeFactory.create()
+        cls.external_zaaktype = "https://externe.catalogus.nl/api/v1/zaaktypen/1"
+
+        cls.zaak1 = ZaakFactory.create(
+            zaaktype=cls.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakFactory.create(
+            zaaktype=cls.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+        cls.zaak2 = ZaakFactory.create(
+            zaaktype=cls.external_zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        cls.autorisaties = [
+            CompiledAutorisatie(
+                Autorisatie(
+                    component=ComponentTypes.zrc,
+                    scopes=[str(SCOPE_ZAKEN_ALLES_LEZEN)],
+                    zaaktype=f"http://testserver{reverse(cls.zaaktype)}",
+                    max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.beperkt_openbaar,
+                )
+            ),
+            CompiledAutorisatie(
+                Autorisatie(
+                    component=ComponentTypes.zrc,
+                    scopes=[str(SCOPE_ZAKEN_ALLES_LEZEN)],
+                    zaaktype=cls.external_zaaktype,
+                    max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+                )
+            ),
+        ]
+
+    def test_zaken(self):
+        for strategy in AuthorizationsFilterStrategies.values:
+            with self.subTest(strategy=strategy):
+                zaken = Zaak.objects.filter_for_authorizations(
+                    SCOPE_ZAKEN_ALLES_LEZEN, self.autorisaties, strategy=strategy
+                )
+
+                self.assertEqual(set(zaken), {self.zaak1, self.zaak2})
+
+    def test_zaak_related(self):
+        zio = ZaakInformatieObjectFactory.create(zaak=self.zaak1)
+        ZaakInformatieObjectFactory.create(
+            zaak__vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        for strategy in AuthorizationsFilterStrategies.values:
+            with self.subTest(strategy=strategy):
+                zios = ZaakInformatieObject.objects.filter_for_authorizations(
+                    SCOPE_ZAKEN_ALLES_LEZEN, self.autorisaties, strategy=strategy
+                )
+
+                self.assertEqual(list(zios), [zio])
+
+    def test_missing_scope(self):
+        for strategy in AuthorizationsFilterStrategies.values:
+            with self.subTest(strategy=strategy):
+                zaken = Zaak.objects.filter_for_authorizations(
+                    SCOPE_ZAKEN_BIJWERKEN, self.autorisaties, strategy=strategy
+                )
+
+                self.assertFalse(zaken.exists())
+
+    @override_settings(
+        AUTHORIZATIONS_FILTER_STRATEGY=AuthorizationsFilterStrategies.join
+    )
+    def test_strategy_setting(self):
+        with patch.object(
+            ZaakQuerySet,
+            "filter_for_authorizations_join",
+            return_value=Zaak.objects.none(),
+        ) as mock_join:
+            Zaak.objects.filter_for_authorizations(
+                SCOPE_ZAKEN_ALLES_LEZEN, self.autorisaties
+            )
+
+        mock_join.assert_called_once_with(SCOPE_ZAKEN_ALLES_LEZEN, self.autorisaties)
@@ -29,3 +29,5 @@ AXES_BEHIND_REVERSE_PROXY = False
 # Open Zaak specific settings
 #
 NOTIFICATIONS_DISABLED = True
+# the failures mocked in the tests would trip the breakers of the test services
+REMOTE_API_CIRCUIT_BREAKER = False
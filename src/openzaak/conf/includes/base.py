@@ -155,6 +155,7 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "openzaak.utils.middleware.APIVersionHeaderMiddleware",
     "openzaak.utils.middleware.EnabledMiddleware",
+    "openzaak.utils.middleware.RemoteObjectsMiddleware",
 ]
 
 ROOT_URLCONF = "openzaak.urls"
@@ -388,6 +389,9 @@ ENVIRONMENT_SHOWN_IN_ADMIN = True
 # settings for uploading large files
 MIN_UPLOAD_SIZE = config("MIN_UPLOAD_SIZE", 4 * 2 ** 30)
 
+# checksum algorithm used to fill in the integriteit of uploaded documents
+DOCUMENTEN_CHECKSUM_ALGORITHM = config("DOCUMENTEN_CHECKSUM_ALGORITHM", "")
+
 # urls for OAS3 specifications
 SPEC_URL = {
     "zaken": os.path.join(
@@ -530,11 +534,59 @@ STORE_FAILED_NOTIFS = True
 # Expiry time in seconds for JWT
 JWT_EXPIRY = config("JWT_EXPIRY", default=3600)
 
+# Time in seconds a JWT generated for an external API is reused for other
+# requests to that API. Must be (well) below the JWT expiry of the remote API.
+REMOTE_API_TOKEN_TIMEOUT = config("REMOTE_API_TOKEN_TIMEOUT", default=5 * 60)
+
+# Time in seconds the compiled authorizations of a client are cached. The cache
+# is invalidated whenever authorizations change, set to 0 to disable caching.
+AUTORISATIES_CACHE_TIMEOUT = config("AUTORISATIES_CACHE_TIMEOUT", default=60 * 60)
+
+# The strategy to filter the list endpoints on the authorizations of the client,
+# see openzaak.utils.constants.AuthorizationsFilterStrategies
+AUTHORIZATIONS_FILTER_STRATEGY = config(
+    "AUTHORIZATIONS_FILTER_STRATEGY", default="case"
+)
+
+# Number of verified JWTs kept in memory per process, so that the signature of a
+# token is only checked once. Set to 0 to disable.
+JWT_CACHE_SIZE = config("JWT_CACHE_SIZE", default=1000)
+
+# Remote APIs are requested through a pooled session per service
+REMOTE_API_POOL_SIZE = config("REMOTE_API_POOL_SIZE", default=10)
+REMOTE_API_CONNECT_TIMEOUT = config("REMOTE_API_CONNECT_TIMEOUT", default=5.0)
+REMOTE_API_READ_TIMEOUT = config("REMOTE_API_READ_TIMEOUT", default=30.0)
+REMOTE_API_MAX_RETRIES = config("REMOTE_API_MAX_RETRIES", default=2)
+REMOTE_API_RETRY_BACKOFF = config("REMOTE_API_RETRY_BACKOFF", default=0.2)
+
+# Time in seconds remote objects are cached when the remote API does not send
+# caching headers. Can be overridden per service with the ``cache_timeout`` key
+# of its extra configuration.
+REMOTE_API_CACHE_TIMEOUT = config("REMOTE_API_CACHE_TIMEOUT", default=0)
+# Time in seconds a cached remote object may be used after it expired, when the
+# remote API is unavailable.
+REMOTE_API_STALE_IF_ERROR = config("REMOTE_API_STALE_IF_ERROR", default=60 * 60)
+# Circuit breaker per remote API: when at least REMOTE_API_CIRCUIT_ERROR_RATE of
+# the requests in the last REMOTE_API_CIRCUIT_WINDOW seconds failed or took longer
+# than REMOTE_API_CIRCUIT_SLOW_CALL seconds, requests to the API fail immediately
+# for REMOTE_API_CIRCUIT_RESET_TIMEOUT seconds.
+REMOTE_API_CIRCUIT_BREAKER = config("REMOTE_API_CIRCUIT_BREAKER", default=True)
+REMOTE_API_CIRCUIT_WINDOW = config("REMOTE_API_CIRCUIT_WINDOW", default=60)
+REMOTE_API_CIRCUIT_MIN_CALLS = config("REMOTE_API_CIRCUIT_MIN_CALLS", default=10)
+REMOTE_API_CIRCUIT_ERROR_RATE = config("REMOTE_API_CIRCUIT_ERROR_RATE", default=0.5)
+REMOTE_API_CIRCUIT_SLOW_CALL = config("REMOTE_API_CIRCUIT_SLOW_CALL", default=10.0)
+REMOTE_API_CIRCUIT_RESET_TIMEOUT = config(
+    "REMOTE_API_CIRCUIT_RESET_TIMEOUT", default=30
+)
+
 
 NLX_DIRECTORY_URLS = {
     NLXDirectories.demo: "https://directory.demo.nlx.io/",
     NLXDirectories.preprod: "https://directory.preprod.nlx.io/",
     NLXDirectories.prod: "https://directory.prod.nlx.io/",
 }
+# Time in seconds the list of services in the NLX directory is cached.
+NLX_DIRECTORY_CACHE_TIMEOUT = config("NLX_DIRECTORY_CACHE_TIMEOUT", default=60 * 60)
 
 CUSTOM_CLIENT_FETCHER = "openzaak.utils.auth.get_client"
+ZGW_CONSUMERS_CLIENT_CLASS = "openzaak.client.PooledClient"
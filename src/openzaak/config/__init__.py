@@ -0,0 +1 @@
+default_app_config = "openzaak.config.apps.ConfigConfig"
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ConfigConfig(AppConfig):
+    name = "openzaak.config"
+
+    def ready(self):
+        # load the signal receivers
+        from . import signals  # noqa
@@ -0,0 +1,239 @@
+"""
+In-process snapshots of the service configuration.
+
+Every API request is checked against the enabled state of its component.
+Rather than querying the database on each request, every process keeps the set
+of disabled API types in memory. Likewise, the external services are kept in
+memory, indexed by API root, to look up the service (and credentials) of
+remote URLs.
+
+The snapshots are reloaded when their version key in the shared cache changes.
+The keys are replaced whenever a service is saved, and expire after a short
+time so that processes pick up changes that bypassed the signals.
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+
+from zds_client.auth import ClientAuth
+from zgw_consumers.client import ZGWClient
+from zgw_consumers.models import Service
+
+from .models import InternalService
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "config:internal-services:version"
+SERVICES_VERSION_KEY = "config:services:version"
+VERSION_TIMEOUT = 60
+
+
+def _get_cache():
+    return caches["default"]
+
+
+def _get_version(key: str = VERSION_KEY) -> Optional[str]:
+    cache = _get_cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=VERSION_TIMEOUT)
+        version = cache.get(key)
+    return version
+
+
+class InternalServicesSnapshot:
+    def __init__(self):
+        self._state: Tuple[Optional[str], FrozenSet[str]] = (None, frozenset())
+
+    def _load(self, version: Optional[str]) -> FrozenSet[str]:
+        logger.debug("Loading the enabled state of the internal services")
+        disabled = frozenset(
+            InternalService.objects.filter(enabled=False).values_list(
+                "api_type", flat=True
+            )
+        )
+        self._state = (version, disabled)
+        return disabled
+
+    def is_enabled(self, api_type: str) -> bool:
+        # read the version before loading, so that changes made in the meantime
+        # trigger another reload
+        version = _get_version()
+        current_version, disabled = self._state
+        if version is None or version != current_version:
+            disabled = self._load(version)
+        return api_type not in disabled
+
+    def clear(self) -> None:
+        self._state = (None, frozenset())
+
+
+internal_services = InternalServicesSnapshot()
+
+
+def _get_origin(url: str) -> str:
+    return urlunsplit(urlsplit(url)[:2] + ("", "", ""))
+
+
+class ServicesIndex:
+    """
+    Resolve the external service of a URL by the longest matching API root.
+
+    The services are grouped by scheme and host, and ordered by the length of
+    their API root, like :meth:`Service.get_service` does in the database.
+    After a service is saved or deleted in the current transaction, the
+    database is used until the transaction ends, so that the uncommitted
+    changes are visible.
+
+    The JWTs generated for the services are reused for
+    ``REMOTE_API_TOKEN_TIMEOUT`` seconds.
+    """
+
+    def __init__(self):
+        self._state: Tuple[Optional[str], Dict[str, List[Service]]] = (None, {})
+        self._credentials = {}
+        self._lock = threading.Lock()
+
+    def _load(self, version: Optional[str]) -> Dict[str, List[Service]]:
+        logger.debug("Loading the external services")
+        index = defaultdict(list)
+        for service in Service.objects.all():
+            index[_get_origin(service.api_root)].append(service)
+        for candidates in index.values():
+            candidates.sort(key=lambda service: len(service.api_root), reverse=True)
+        index = dict(index)
+        self._state = (version, index)
+        return index
+
+    def get_service(self, url: str) -> Optional[Service]:
+        if _services_changed():
+            return Service.get_service(url)
+
+        version = _get_version(SERVICES_VERSION_KEY)
+        current_version, index = self._state
+        if version is None or version != current_version:
+            index = self._load(version)
+
+        for candidate in index.get(_get_origin(url), []):
+            if url.startswith(candidate.api_root):
+                return candidate
+        return None
+
+    def get_credentials(self, auth: ClientAuth) -> dict:
+        # the credentials are part of the key, so changes take effect at once
+        key = (
+            auth.client_id,
+            auth.secret,
+            auth.user_id,
+            auth.user_representation,
+            tuple(sorted(auth.claims.items())),
+        )
+        now = time.time()
+        with self._lock:
+            credentials, expires_at = self._credentials.get(key, (None, 0))
+        if credentials is None or expires_at <= now:
+            credentials = ClientAuth(
+                client_id=auth.client_id,
+                secret=auth.secret,
+                user_id=auth.user_id,
+                user_representation=auth.user_representation,
+                **auth.claims,
+            ).credentials()
+            expires_at = now + settings.REMOTE_API_TOKEN_TIMEOUT
+            with self._lock:
+                self._credentials = {
+                    key: value
+                    for key, value in self._credentials.items()
+                    if value[1] > now
+                }
+                self._credentials[key] = (credentials, expires_at)
+        return dict(credentials)
+
+    def get_auth_header(self, service: Service) -> dict:
+        return self.build_client(service).auth_header
+
+    def build_client(self, service: Service) -> ZGWClient:
+        client = service.build_client()
+        # the base URL is the NLX address of NLX services
+        client.api_root = service.api_root
+        if client.auth is not None:
+            client.auth = CachedClientAuth(
+                client_id=client.auth.client_id,
+                secret=client.auth.secret,
+                user_id=client.auth.user_id,
+                user_representation=client.auth.user_representation,
+                **client.auth.claims,
+            )
+        return client
+
+    def get_client(self, url: str) -> Optional[ZGWClient]:
+        service = self.get_service(url)
+        if service is None:
+            return None
+        return self.build_client(service)
+
+    def clear(self) -> None:
+        self._state = (None, {})
+        with self._lock:
+            self._credentials = {}
+
+
+services_index = ServicesIndex()
+
+
+class CachedClientAuth(ClientAuth):
+    """
+    Client auth reusing the JWT generated for the same credentials.
+    """
+
+    def credentials(self) -> dict:
+        return services_index.get_credentials(self)
+
+
+def _replace_version(key: str = VERSION_KEY) -> None:
+    _get_cache().set(key, uuid.uuid4().hex, timeout=VERSION_TIMEOUT)
+
+
+def invalidate_internal_services() -> None:
+    """
+    Reload the enabled state of the internal services in all processes.
+    """
+    _replace_version()
+    internal_services.clear()
+    transaction.on_commit(_replace_version)
+
+
+def _replace_services_version() -> None:
+    _replace_version(SERVICES_VERSION_KEY)
+
+
+def _services_changed() -> bool:
+    """
+    Check if services were saved or deleted in the current transaction.
+
+    The pending on-commit callback of :func:`invalidate_services` is the flag:
+    Django drops it when the transaction (or the savepoint it was registered
+    in) is committed or rolled back.
+    """
+    if not connection.in_atomic_block:
+        return False
+    return any(
+        func is _replace_services_version for _, func in connection.run_on_commit
+    )
+
+
+def invalidate_services() -> None:
+    """
+    Reload the external services in all processes.
+    """
+    _replace_services_version()
+    services_index.clear()
+    transaction.on_commit(_replace_services_version)
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from zgw_consumers.models import Service
+
+from .cache import invalidate_internal_services, invalidate_services
+from .models import InternalService
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=InternalService,
+    dispatch_uid="config.invalidate_internal_services",
+)
+def invalidate_internal_service(sender, **kwargs) -> None:
+    invalidate_internal_services()
+
+
+@receiver(
+    [post_save, post_delete], sender=Service, dispatch_uid="config.invalidate_services",
+)
+def invalidate_service(sender, **kwargs) -> None:
+    invalidate_services()
@@ -5,6 +5,7 @@ from vng_api_common.constants import ComponentTypes
 
 from openzaak.utils.tests import AdminTestMixin
 
+from ..cache import invalidate_internal_services
 from ..models import InternalService
 
 
@@ -12,6 +13,8 @@ class InternalServicesFormTests(AdminTestMixin, WebTest):
     def setUp(self):
         super().setUp()
         self.app.set_user(self.user)
+        # the snapshot must not keep the state of the rolled back test data
+        self.addCleanup(invalidate_internal_services)
 
     def test_autorisaties_enabled(self):
         autorisaties = InternalService.objects.get(api_type=ComponentTypes.ac)
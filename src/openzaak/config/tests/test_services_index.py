@@ -0,0 +1,167 @@
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from freezegun import freeze_time
+from zds_client.auth import ClientAuth
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openzaak.utils.tests import ClearCachesMixin
+
+from ..cache import services_index
+
+
+class ServicesIndexTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        # bypass the signals, so the services are treated like committed ones
+        cls.root, cls.service = Service.objects.bulk_create(
+            [
+                Service(
+                    api_root="https://example.com/",
+                    api_type=APITypes.orc,
+                    auth_type=AuthTypes.no_auth,
+                    label="root",
+                    oas="https://example.com/schema/openapi.yaml",
+                ),
+                Service(
+                    api_root="https://example.com/api/v1/",
+                    api_type=APITypes.ztc,
+                    auth_type=AuthTypes.zgw,
+                    label="ztc",
+                    client_id="client-id",
+                    secret="secret",
+                    oas="https://example.com/api/v1/schema/openapi.yaml",
+                ),
+            ]
+        )
+
+    def test_longest_api_root(self):
+        with self.assertNumQueries(1):
+            service = services_index.get_service("https://example.com/api/v1/foo")
+            root = services_index.get_service("https://example.com/other")
+            unknown = services_index.get_service("https://example.nl/api/v1/foo")
+
+        self.assertEqual(service, self.service)
+        self.assertEqual(root, self.root)
+        self.assertIsNone(unknown)
+
+    def test_index_used_in_transaction(self):
+        with transaction.atomic():
+            with self.assertNumQueries(1):
+                service = services_index.get_service("https://example.com/api/v1/")
+                root = services_index.get_service("https://example.com/other")
+
+        self.assertEqual(service, self.service)
+        self.assertEqual(root, self.root)
+
+    def test_uncommitted_services_visible(self):
+        with transaction.atomic():
+            services_index.get_service("https://example.com/api/v1/foo")
+
+            service = Service.objects.create(
+                api_root="https://example.com/api/v1/foo/",
+                api_type=APITypes.zrc,
+                auth_type=AuthTypes.no_auth,
+                label="zrc",
+            )
+
+            self.assertEqual(
+                services_index.get_service("https://example.com/api/v1/foo/bar"),
+                service,
+            )
+
+    def test_index_used_after_rollback(self):
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    Service.objects.create(
+                        api_root="https://example.com/api/v1/foo/",
+                        api_type=APITypes.zrc,
+                        auth_type=AuthTypes.no_auth,
+                        label="zrc",
+                    )
+                    raise ValueError
+            except ValueError:
+                pass
+
+            with self.assertNumQueries(1):
+                service = services_index.get_service(
+                    "https://example.com/api/v1/foo/bar"
+                )
+                services_index.get_service("https://example.com/api/v1/foo/bar")
+
+        self.assertEqual(service, self.service)
+
+    @override_settings(REMOTE_API_TOKEN_TIMEOUT=300)
+    def test_auth_header_reused_until_timeout(self):
+        with freeze_time("2020-01-01T12:00:00"):
+            header = services_index.get_auth_header(self.service)
+
+        with freeze_time("2020-01-01T12:04:00"):
+            self.assertEqual(services_index.get_auth_header(self.service), header)
+
+        with freeze_time("2020-01-01T12:05:30"):
+            self.assertNotEqual(services_index.get_auth_header(self.service), header)
+
+    def test_auth_header_changed_credentials(self):
+        header = services_index.get_auth_header(self.service)
+
+        self.service.secret = "other-secret"
+
+        self.assertNotEqual(services_index.get_auth_header(self.service), header)
+
+    def test_client_changed_credentials(self):
+        url = "https://example.com/api/v1/foo"
+        header = services_index.get_client(url).auth_header
+
+        Service.objects.filter(pk=self.service.pk).update(client_id="other-client-id")
+        # updates bypass the signals
+        services_index.clear()
+
+        client = services_index.get_client(url)
+
+        self.assertEqual(client.auth.client_id, "other-client-id")
+        self.assertNotEqual(client.auth_header, header)
+
+    def test_client_keeps_auth(self):
+        client = services_index.get_client("https://example.com/api/v1/foo")
+
+        self.assertIsInstance(client.auth, ClientAuth)
+        self.assertEqual(client.auth.client_id, "client-id")
+        self.assertEqual(client.auth.secret, "secret")
+        self.assertEqual(
+            client.auth_header, services_index.get_auth_header(self.service)
+        )
+
+
+class ServicesIndexCommitTests(ClearCachesMixin, TransactionTestCase):
+    def test_invalidated_on_commit(self):
+        service = Service.objects.create(
+            api_root="https://example.com/api/v1/",
+            api_type=APITypes.ztc,
+            auth_type=AuthTypes.no_auth,
+            label="ztc",
+        )
+        services_index.get_service("https://example.com/api/v1/foo")
+
+        with transaction.atomic():
+            other = Service.objects.create(
+                api_root="https://example.com/api/v1/foo/",
+                api_type=APITypes.zrc,
+                auth_type=AuthTypes.no_auth,
+                label="zrc",
+            )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                services_index.get_service("https://example.com/api/v1/foo/bar"), other,
+            )
+
+        other.delete()
+
+        self.assertEqual(
+            services_index.get_service("https://example.com/api/v1/foo/bar"), service
+        )
@@ -0,0 +1,184 @@
+"""
+Shared cache of remote API resources, following the HTTP caching semantics.
+
+Objects referenced by URL (zaaktypen in an external Catalogi API, for example)
+are requested over and over again. The responses are stored in the default
+cache for as long as the ``Cache-Control`` (or ``Expires``) headers of the
+remote API allow. Services can define a default lifetime for responses without
+these headers, through the ``cache_timeout`` key of their extra configuration.
+
+Expired responses with an ``ETag`` or ``Last-Modified`` header are revalidated
+with a conditional request, and if the remote API fails, a stale response is
+served for at most ``stale-if-error`` seconds.
+"""
+import hashlib
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from requests.structures import CaseInsensitiveDict
+from zgw_consumers.models import Service
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_KEY = "remote:resource:{digest}"
+
+# time in seconds resources with a validator are kept for revalidation
+REVALIDATE_TIMEOUT = 24 * 60 * 60
+
+
+def _get_cache():
+    return caches["default"]
+
+
+def _get_key(url: str) -> str:
+    digest = hashlib.md5(url.encode("utf-8")).hexdigest()
+    return RESOURCE_KEY.format(digest=digest)
+
+
+def parse_cache_control(header: str) -> Dict[str, Optional[str]]:
+    """
+    Parse a ``Cache-Control`` header into a mapping of directive to value.
+    """
+    directives = {}
+    for directive in header.split(","):
+        name, _, value = directive.strip().partition("=")
+        if not name:
+            continue
+        directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _get_seconds(directives: dict, name: str) -> Optional[int]:
+    value = directives.get(name)
+    if value is None or not value.isdigit():
+        return None
+    return int(value)
+
+
+class CachedResource:
+    """
+    A remote resource and the information needed to revalidate it.
+    """
+
+    def __init__(
+        self,
+        data: dict,
+        etag: str,
+        last_modified: str,
+        fresh_until: float,
+        stale_until: float,
+    ):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    @property
+    def can_serve_stale(self) -> bool:
+        return time.time() < self.stale_until
+
+    def get_conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def get_default_timeout(service: Optional[Service]) -> int:
+    if service is not None and "cache_timeout" in service.extra:
+        return int(service.extra["cache_timeout"])
+    return settings.REMOTE_API_CACHE_TIMEOUT
+
+
+def get_freshness_lifetime(
+    headers: Mapping[str, str], directives: dict, service: Optional[Service]
+) -> int:
+    if "no-cache" in directives:
+        return 0
+
+    max_age = _get_seconds(directives, "s-maxage")
+    if max_age is None:
+        max_age = _get_seconds(directives, "max-age")
+    if max_age is not None:
+        return max_age
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return max(int(parsedate_to_datetime(expires).timestamp() - time.time()), 0)
+        except (TypeError, ValueError):
+            # invalid dates mean the response is already expired
+            return 0
+
+    return get_default_timeout(service)
+
+
+def get(url: str) -> Optional[CachedResource]:
+    return _get_cache().get(_get_key(url))
+
+
+def store(
+    url: str, headers: Mapping[str, str], data: dict, service: Optional[Service]
+) -> Optional[CachedResource]:
+    """
+    Store the resource, if the response headers allow it.
+    """
+    directives = parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-store" in directives:
+        return None
+
+    lifetime = get_freshness_lifetime(headers, directives, service)
+    etag = headers.get("ETag", "")
+    last_modified = headers.get("Last-Modified", "")
+    if not lifetime and not etag and not last_modified:
+        return None
+
+    stale_if_error = _get_seconds(directives, "stale-if-error")
+    if stale_if_error is None:
+        stale_if_error = settings.REMOTE_API_STALE_IF_ERROR
+    if "must-revalidate" in directives or "proxy-revalidate" in directives:
+        stale_if_error = 0
+
+    now = time.time()
+    resource = CachedResource(
+        data=data,
+        etag=etag,
+        last_modified=last_modified,
+        fresh_until=now + lifetime,
+        stale_until=now + lifetime + stale_if_error,
+    )
+
+    timeout = lifetime + stale_if_error
+    if etag or last_modified:
+        timeout = max(timeout, lifetime + REVALIDATE_TIMEOUT)
+    _get_cache().set(_get_key(url), resource, timeout=timeout)
+    return resource
+
+
+def refresh(
+    url: str,
+    resource: CachedResource,
+    headers: Mapping[str, str],
+    service: Optional[Service],
+) -> CachedResource:
+    """
+    Update the stored resource after a ``304 Not Modified`` response.
+    """
+    logger.debug("Remote resource %s was not modified", url)
+    merged = CaseInsensitiveDict(
+        {"ETag": resource.etag, "Last-Modified": resource.last_modified}
+    )
+    merged.update(headers)
+    return store(url, merged, resource.data, service) or resource
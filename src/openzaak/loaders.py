@@ -1,7 +1,13 @@
 import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from inspect import getmembers
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 
+from django.conf import settings
 from django.db import models
 from django.db.models.base import ModelBase
 
@@ -11,35 +17,129 @@ from django_loose_fk.virtual_models import virtual_model_factory
 from djangorestframework_camel_case.util import underscoreize
 from vng_api_common.descriptors import GegevensGroepType
 
+logger = logging.getLogger(__name__)
 
-class AuthorizedRequestsLoader(BaseLoader):
+
+class IdentityMap(threading.local):
     """
-    Fetch external API objects with Authorization header.
+    Remote objects loaded during the current request, keyed by model and URL.
+
+    The same remote object is typically accessed several times during a request
+    (by validators, serializers and permission checks). Within an active scope,
+    each object is fetched and materialized only once.
+
+    URLs can also be deferred in batches (see :meth:`defer`): the first time one
+    of them is needed, the whole batch is fetched concurrently.
     """
 
-    @staticmethod
-    def fetch_object(url: str, do_underscoreize=True) -> dict:
-        from zgw_consumers.models import Service
+    def __init__(self):
+        self.objects = None
+        self.deferred = {}
+        self.hits = 0
+        self.misses = 0
 
-        # TODO should we replace it with Service.get_client() and use it instead of requests?
-        # but in this case we couldn't catch separate FetchJsonError
-        client_auth_header = Service.get_auth_header(url)
-        headers = client_auth_header or {}
+    @property
+    def active(self) -> bool:
+        return self.objects is not None
 
-        try:
-            response = requests.get(url, headers=headers)
-        except requests.exceptions.RequestException as exc:
-            raise FetchError(exc.args[0]) from exc
+    def get(self, url: str, model: ModelBase) -> Optional[models.Model]:
+        if self.objects is None:
+            return None
+
+        obj = self.objects.get((model, url))
+        if obj is not None:
+            self.hits += 1
+        return obj
+
+    def add(self, url: str, model: ModelBase, obj: models.Model) -> None:
+        if self.objects is None:
+            return
+
+        self.misses += 1
+        self.objects[(model, url)] = obj
+        self.deferred.pop((model, url), None)
+
+    def defer(self, loader: "AuthorizedRequestsLoader", model: ModelBase, urls) -> None:
+        """
+        Register remote objects that are likely to be needed in this scope.
+        """
+        if self.objects is None:
+            return
+
+        batch = (loader, model, frozenset(urls))
+        for url in batch[2]:
+            if (model, url) not in self.objects:
+                self.deferred[(model, url)] = batch
+
+    def load_deferred(self, url: str, model: ModelBase) -> None:
+        batch = self.deferred.get((model, url))
+        if batch is None:
+            return
+
+        loader, model, urls = batch
+        for key in [key for key, value in self.deferred.items() if value is batch]:
+            del self.deferred[key]
 
         try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:
-            raise FetchError(exc.args[0]) from exc
+            # the loaded objects are added to the identity map
+            for obj in loader.load_many(urls, model):
+                pass
+        except Exception:
+            # the objects that were not loaded are retried individually, so
+            # errors are raised for the object that is accessed
+            logger.debug("Loading deferred remote objects failed", exc_info=True)
 
+    def get_or_load(
+        self, url: str, model: ModelBase, load: Callable[[], models.Model]
+    ) -> models.Model:
+        obj = self.get(url, model)
+        if obj is not None:
+            return obj
+
+        self.load_deferred(url, model)
+        obj = self.get(url, model)
+        if obj is None:
+            obj = load()
+            self.add(url, model, obj)
+        return obj
+
+    @contextmanager
+    def scope(self):
+        if self.active:
+            # nested scopes share the outer scope
+            yield self
+            return
+
+        self.objects, self.deferred, self.hits, self.misses = {}, {}, 0, 0
         try:
-            data = response.json()
-        except json.JSONDecodeError as exc:
-            raise FetchJsonError(exc.args[0]) from exc
+            yield self
+        finally:
+            logger.debug(
+                "Remote objects identity map: %d hits, %d misses",
+                self.hits,
+                self.misses,
+            )
+            self.objects, self.deferred = None, {}
+
+
+identity_map = IdentityMap()
+
+
+class AuthorizedRequestsLoader(BaseLoader):
+    """
+    Fetch external API objects with Authorization header.
+    """
+
+    @staticmethod
+    def fetch_object(url: str, do_underscoreize=True) -> dict:
+        from openzaak import http_cache
+        from openzaak.config.cache import services_index
+
+        cached = http_cache.get(url)
+        if cached is not None and cached.is_fresh:
+            data = cached.data
+        else:
+            data = _fetch_remote_object(url, cached, services_index.get_service(url))
 
         if not do_underscoreize:
             return data
@@ -50,32 +150,201 @@ class AuthorizedRequestsLoader(BaseLoader):
         if self.is_local_url(url):
             return self.load_local_object(url, model)
 
+        return identity_map.get_or_load(
+            url, model, lambda: self.load_remote(url, model)
+        )
+
+    def get_remote_model(self, model: ModelBase) -> ModelBase:
+        """
+        Return the model remote objects are materialized as.
+        """
+        return model
+
+    def load_remote(self, url: str, model: ModelBase) -> models.Model:
         data = self.fetch_object(url)
+        return self.build_instance(model, data)
+
+    def build_instance(self, model: ModelBase, data: dict) -> models.Model:
         return get_model_instance_with_gegevensgroeps(model, data, loader=self)
 
+    def load_many(
+        self, urls: Iterable[str], model: ModelBase
+    ) -> Iterator[models.Model]:
+        """
+        Load the remote objects at ``urls``, fetching them concurrently.
+
+        The objects are yielded as they arrive. Closing the iterator early
+        cancels the requests that have not started yet.
+        """
+        urls = set(urls)
+        for url in sorted(urls):
+            obj = identity_map.get(url, model)
+            if obj is not None:
+                urls.remove(url)
+                yield obj
+
+        for url, data in fetch_objects(urls):
+            obj = self.build_instance(model, data)
+            identity_map.add(url, model, obj)
+            yield obj
+
+
+def fetch_objects(urls: Iterable[str]) -> Iterator[Tuple[str, dict]]:
+    """
+    Fetch remote objects concurrently, yielding ``(url, data)`` as they arrive.
+
+    At most ``REMOTE_API_POOL_SIZE`` requests are done at the same time. The
+    services are resolved upfront, so the worker threads don't use the database.
+    """
+    from openzaak import http_cache
+    from openzaak.config.cache import services_index
+
+    pending = {}
+    for url in urls:
+        cached = http_cache.get(url)
+        if cached is not None and cached.is_fresh:
+            yield url, underscoreize(cached.data)
+        else:
+            pending[url] = (cached, services_index.get_service(url))
+
+    if not pending:
+        return
+
+    max_workers = min(settings.REMOTE_API_POOL_SIZE, len(pending))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_remote_object, url, cached, service): url
+            for url, (cached, service) in pending.items()
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], underscoreize(future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _fetch_remote_object(url: str, cached, service) -> dict:
+    """
+    Request the remote object, revalidating the ``cached`` resource if present.
+    """
+    from openzaak import http_cache
+    from openzaak.circuit_breaker import CircuitOpenError
+    from openzaak.client import get_session, get_timeout, send_request
+    from openzaak.config.cache import services_index
+
+    # TODO should we replace it with Service.get_client() and use it instead of requests?
+    # but in this case we couldn't catch separate FetchJsonError
+    headers = services_index.get_auth_header(service) if service else {}
+    if cached is not None:
+        headers.update(cached.get_conditional_headers())
+
+    try:
+        response = send_request(
+            service.api_root if service else "",
+            get_session(service),
+            "GET",
+            url,
+            headers=headers,
+            timeout=get_timeout(),
+        )
+    except CircuitOpenError:
+        if cached is not None and cached.can_serve_stale:
+            logger.warning("Serving stale %s, the remote API is unavailable", url)
+            return cached.data
+        raise
+    except requests.exceptions.RequestException as exc:
+        if cached is not None and cached.can_serve_stale:
+            logger.warning("Serving stale %s, the request failed: %s", url, exc)
+            return cached.data
+        raise FetchError(exc.args[0]) from exc
+
+    if response.status_code == 304 and cached is not None:
+        return http_cache.refresh(url, cached, response.headers, service).data
+
+    if response.status_code >= 500 and cached is not None and cached.can_serve_stale:
+        logger.warning(
+            "Serving stale %s, the server responded with %s", url, response.status_code
+        )
+        return cached.data
+
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as exc:
+        raise FetchError(exc.args[0]) from exc
+
+    try:
+        data = response.json()
+    except json.JSONDecodeError as exc:
+        raise FetchJsonError(exc.args[0]) from exc
+
+    http_cache.store(url, response.headers, data, service)
+    return data
+
+
+class ModelMetadata:
+    """
+    The model information needed to materialize remote objects.
+    """
+
+    def __init__(self, model: ModelBase):
+        self.model = model
+        self._virtual_model = None
+
+        self.field_names = frozenset(
+            field.name for field in model._meta.get_fields() if not field.auto_created
+        ) | {"url"}
+
+        # map the gegevensgroep keys to the model fields
+        self.gegevensgroeps = tuple(
+            (name, {key: field.name for key, field in gegevensgroep.mapping.items()},)
+            for name, gegevensgroep in getmembers(model)
+            if isinstance(gegevensgroep, GegevensGroepType)
+        )
+
+    def get_virtual_model(self, loader) -> ModelBase:
+        # the virtual model is registered in the app registry on creation, so
+        # later calls return the same class, whatever the loader is
+        if self._virtual_model is None:
+            self._virtual_model = virtual_model_factory(self.model, loader=loader)
+        return self._virtual_model
+
+
+@lru_cache(maxsize=None)
+def get_model_metadata(model: ModelBase) -> ModelMetadata:
+    return ModelMetadata(model)
+
+
+def get_model_instance(model: ModelBase, data: Dict[str, Any], loader) -> models.Model:
+    """
+    Materialize the remote object, see :func:`django_loose_fk.virtual_models.get_model_instance`.
+    """
+    metadata = get_model_metadata(model)
+    initial_data = data.copy()
+
+    # only keep known fields
+    data = {key: value for key, value in data.items() if key in metadata.field_names}
+
+    virtual_model = metadata.get_virtual_model(loader)
+    return virtual_model(initial_data=initial_data, **data)
+
 
 def get_model_instance_with_gegevensgroeps(
     model: ModelBase, data: Dict[str, Any], loader
 ) -> models.Model:
-    field_names = [
-        field.name for field in model._meta.get_fields() if not field.auto_created
-    ] + ["url"]
+    metadata = get_model_metadata(model)
     initial_data = data.copy()
 
     # modify data to include gegevensgroeps members
-    gegevensgroeps = [
-        (a, b) for a, b in getmembers(model) if isinstance(b, GegevensGroepType)
-    ]
-    for gegevensgroep__name, gegevensgroep in gegevensgroeps:
+    for gegevensgroep__name, mapping in metadata.gegevensgroeps:
         if gegevensgroep__name in data:
             group_data = data.pop(gegevensgroep__name)
 
             for field, field_value in group_data.items():
-                field_name = gegevensgroep.mapping[field].name
-                data[field_name] = field_value
+                data[mapping[field]] = field_value
 
     # only keep known fields
-    data = {key: value for key, value in data.items() if key in field_names}
+    data = {key: value for key, value in data.items() if key in metadata.field_names}
 
-    virtual_model = virtual_model_factory(model, loader=loader)
+    virtual_model = metadata.get_virtual_model(loader)
     return virtual_model(initial_data=initial_data, **data)
@@ -0,0 +1,440 @@
+import json
+import math
+import random
+import statistics
+import time
+import uuid
+from itertools import cycle
+from typing import List
+
+from django.apps import apps
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.translation import ugettext_lazy as _
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import generate_jwt_auth
+
+from openzaak.components.autorisaties.cache import invalidate_authorizations_cache
+from openzaak.components.autorisaties.index import CompiledAutorisatie
+from openzaak.components.besluiten.api.scopes import SCOPE_BESLUITEN_ALLES_LEZEN
+from openzaak.components.documenten.api.scopes import SCOPE_DOCUMENTEN_ALLES_LEZEN
+from openzaak.components.zaken.api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from openzaak.utils import build_absolute_url
+from openzaak.utils.constants import AuthorizationsFilterStrategies
+
+CLIENT_ID = "benchmark-authorization-filters"
+
+RESOURCES = {
+    "zaken": ("zaak-list", "zaken.Zaak", ComponentTypes.zrc),
+    "statussen": ("status-list", "zaken.Status", ComponentTypes.zrc),
+    "enkelvoudiginformatieobjecten": (
+        "enkelvoudiginformatieobject-list",
+        "documenten.EnkelvoudigInformatieObject",
+        ComponentTypes.drc,
+    ),
+    "besluiten": ("besluit-list", "besluiten.Besluit", ComponentTypes.brc),
+}
+
+COMPONENTS = {
+    ComponentTypes.zrc: (
+        "catalogi.ZaakType",
+        "zaaktypen",
+        "zaaktype",
+        SCOPE_ZAKEN_ALLES_LEZEN,
+    ),
+    ComponentTypes.drc: (
+        "catalogi.InformatieObjectType",
+        "informatieobjecttypen",
+        "informatieobjecttype",
+        SCOPE_DOCUMENTEN_ALLES_LEZEN,
+    ),
+    ComponentTypes.brc: (
+        "catalogi.BesluitType",
+        "besluittypen",
+        "besluittype",
+        SCOPE_BESLUITEN_ALLES_LEZEN,
+    ),
+}
+
+EXTERNAL_TYPE_URL = "https://catalogi.example.com/api/v1/{resource}/{uuid}"
+
+
+def percentile(values: list, percent: int) -> float:
+    """
+    Nearest-rank percentile of ``values``.
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the authorization filter strategies of the list endpoints for a "
+        "growing number of authorizations. The filtered querysets are measured, "
+        "or the complete endpoints with --endpoints. Run this against a database "
+        "with a representative data set, or generate one with --generate. Any "
+        "changes are rolled back afterwards, unless --keep is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resources",
+            nargs="+",
+            choices=list(RESOURCES),
+            default=list(RESOURCES),
+            help=_("The resources to filter"),
+        )
+        parser.add_argument(
+            "--authorizations",
+            type=int,
+            nargs="+",
+            default=[1, 10, 100, 500, 1000],
+            help=_("Numbers of authorizations per component to measure"),
+        )
+        parser.add_argument(
+            "--strategies",
+            nargs="+",
+            choices=AuthorizationsFilterStrategies.values,
+            default=list(AuthorizationsFilterStrategies.values),
+            help=_("The authorization filter strategies to compare"),
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help=_("Number of measurements per resource and strategy"),
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=100,
+            help=_("Number of objects fetched per query, as in a list page"),
+        )
+        parser.add_argument(
+            "--endpoints",
+            action="store_true",
+            help=_(
+                "Measure the list endpoints instead of the filtered querysets, "
+                "including the query count"
+            ),
+        )
+        parser.add_argument(
+            "--generate",
+            action="store_true",
+            help=_("Generate the test data instead of using the existing data"),
+        )
+        parser.add_argument(
+            "--zaaktypen",
+            type=int,
+            default=50,
+            help=_(
+                "Number of zaaktypen to generate, the same number of "
+                "informatieobjecttypen and besluittypen is generated"
+            ),
+        )
+        parser.add_argument(
+            "--zaken",
+            type=int,
+            default=1000,
+            help=_(
+                "Number of zaken to generate, each with a status. The same number "
+                "of documenten and besluiten is generated"
+            ),
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help=_("Seed for the generated data")
+        )
+        parser.add_argument(
+            "--keep", action="store_true", help=_("Keep the generated data"),
+        )
+        parser.add_argument(
+            "--json", action="store_true", help=_("Output the results as JSON"),
+        )
+
+    def handle(self, **options):
+        random.seed(options["seed"])
+        if options["generate"]:
+            try:
+                import factory.random
+            except ImportError:
+                raise CommandError(
+                    "The test data is generated with factory_boy, which is part of "
+                    "the development requirements."
+                )
+            factory.random.reseed_random(options["seed"])
+
+        try:
+            with transaction.atomic():
+                results = self.run(options)
+                if not options["keep"]:
+                    raise Rollback
+        except Rollback:
+            pass
+        finally:
+            invalidate_authorizations_cache()
+
+        output = {
+            "parameters": {
+                key: options[key]
+                for key in (
+                    "resources",
+                    "authorizations",
+                    "strategies",
+                    "repeat",
+                    "page_size",
+                    "endpoints",
+                    "generate",
+                    "zaaktypen",
+                    "zaken",
+                    "seed",
+                )
+            },
+            "results": results,
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(output, indent=2))
+            return
+
+        columns = [
+            "resource",
+            "authorizations",
+            "strategy",
+            "count",
+            "p50_ms",
+            "p95_ms",
+            "queries",
+        ]
+        self.stdout.write("\t".join(columns))
+        for result in results:
+            self.stdout.write("\t".join(str(result[column]) for column in columns))
+
+    def run(self, options: dict) -> list:
+        if options["generate"]:
+            types = self.generate_data(options["zaaktypen"], options["zaken"])
+        else:
+            types = self.get_existing_types(max(options["authorizations"]))
+
+        JWTSecret.objects.update_or_create(
+            identifier=CLIENT_ID, defaults={"secret": uuid.uuid4().hex}
+        )
+        applicatie = Applicatie.objects.create(
+            client_ids=[CLIENT_ID], label="Authorization filters benchmark"
+        )
+
+        results = []
+        for number in options["authorizations"]:
+            autorisaties = self.set_autorisaties(applicatie, types, number)
+            client = self.get_client()
+
+            for strategy in options["strategies"]:
+                with override_settings(AUTHORIZATIONS_FILTER_STRATEGY=strategy):
+                    for resource in options["resources"]:
+                        if options["endpoints"]:
+                            result = self.measure(client, resource, options["repeat"])
+                        else:
+                            result = self.measure_queryset(
+                                resource,
+                                autorisaties,
+                                options["repeat"],
+                                options["page_size"],
+                            )
+                        results.append(
+                            {
+                                "resource": resource,
+                                "authorizations": number,
+                                "strategy": strategy,
+                                **result,
+                            }
+                        )
+
+        return results
+
+    def get_existing_types(self, number: int) -> dict:
+        """
+        Use the existing types for the authorizations.
+        """
+        return {
+            component: list(apps.get_model(config[0]).objects.order_by("pk")[:number])
+            for component, config in COMPONENTS.items()
+        }
+
+    def generate_data(self, number_of_types: int, number_of_objects: int) -> dict:
+        from openzaak.components.besluiten.tests.factories import BesluitFactory
+        from openzaak.components.catalogi.tests.factories import (
+            BesluitTypeFactory,
+            CatalogusFactory,
+            InformatieObjectTypeFactory,
+            StatusTypeFactory,
+            ZaakTypeFactory,
+        )
+        from openzaak.components.documenten.tests.factories import (
+            EnkelvoudigInformatieObjectFactory,
+        )
+        from openzaak.components.zaken.tests.factories import StatusFactory
+
+        self.stderr.write("Generating test data...")
+
+        catalogus = CatalogusFactory.create()
+        zaaktypen = ZaakTypeFactory.create_batch(
+            number_of_types, catalogus=catalogus, concept=False
+        )
+        statustypen = [
+            StatusTypeFactory.create(zaaktype=zaaktype) for zaaktype in zaaktypen
+        ]
+        informatieobjecttypen = InformatieObjectTypeFactory.create_batch(
+            number_of_types, catalogus=catalogus, concept=False
+        )
+        besluittypen = [
+            BesluitTypeFactory.create(
+                catalogus=catalogus, concept=False, zaaktypen=[zaaktype]
+            )
+            for zaaktype in zaaktypen
+        ]
+
+        vertrouwelijkheidaanduidingen = list(VertrouwelijkheidsAanduiding.values)
+        for i in range(number_of_objects):
+            index = random.randrange(number_of_types)
+            StatusFactory.create(
+                statustype=statustypen[index],
+                zaak__zaaktype=zaaktypen[index],
+                zaak__vertrouwelijkheidaanduiding=random.choice(
+                    vertrouwelijkheidaanduidingen
+                ),
+            )
+            EnkelvoudigInformatieObjectFactory.create(
+                identificatie=uuid.uuid4().hex,
+                informatieobjecttype=random.choice(informatieobjecttypen),
+                vertrouwelijkheidaanduiding=random.choice(
+                    vertrouwelijkheidaanduidingen
+                ),
+                inhoud="",
+            )
+            BesluitFactory.create(besluittype=random.choice(besluittypen))
+
+        return {
+            ComponentTypes.zrc: zaaktypen,
+            ComponentTypes.drc: informatieobjecttypen,
+            ComponentTypes.brc: besluittypen,
+        }
+
+    def set_autorisaties(
+        self, applicatie: Applicatie, types: dict, number: int
+    ) -> List[Autorisatie]:
+        """
+        Replace the autorisaties of the applicatie with ``number`` autorisaties
+        per component, for the given types completed with external types.
+        """
+        applicatie.autorisaties.all().delete()
+
+        max_vas = cycle(VertrouwelijkheidsAanduiding.values)
+        autorisaties = []
+        for component, objs in types.items():
+            resource, field, scope = COMPONENTS[component][1:]
+            urls = [build_absolute_url(obj.get_absolute_api_url()) for obj in objs]
+            urls = urls[:number] + [
+                EXTERNAL_TYPE_URL.format(resource=resource, uuid=uuid.uuid4())
+                for i in range(number - len(urls))
+            ]
+            autorisaties += [
+                Autorisatie(
+                    applicatie=applicatie,
+                    component=component,
+                    scopes=[str(scope)],
+                    max_vertrouwelijkheidaanduiding=next(max_vas),
+                    **{field: url},
+                )
+                for url in urls
+            ]
+
+        Autorisatie.objects.bulk_create(autorisaties)
+        # bulk_create does not emit signals
+        invalidate_authorizations_cache()
+        return autorisaties
+
+    def get_client(self) -> Client:
+        secret = JWTSecret.objects.get(identifier=CLIENT_ID).secret
+        return Client(
+            HTTP_AUTHORIZATION=generate_jwt_auth(CLIENT_ID, secret),
+            HTTP_ACCEPT_CRS="EPSG:4326",
+            HTTP_HOST=Site.objects.get_current().domain,
+        )
+
+    def measure(self, client: Client, resource: str, repeat: int) -> dict:
+        url = reverse(RESOURCES[resource][0], kwargs={"version": "1"})
+
+        # warm up the caches
+        response = client.get(url)
+        if response.status_code != 200:
+            raise CommandError(
+                f"Unexpected response for {url}: {response.status_code} "
+                f"{response.content[:500]}"
+            )
+
+        timings = []
+        queries = []
+        for i in range(repeat):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                client.get(url)
+                timings.append((time.perf_counter() - start) * 1000)
+            queries.append(len(context.captured_queries))
+
+        return {
+            "count": response.json()["count"],
+            "p50_ms": round(percentile(timings, 50), 2),
+            "p95_ms": round(percentile(timings, 95), 2),
+            "mean_ms": round(statistics.mean(timings), 2),
+            "queries": max(queries),
+        }
+
+    def measure_queryset(
+        self,
+        resource: str,
+        autorisaties: List[Autorisatie],
+        repeat: int,
+        page_size: int,
+    ) -> dict:
+        view_name, model, component = RESOURCES[resource]
+        scope = COMPONENTS[component][3]
+        queryset = apps.get_model(model).objects.filter_for_authorizations(
+            scope,
+            [
+                CompiledAutorisatie(autorisatie)
+                for autorisatie in autorisaties
+                if autorisatie.component == component
+            ],
+        )
+
+        sql, params = queryset.query.sql_with_params()
+        timings = []
+        queries = []
+        for i in range(repeat):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                count = queryset.count()
+                list(queryset.order_by("-pk").values_list("pk", flat=True)[:page_size])
+                timings.append((time.perf_counter() - start) * 1000)
+            queries.append(len(context.captured_queries))
+
+        return {
+            "count": count,
+            "sql_length": len(sql),
+            "sql_params": len(params),
+            "p50_ms": round(percentile(timings, 50), 2),
+            "p95_ms": round(percentile(timings, 95), 2),
+            "mean_ms": round(statistics.mean(timings), 2),
+            "queries": max(queries),
+        }
@@ -0,0 +1,95 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils.translation import ugettext_lazy as _
+
+from djangorestframework_camel_case.util import underscoreize
+
+from openzaak.components.documenten.loaders import EIOLoader
+from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.documenten.tests.utils import get_eio_response
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.utils import get_zaak_response
+from openzaak.loaders import AuthorizedRequestsLoader
+
+ZAAK = "https://zaken.example.com/api/v1/zaken/d781cd1b-f100-4051-9543-153b93299da4"
+ZAAKTYPE = (
+    "https://catalogi.example.com/api/v1/zaaktypen/b71f72ef-198d-44d8-af64-ae1932df830a"
+)
+EIO = (
+    "https://documenten.example.com/api/v1/enkelvoudiginformatieobjecten/"
+    "1a1f8c3a-7e3c-4d0b-9c52-4b4b6a6fbb4e"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how many remote objects per second are materialized into "
+        "virtual model instances. No network requests are made."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=10000,
+            help=_("Number of objects to materialize per measurement"),
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help=_("Number of measurements"),
+        )
+        parser.add_argument(
+            "--json", action="store_true", help=_("Output the results as JSON"),
+        )
+
+    def measure(self, build, payload: dict, number: int, repeat: int) -> dict:
+        # materialize once, so the one-off costs are not measured
+        build(underscoreize(payload))
+
+        rates = []
+        for i in range(repeat):
+            payloads = [underscoreize(payload) for j in range(number)]
+            start = time.perf_counter()
+            for data in payloads:
+                build(data)
+            rates.append(number / (time.perf_counter() - start))
+
+        return {
+            "objects_per_second": round(max(rates)),
+            "us_per_object": round(1_000_000 / max(rates), 2),
+        }
+
+    def handle(self, **options):
+        zaak_loader = AuthorizedRequestsLoader()
+        eio_loader = EIOLoader()
+
+        cases = {
+            "zaak": (
+                lambda data: zaak_loader.build_instance(Zaak, data),
+                get_zaak_response(ZAAK, ZAAKTYPE),
+            ),
+            "enkelvoudiginformatieobject": (
+                lambda data: eio_loader.build_instance(
+                    EnkelvoudigInformatieObject, data
+                ),
+                get_eio_response(EIO),
+            ),
+        }
+
+        results = [
+            {
+                "resource": resource,
+                **self.measure(build, payload, options["number"], options["repeat"]),
+            }
+            for resource, (build, payload) in cases.items()
+        ]
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        columns = ["resource", "objects_per_second", "us_per_object"]
+        self.stdout.write("\t".join(columns))
+        for result in results:
+            self.stdout.write("\t".join(str(result[column]) for column in columns))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+
+import requests
+
+from openzaak.nlx.api import get_services
+
+
+class Command(BaseCommand):
+    help = "Fetch the services from the configured NLX directory and cache them"
+
+    def handle(self, **options):
+        try:
+            services = get_services(refresh=True)
+        except requests.RequestException as exc:
+            raise CommandError(f"Failed fetching the NLX directory: {exc}") from exc
+
+        self.stdout.write(self.style.SUCCESS(f"Cached {len(services)} NLX services"))
@@ -0,0 +1,31 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.utils.translation import ugettext_lazy as _
+
+from openzaak.metrics import collect, to_prometheus
+
+
+class Command(BaseCommand):
+    help = (
+        "Output the latency and error metrics of the requests to remote APIs, "
+        "in the Prometheus text format"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--json", action="store_true", help=_("Output the metrics as JSON"),
+        )
+
+    def handle(self, **options):
+        results = collect()
+
+        if options["json"]:
+            for result in results:
+                result["buckets"] = [
+                    [str(bound), count] for bound, count in result["buckets"]
+                ]
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(to_prometheus(results), ending="")
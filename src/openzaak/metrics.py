@@ -0,0 +1,182 @@
+"""
+Latency and error metrics of the requests to remote APIs.
+
+The metrics are counted per API root in memory, and added to the counters in
+the default cache every ``FLUSH_INTERVAL`` seconds, so they are shared by all
+processes without a cache round trip per request. The ``remote_api_metrics``
+management command outputs them in the Prometheus text format.
+
+Each API root is registered under its own key. The metrics are collected for
+the API roots of the configured services.
+"""
+import atexit
+import hashlib
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+from django.core.cache import caches
+
+from zgw_consumers.models import Service
+
+# upper bounds of the latency buckets, in seconds
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+ROOT_KEY = "metrics:remote-api:{digest}:root"
+METRIC_KEY = "metrics:remote-api:{digest}:{name}"
+
+# seconds between the flushes of the counts of a process to the cache
+FLUSH_INTERVAL = 10
+
+
+def _get_cache():
+    return caches["default"]
+
+
+def _get_digest(api_root: str) -> str:
+    return hashlib.md5(api_root.encode("utf-8")).hexdigest()
+
+
+def _get_key(api_root: str, name: str) -> str:
+    return METRIC_KEY.format(digest=_get_digest(api_root), name=name)
+
+
+def _get_root_key(api_root: str) -> str:
+    return ROOT_KEY.format(digest=_get_digest(api_root))
+
+
+def _incr(key: str, delta: int = 1) -> None:
+    cache = _get_cache()
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key, delta)
+
+
+class Counters:
+    """
+    Count the requests of this process until they are flushed to the cache.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, Counter] = defaultdict(Counter)
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, api_root: str, duration: float, error: bool) -> None:
+        bucket = next(i for i, bound in enumerate(BUCKETS) if duration <= bound)
+        with self._lock:
+            counts = self._pending[api_root]
+            counts[f"bucket:{bucket}"] += 1
+            counts["count"] += 1
+            counts["sum_ms"] += int(duration * 1000)
+            counts["errors"] += int(error)
+            due = time.monotonic() - self._flushed_at >= FLUSH_INTERVAL
+
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(Counter)
+            self._flushed_at = time.monotonic()
+
+        cache = _get_cache()
+        for api_root, counts in pending.items():
+            cache.add(_get_root_key(api_root), api_root, timeout=None)
+            for name, delta in counts.items():
+                if delta:
+                    _incr(_get_key(api_root, name), delta)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending = defaultdict(Counter)
+            self._flushed_at = time.monotonic()
+
+
+counters = Counters()
+atexit.register(counters.flush)
+
+
+def observe(api_root: str, duration: float, error: bool) -> None:
+    """
+    Count a request to the remote API and its duration in seconds.
+    """
+    counters.add(api_root, duration, error)
+
+
+def collect() -> List[dict]:
+    """
+    Return the metrics per API root, with cumulative bucket counts.
+    """
+    counters.flush()
+
+    cache = _get_cache()
+    api_roots = Service.objects.values_list("api_root", flat=True)
+    registered = cache.get_many([_get_root_key(api_root) for api_root in api_roots])
+
+    results = []
+    for api_root in sorted(registered.values()):
+        names = [f"bucket:{i}" for i in range(len(BUCKETS))] + [
+            "count",
+            "sum_ms",
+            "errors",
+        ]
+        values = cache.get_many([_get_key(api_root, name) for name in names])
+
+        def get(name: str) -> int:
+            return values.get(_get_key(api_root, name)) or 0
+
+        cumulative = 0
+        buckets = []
+        for i, bound in enumerate(BUCKETS):
+            cumulative += get(f"bucket:{i}")
+            buckets.append((bound, cumulative))
+
+        results.append(
+            {
+                "api_root": api_root,
+                "buckets": buckets,
+                "count": get("count"),
+                "sum": get("sum_ms") / 1000,
+                "errors": get("errors"),
+            }
+        )
+    return results
+
+
+def to_prometheus(results: List[dict]) -> str:
+    lines = [
+        "# HELP openzaak_remote_api_request_duration_seconds "
+        "Duration of requests to remote APIs.",
+        "# TYPE openzaak_remote_api_request_duration_seconds histogram",
+    ]
+    for result in results:
+        label = f'api_root="{result["api_root"]}"'
+        for bound, count in result["buckets"]:
+            le = "+Inf" if bound == float("inf") else str(bound)
+            lines.append(
+                f"openzaak_remote_api_request_duration_seconds_bucket"
+                f'{{{label},le="{le}"}} {count}'
+            )
+        lines.append(
+            f"openzaak_remote_api_request_duration_seconds_count{{{label}}} "
+            f"{result['count']}"
+        )
+        lines.append(
+            f"openzaak_remote_api_request_duration_seconds_sum{{{label}}} "
+            f"{result['sum']}"
+        )
+
+    lines += [
+        "# HELP openzaak_remote_api_errors_total " "Failed requests to remote APIs.",
+        "# TYPE openzaak_remote_api_errors_total counter",
+    ]
+    for result in results:
+        lines.append(
+            f'openzaak_remote_api_errors_total{{api_root="{result["api_root"]}"}} '
+            f"{result['errors']}"
+        )
+    return "\n".join(lines) + "\n"
@@ -1,5 +1,6 @@
 import requests
-from zgw_consumers.models import Service
+
+from openzaak.config.cache import services_index
 
 
 def fetcher(url: str, *args, **kwargs):
@@ -7,7 +8,7 @@ def fetcher(url: str, *args, **kwargs):
     Fetch the URL using requests.
     If the NLX address is configured, rewrite absolute url to NLX url.
     """
-    service = Service.get_service(url)
+    service = services_index.get_service(url)
     if service and service.nlx:
         # rewrite url
         url = url.replace(service.api_root, service.nlx, 1)
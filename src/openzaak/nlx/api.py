@@ -1,15 +1,41 @@
+"""
+Cached access to the NLX directory.
+"""
 from typing import List
 
+from django.conf import settings
+
 import requests
 
+from openzaak.client import get_timeout
 from openzaak.config.models import NLXConfig
+from openzaak.utils.decorators import get_cached_value
+
+DIRECTORY_KEY = "nlx:directory:{directory}"
+
+# expired listings are used for at most a day while they're being refreshed
+STALE_TIMEOUT = 60 * 60 * 24
 
 
-def get_services() -> List[dict]:
-    directory = NLXConfig.get_solo().directory_url
-    url = f"{directory}api/directory/list-services"
+def _fetch_services(directory_url: str) -> List[dict]:
+    url = f"{directory_url}api/directory/list-services"
 
-    response = requests.get(url)
+    response = requests.get(url, timeout=get_timeout())
     response.raise_for_status()
 
     return response.json()["services"]
+
+
+def get_services(refresh: bool = False) -> List[dict]:
+    """
+    Return the services in the NLX directory, cached for
+    ``NLX_DIRECTORY_CACHE_TIMEOUT`` seconds.
+    """
+    config = NLXConfig.get_solo()
+    return get_cached_value(
+        DIRECTORY_KEY.format(directory=config.directory),
+        lambda: _fetch_services(config.directory_url),
+        timeout=settings.NLX_DIRECTORY_CACHE_TIMEOUT,
+        stale_timeout=STALE_TIMEOUT,
+        refresh=refresh,
+    )
@@ -1,7 +1,11 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union
 from urllib.parse import parse_qs, urlparse
 
-from openzaak.utils.decorators import cache, cache_uuid
+from django.conf import settings
+
+from openzaak.utils.decorators import cache, cache_uuid, get_cached_value
 
 from .models import ReferentieLijstConfig
 
@@ -10,8 +14,11 @@ from .models import ReferentieLijstConfig
 JsonPrimitive = Union[str, int, float, bool]
 ResultList = List[Dict[str, JsonPrimitive]]
 
+# expired results are served for at most a week while they're being refreshed
+STALE_TIMEOUT = 60 * 60 * 24 * 7
+
 
-@cache("selectielijst:procestypen", timeout=60 * 60 * 24)
+@cache("selectielijst:procestypen", timeout=60 * 60 * 24, stale_timeout=STALE_TIMEOUT)
 def get_procestypen() -> ResultList:
     """
     Fetch a list of Procestypen.
@@ -22,39 +29,103 @@ def get_procestypen() -> ResultList:
     return client.list("procestype")
 
 
-def get_resultaten(proces_type: Optional[str] = None) -> ResultList:
-    """
-    Fetch the Selectielijst resultaten
-
-    Optionally filtered by a procestype URL.
-
-    Results are cached for 24 hours.
-    """
+def _get_resultaten_key(proces_type: Optional[str]) -> str:
     key = "selectielijst:resultaten"
     if proces_type:
         uuid = proces_type.split("/")[-1]
         key = f"{key}:pt-{uuid}"
+    return key
+
+
+def _fetch_resultaten(proces_type: Optional[str]) -> ResultList:
+    query_params = {}
+    if proces_type:
+        query_params["procesType"] = proces_type
+
+    client = ReferentieLijstConfig.get_client()
+    result_list = client.list("resultaat", query_params=query_params)
+    results = result_list["results"]
 
-    @cache(key, timeout=60 * 60 * 24)
-    def inner():
-        query_params = {}
-        if proces_type:
-            query_params["procesType"] = proces_type
+    # the remaining pages follow from the count and the page size
+    num_pages = 1
+    if result_list["next"] and results:
+        num_pages = math.ceil(result_list["count"] / len(results))
 
-        client = ReferentieLijstConfig.get_client()
-        result_list = client.list("resultaat", query_params=query_params)
-        results = result_list["results"]
-        while result_list["next"]:
-            parsed = urlparse(result_list["next"])
-            query = parse_qs(parsed.query)
-            result_list = client.list("resultaat", query_params=query)
-            results += result_list["results"]
-        return results
+    if num_pages > 1:
+        query = parse_qs(urlparse(result_list["next"]).query)
 
-    return inner()
+        def get_page(page: int) -> dict:
+            return client.list("resultaat", query_params={**query, "page": [str(page)]})
 
+        max_workers = min(settings.REMOTE_API_POOL_SIZE, num_pages - 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for result_list in executor.map(get_page, range(2, num_pages + 1)):
+                results += result_list["results"]
 
-@cache("referentielijsten:resultaattypeomschrijvinggeneriek", timeout=60 * 60)
+    # follow the links in case the count was off
+    while result_list["next"]:
+        parsed = urlparse(result_list["next"])
+        query = parse_qs(parsed.query)
+        result_list = client.list("resultaat", query_params=query)
+        results += result_list["results"]
+    return results
+
+
+def get_resultaten(
+    proces_type: Optional[str] = None, refresh: bool = False
+) -> ResultList:
+    """
+    Fetch the Selectielijst resultaten
+
+    Optionally filtered by a procestype URL. The pages are fetched concurrently.
+
+    Results are cached for 24 hours, unless ``refresh`` is given.
+    """
+    return get_cached_value(
+        _get_resultaten_key(proces_type),
+        lambda: _fetch_resultaten(proces_type),
+        timeout=60 * 60 * 24,
+        stale_timeout=STALE_TIMEOUT,
+        refresh=refresh,
+    )
+
+
+def warm_cache() -> Dict[str, int]:
+    """
+    Fetch all the lists and store them in the cache.
+
+    The resultaten per procestype are taken from the list of all resultaten, so
+    no request is done per procestype.
+    """
+    procestypen = get_procestypen.refresh()
+    resultaten = get_resultaten(refresh=True)
+    omschrijvingen = get_resultaattype_omschrijvingen.refresh()
+
+    per_procestype = {procestype["url"]: [] for procestype in procestypen}
+    for resultaat in resultaten:
+        per_procestype.setdefault(resultaat["procesType"], []).append(resultaat)
+
+    for proces_type, _resultaten in per_procestype.items():
+        get_cached_value(
+            _get_resultaten_key(proces_type),
+            lambda: _resultaten,
+            timeout=60 * 60 * 24,
+            stale_timeout=STALE_TIMEOUT,
+            refresh=True,
+        )
+
+    return {
+        "procestypen": len(procestypen),
+        "resultaten": len(resultaten),
+        "resultaattypeomschrijvingen": len(omschrijvingen),
+    }
+
+
+@cache(
+    "referentielijsten:resultaattypeomschrijvinggeneriek",
+    timeout=60 * 60,
+    stale_timeout=STALE_TIMEOUT,
+)
 def get_resultaattype_omschrijvingen() -> ResultList:
     """
     Fetch a list of generic resultaattype omschrijvingen.
@@ -65,7 +136,9 @@ def get_resultaattype_omschrijvingen() -> ResultList:
     return client.list("resultaattypeomschrijvinggeneriek")
 
 
-@cache_uuid("selectielijst:procestypen", timeout=60 * 60 * 24)
+@cache_uuid(
+    "selectielijst:procestypen", timeout=60 * 60 * 24, stale_timeout=STALE_TIMEOUT
+)
 def retrieve_procestype(url: str) -> Dict[str, JsonPrimitive]:
     """
     Fetch a procestype.
@@ -76,7 +149,9 @@ def retrieve_procestype(url: str) -> Dict[str, JsonPrimitive]:
     return client.retrieve("procestype", url)
 
 
-@cache_uuid("selectielijst:resultaten", timeout=60 * 60 * 24)
+@cache_uuid(
+    "selectielijst:resultaten", timeout=60 * 60 * 24, stale_timeout=STALE_TIMEOUT
+)
 def retrieve_resultaat(url: str) -> Dict[str, JsonPrimitive]:
     """
     Fetch a resultaat
@@ -87,7 +162,11 @@ def retrieve_resultaat(url: str) -> Dict[str, JsonPrimitive]:
     return client.retrieve("resultaat", url)
 
 
-@cache_uuid("referentielijsten:resultaattypeomschrijvinggeneriek", timeout=60 * 60)
+@cache_uuid(
+    "referentielijsten:resultaattypeomschrijvinggeneriek",
+    timeout=60 * 60,
+    stale_timeout=STALE_TIMEOUT,
+)
 def retrieve_resultaattype_omschrijvingen(url: str) -> Dict[str, JsonPrimitive]:
     """
     Fetch a generic resultaattype omschrijvingen
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from openzaak.selectielijst.api import warm_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Fetch the procestypen, resultaten and resultaattypeomschrijvingen from "
+        "the Selectielijst API and store them in the cache"
+    )
+
+    def handle(self, **options):
+        counts = warm_cache()
+
+        for name, count in counts.items():
+            self.stdout.write(f"{name}: {count}")
+        self.stdout.write(self.style.SUCCESS("Selectielijst cache is warmed up"))
@@ -0,0 +1,87 @@
+from io import StringIO
+from unittest.mock import Mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+import requests_mock
+from freezegun import freeze_time
+
+from openzaak.utils.decorators import get_cached_value
+from openzaak.utils.tests import ClearCachesMixin
+
+from ..api import get_resultaten
+from ..models import ReferentieLijstConfig
+from . import mock_oas_get, mock_resource_list
+from .mixins import ReferentieLijstServiceMixin
+
+PROCESTYPE = (
+    "https://selectielijst.openzaak.nl/api/v1/procestypen/"
+    "e1b73b12-b2f6-4c4e-8929-94f84dd2a57d"
+)
+
+
+class CachedValueTests(ClearCachesMixin, TestCase):
+    def test_none_cached(self):
+        func = Mock(return_value=None)
+
+        get_cached_value("key", func, timeout=60)
+        result = get_cached_value("key", func, timeout=60)
+
+        self.assertIsNone(result)
+        self.assertEqual(func.call_count, 1)
+
+    def test_stale_while_locked(self):
+        with freeze_time("2020-01-01T12:00:00"):
+            get_cached_value("key", lambda: "old", timeout=60, stale_timeout=60)
+
+        cache.add("key:lock", True)
+        func = Mock(return_value="new")
+
+        with freeze_time("2020-01-01T12:01:30"):
+            result = get_cached_value("key", func, timeout=60, stale_timeout=60)
+
+        self.assertEqual(result, "old")
+        func.assert_not_called()
+
+    def test_stale_on_error(self):
+        with freeze_time("2020-01-01T12:00:00"):
+            get_cached_value("key", lambda: "old", timeout=60, stale_timeout=60)
+
+        with freeze_time("2020-01-01T12:01:30"):
+            result = get_cached_value(
+                "key", Mock(side_effect=IOError), timeout=60, stale_timeout=60
+            )
+
+        self.assertEqual(result, "old")
+        self.assertIsNone(cache.get("key:lock"))
+
+    def test_refresh(self):
+        get_cached_value("key", lambda: "old", timeout=60)
+
+        result = get_cached_value("key", lambda: "new", timeout=60, refresh=True)
+
+        self.assertEqual(result, "new")
+        self.assertEqual(get_cached_value("key", Mock(), timeout=60), "new")
+
+
+@requests_mock.Mocker()
+class WarmCacheTests(ReferentieLijstServiceMixin, ClearCachesMixin, TestCase):
+    def test_warm_cache(self, m):
+        ReferentieLijstConfig.get_solo()
+        mock_oas_get(m)
+        mock_resource_list(m, "procestypen")
+        mock_resource_list(m, "resultaten")
+        mock_resource_list(m, "resultaattypeomschrijvingen")
+
+        call_command("warm_selectielijst_cache", stdout=StringIO())
+        num_requests = len(m.request_history)
+
+        resultaten = get_resultaten(PROCESTYPE)
+
+        self.assertEqual(len(m.request_history), num_requests)
+        self.assertGreater(len(resultaten), 0)
+        self.assertTrue(
+            all(resultaat["procesType"] == PROCESTYPE for resultaat in resultaten)
+        )
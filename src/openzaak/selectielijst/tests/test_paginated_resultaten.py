@@ -69,6 +69,38 @@ class SelectieLijstResultatenTests(
         ]
         self.assertEqual(len(requests), 2)
 
+    def test_pages_from_count(self, m):
+        ReferentieLijstConfig.get_solo()
+        mock_oas_get(m)
+        base_url = "https://selectielijst.openzaak.nl/api/v1/resultaten"
+        for page in range(1, 4):
+            m.get(
+                f"{base_url}?page={page}" if page > 1 else base_url,
+                json={
+                    "previous": None,
+                    "next": f"{base_url}?page={page + 1}" if page < 3 else None,
+                    "count": 5,
+                    "results": [
+                        {"url": f"{base_url}/{i}"}
+                        for i in range(2 * page - 2, min(2 * page, 5))
+                    ],
+                },
+                complete_qs=True,
+            )
+
+        results = get_resultaten()
+
+        self.assertEqual(
+            [result["url"] for result in results],
+            [f"{base_url}/{i}" for i in range(5)],
+        )
+        requests = [
+            req
+            for req in m.request_history
+            if req.path != "/api/v1/schema/openapi.yaml"
+        ]
+        self.assertEqual(len(requests), 3)
+
     def test_filter_procestype(self, m):
         ReferentieLijstConfig.get_solo()
         mock_oas_get(m)
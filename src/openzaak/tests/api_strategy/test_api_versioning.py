@@ -1,11 +1,14 @@
 from unittest.mock import patch
 
-from django.test import override_settings
+from django.test import SimpleTestCase, override_settings
 
 import yaml
 from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes
 from vng_api_common.tests import reverse
 
+from openzaak.utils.middleware import PathRouter
+
 EXPECTED_VERSIONS = (
     ("autorisaties", "1.0.0"),
     ("besluiten", "1.0.0"),
@@ -44,3 +47,35 @@ class APIVersioningTests(APITestCase):
         response = self.client.get("/test-view")
 
         self.assertEqual(response["API-version"], "1.0.0")
+
+
+class PathRouterTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.router = PathRouter(
+            {"/zaken/api/v1/": "1.0.0", "/catalogi/api/v1/": "1.0.1"}
+        )
+
+    def test_get_component_type(self):
+        self.assertEqual(
+            self.router.get_component_type("/zaken/api/v1/zaken"), ComponentTypes.zrc
+        )
+        self.assertEqual(self.router.get_component_type("/zaken"), ComponentTypes.zrc)
+        self.assertIsNone(self.router.get_component_type("/zakenlijst/"))
+        self.assertIsNone(self.router.get_component_type("/admin/zaken/"))
+
+    @override_settings(FORCE_SCRIPT_NAME="/openzaak/")
+    def test_get_component_type_script_name(self):
+        router = PathRouter({})
+
+        self.assertEqual(
+            router.get_component_type("/openzaak/documenten/api/v1/"),
+            ComponentTypes.drc,
+        )
+        self.assertIsNone(router.get_component_type("/documenten/api/v1/"))
+
+    def test_get_version(self):
+        self.assertEqual(self.router.get_version("/zaken/api/v1/statussen"), "1.0.0")
+        self.assertEqual(self.router.get_version("/catalogi/api/v1/"), "1.0.1")
+        self.assertIsNone(self.router.get_version("/besluiten/api/v1/"))
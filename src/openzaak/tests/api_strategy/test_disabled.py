@@ -1,9 +1,12 @@
+from django.test import TestCase
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.constants import ComponentTypes
 from vng_api_common.tests import reverse
 
 from openzaak.components.zaken.tests.utils import ZAAK_READ_KWARGS
+from openzaak.config.cache import internal_services, invalidate_internal_services
 from openzaak.config.models import InternalService
 from openzaak.utils.tests import JWTAuthMixin
 
@@ -12,6 +15,9 @@ class DisableTests(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
 
     def _test_service_disabled(self, component_type, url, **kwargs):
+        # the snapshot must not keep the state of the rolled back test data
+        self.addCleanup(invalidate_internal_services)
+
         # service is enabled
         response = self.client.get(url, **kwargs)
 
@@ -46,3 +52,29 @@ class DisableTests(JWTAuthMixin, APITestCase):
 
     def test_authorisaties(self):
         self._test_service_disabled(ComponentTypes.ac, reverse("applicatie-list"))
+
+
+class InternalServicesSnapshotTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        invalidate_internal_services()
+        self.addCleanup(invalidate_internal_services)
+
+    def test_enabled_state_from_memory(self):
+        self.assertTrue(internal_services.is_enabled(ComponentTypes.zrc))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(internal_services.is_enabled(ComponentTypes.zrc))
+
+    def test_reloaded_on_save(self):
+        self.assertTrue(internal_services.is_enabled(ComponentTypes.drc))
+
+        service, created = InternalService.objects.get_or_create(
+            api_type=ComponentTypes.drc
+        )
+        service.enabled = False
+        service.save()
+
+        self.assertFalse(internal_services.is_enabled(ComponentTypes.drc))
+        self.assertTrue(internal_services.is_enabled(ComponentTypes.zrc))
@@ -0,0 +1,125 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import TestCase, override_settings
+
+from django_loose_fk.loaders import FetchError
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openzaak.circuit_breaker import CircuitOpenError, breakers
+from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.metrics import collect
+from openzaak.utils.tests import ClearCachesMixin
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(self.path)
+
+        if self.path.endswith("/slow"):
+            time.sleep(0.1)
+
+        status = 500 if self.path.endswith("/error") else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(
+    REMOTE_API_CIRCUIT_BREAKER=True,
+    REMOTE_API_CIRCUIT_WINDOW=60,
+    REMOTE_API_CIRCUIT_MIN_CALLS=4,
+    REMOTE_API_CIRCUIT_ERROR_RATE=0.5,
+    REMOTE_API_CIRCUIT_SLOW_CALL=10.0,
+    REMOTE_API_CIRCUIT_RESET_TIMEOUT=30,
+    REMOTE_API_MAX_RETRIES=0,
+)
+class CircuitBreakerTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.server.requests = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.api_root = f"http://127.0.0.1:{cls.server.server_port}/api/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self.server.requests.clear()
+        breakers.clear()
+        Service.objects.create(
+            api_root=self.api_root,
+            api_type=APITypes.ztc,
+            auth_type=AuthTypes.no_auth,
+            label="stub",
+        )
+
+    def fetch(self, path: str):
+        return AuthorizedRequestsLoader.fetch_object(f"{self.api_root}{path}")
+
+    def test_opens_on_errors(self):
+        for i in range(4):
+            with self.assertRaises(FetchError):
+                self.fetch("error")
+
+        with self.assertRaises(CircuitOpenError) as cm:
+            self.fetch("ok")
+
+        self.assertEqual(cm.exception.status_code, 503)
+        self.assertEqual(len(self.server.requests), 4)
+
+    @override_settings(REMOTE_API_CIRCUIT_SLOW_CALL=0.05)
+    def test_opens_on_latency(self):
+        for i in range(4):
+            self.fetch("slow")
+
+        with self.assertRaises(CircuitOpenError):
+            self.fetch("ok")
+
+    def test_stays_closed_below_error_rate(self):
+        for path in ["ok", "ok", "error", "ok", "ok"]:
+            try:
+                self.fetch(path)
+            except FetchError:
+                pass
+
+        self.fetch("ok")
+
+        self.assertEqual(len(self.server.requests), 6)
+
+    @override_settings(REMOTE_API_CIRCUIT_RESET_TIMEOUT=0)
+    def test_closes_after_successful_trial(self):
+        for i in range(4):
+            with self.assertRaises(FetchError):
+                self.fetch("error")
+
+        self.fetch("ok")
+
+        self.assertEqual(breakers.get(self.api_root).state, "closed")
+
+    def test_metrics(self):
+        self.fetch("ok")
+        with self.assertRaises(FetchError):
+            self.fetch("error")
+
+        (result,) = collect()
+
+        self.assertEqual(result["api_root"], self.api_root)
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(result["errors"], 1)
+        self.assertEqual(result["buckets"][-1], (float("inf"), 2))
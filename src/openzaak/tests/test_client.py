@@ -0,0 +1,136 @@
+import inspect
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+import requests_mock
+from zds_client.client import Client
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openzaak.circuit_breaker import breakers
+from openzaak.client import PooledClient, get_session, sessions
+from openzaak.config.cache import services_index
+from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.metrics import collect
+from openzaak.utils.tests import ClearCachesMixin
+
+ZAAKTYPE = (
+    "https://externe.catalogus.nl/api/v1/zaaktypen/b71f72ef-198d-44d8-af64-ae1932df830a"
+)
+
+
+class SessionRegistryTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        sessions.clear()
+        self.addCleanup(sessions.clear)
+
+    def test_session_per_service(self):
+        service = Service(api_root="https://externe.catalogus.nl/api/v1/")
+        other_service = Service(api_root="https://andere.catalogus.nl/api/v1/")
+
+        session = get_session(service)
+
+        self.assertIs(get_session(service), session)
+        self.assertIsNot(get_session(other_service), session)
+        self.assertIs(get_session(None), get_session(None))
+
+    @override_settings(REMOTE_API_POOL_SIZE=3, REMOTE_API_MAX_RETRIES=4)
+    def test_session_configuration(self):
+        adapter = get_session(None).get_adapter("https://example.com")
+
+        self.assertEqual(adapter._pool_maxsize, 3)
+        self.assertEqual(adapter.max_retries.total, 4)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    def test_sessions_reset_on_setting_change(self):
+        session = get_session(None)
+
+        with override_settings(REMOTE_API_POOL_SIZE=1):
+            self.assertIsNot(get_session(None), session)
+
+    @override_settings(REMOTE_API_CONNECT_TIMEOUT=1.0, REMOTE_API_READ_TIMEOUT=2.0)
+    def test_loader_uses_session(self):
+        Service.objects.create(
+            api_root="https://externe.catalogus.nl/api/v1/",
+            api_type=APITypes.ztc,
+            auth_type=AuthTypes.zgw,
+            label="external ZTC",
+            client_id="client-id",
+            secret="secret",
+        )
+
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+            AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        request = m.last_request
+        self.assertEqual(request.timeout, (1.0, 2.0))
+        self.assertIn("Authorization", request.headers)
+        self.assertIn("https://externe.catalogus.nl/api/v1/", sessions._sessions)
+
+
+@override_settings(REMOTE_API_CIRCUIT_BREAKER=True)
+class PooledClientTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        sessions.clear()
+        self.addCleanup(sessions.clear)
+        breakers.clear()
+        self.addCleanup(breakers.clear)
+
+    @patch("openzaak.client.get_headers", return_value={})
+    @patch.object(PooledClient, "schema", {})
+    def test_nlx_service_keyed_by_api_root(self, *mocks):
+        service = Service.objects.create(
+            api_root="https://externe.catalogus.nl/api/v1/",
+            nlx="http://outway.local/externe.catalogus.nl/api/v1/",
+            api_type=APITypes.ztc,
+            auth_type=AuthTypes.no_auth,
+            label="external ZTC",
+        )
+        nlx_url = ZAAKTYPE.replace(service.api_root, service.nlx)
+        client = services_index.get_client(ZAAKTYPE)
+
+        with requests_mock.Mocker() as m:
+            m.get(nlx_url, json={"url": ZAAKTYPE})
+            client.request(nlx_url, "zaaktype_read")
+
+        self.assertEqual(m.last_request.url, nlx_url)
+        self.assertEqual(list(sessions._sessions), [service.api_root])
+        self.assertEqual(list(breakers._breakers), [service.api_root])
+        (result,) = collect()
+        self.assertEqual(result["api_root"], service.api_root)
+
+    def test_request_mirrors_upstream_signature(self):
+        # PooledClient.request is a copy of the upstream method, see its comment
+        expected = (
+            "(self, path: str, operation: str, method='GET', expected_status=200, "
+            "**kwargs) -> Union[List[Dict[str, Any]], Dict[str, Any]]"
+        )
+
+        self.assertEqual(str(inspect.signature(Client.request)), expected)
+        self.assertEqual(
+            inspect.signature(PooledClient.request), inspect.signature(Client.request)
+        )
+
+    @override_settings(REMOTE_API_CONNECT_TIMEOUT=1.0, REMOTE_API_READ_TIMEOUT=2.0)
+    @patch("openzaak.client.get_headers", return_value={})
+    @patch.object(PooledClient, "schema", {})
+    def test_request_sent_with_timeout(self, *mocks):
+        Service.objects.create(
+            api_root="https://externe.catalogus.nl/api/v1/",
+            api_type=APITypes.ztc,
+            auth_type=AuthTypes.no_auth,
+            label="external ZTC",
+        )
+        client = services_index.get_client(ZAAKTYPE)
+
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+            client.request(ZAAKTYPE, "zaaktype_read")
+
+        self.assertEqual(m.last_request.timeout, (1.0, 2.0))
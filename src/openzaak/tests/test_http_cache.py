@@ -0,0 +1,148 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests_mock
+from django_loose_fk.loaders import FetchError
+from freezegun import freeze_time
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openzaak.http_cache import parse_cache_control
+from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.utils.tests import ClearCachesMixin
+
+ZAAKTYPE = (
+    "https://externe.catalogus.nl/api/v1/zaaktypen/b71f72ef-198d-44d8-af64-ae1932df830a"
+)
+
+
+def fetch():
+    return AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+
+@override_settings(REMOTE_API_CACHE_TIMEOUT=0, REMOTE_API_STALE_IF_ERROR=60)
+class RemoteResourceCacheTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.service = Service.objects.create(
+            api_root="https://externe.catalogus.nl/api/v1/",
+            api_type=APITypes.ztc,
+            auth_type=AuthTypes.zgw,
+            label="external ZTC",
+            client_id="client-id",
+            secret="secret",
+        )
+
+    def later(self, seconds: int):
+        return freeze_time(timezone.now() + timedelta(seconds=seconds))
+
+    def test_not_cached_without_headers(self):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+            fetch()
+            fetch()
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_cached_with_max_age(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                ZAAKTYPE,
+                json={"omschrijving": "a"},
+                headers={"Cache-Control": "max-age=60"},
+            )
+            fetch()
+            data = fetch()
+
+            with self.later(61):
+                fetch()
+
+        self.assertEqual(data, {"omschrijving": "a"})
+        self.assertEqual(m.call_count, 2)
+
+    def test_no_store(self):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json={}, headers={"Cache-Control": "no-store, max-age=60"})
+            fetch()
+            fetch()
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_service_default_timeout(self):
+        self.service.extra = {"cache_timeout": 60}
+        self.service.save()
+
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json={})
+            fetch()
+            fetch()
+
+        self.assertEqual(m.call_count, 1)
+
+    def test_revalidate_with_etag(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                ZAAKTYPE,
+                [
+                    {"json": {"omschrijving": "a"}, "headers": {"ETag": '"abc"'}},
+                    {"status_code": 304, "headers": {"ETag": '"abc"'}},
+                ],
+            )
+            fetch()
+            data = fetch()
+
+        self.assertEqual(data, {"omschrijving": "a"})
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+
+    def test_stale_if_error(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                ZAAKTYPE,
+                [
+                    {
+                        "json": {"omschrijving": "a"},
+                        "headers": {"Cache-Control": "max-age=10"},
+                    },
+                    {"status_code": 503},
+                    {"status_code": 503},
+                ],
+            )
+            fetch()
+
+            with self.later(30):
+                self.assertEqual(fetch(), {"omschrijving": "a"})
+
+            with self.later(80):
+                with self.assertRaises(FetchError):
+                    fetch()
+
+    def test_must_revalidate_not_served_stale(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                ZAAKTYPE,
+                [
+                    {
+                        "json": {},
+                        "headers": {"Cache-Control": "max-age=10, must-revalidate"},
+                    },
+                    {"status_code": 503},
+                ],
+            )
+            fetch()
+
+            with self.later(30):
+                with self.assertRaises(FetchError):
+                    fetch()
+
+
+class ParseCacheControlTests(TestCase):
+    def test_parse(self):
+        directives = parse_cache_control('public, max-age=60, no-cache="Set-Cookie"')
+
+        self.assertEqual(
+            directives, {"public": None, "max-age": "60", "no-cache": "Set-Cookie"}
+        )
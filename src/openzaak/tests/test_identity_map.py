@@ -0,0 +1,141 @@
+from django.test import TestCase
+
+import requests_mock
+
+from openzaak.components.catalogi.models import ZaakType
+from openzaak.components.documenten.loaders import EIOLoader
+from openzaak.components.documenten.models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+)
+from openzaak.components.documenten.tests.utils import get_eio_response
+from openzaak.components.zaken.models import ZaakInformatieObject
+from openzaak.components.zaken.tests.factories import (
+    ZaakFactory,
+    ZaakInformatieObjectFactory,
+)
+from openzaak.components.zaken.tests.utils import get_zaaktype_response
+from openzaak.loaders import AuthorizedRequestsLoader, identity_map
+
+CATALOGUS = "https://externe.catalogus.nl/api/v1/catalogussen/1c8e36be-338c-4c07-ac5e-1adf55bec04a"
+ZAAKTYPE = (
+    "https://externe.catalogus.nl/api/v1/zaaktypen/b71f72ef-198d-44d8-af64-ae1932df830a"
+)
+
+
+class IdentityMapTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.loader = AuthorizedRequestsLoader()
+        self.mocker = requests_mock.Mocker()
+        self.mocker.start()
+        self.addCleanup(self.mocker.stop)
+        self.mocker.get(ZAAKTYPE, json=get_zaaktype_response(CATALOGUS, ZAAKTYPE))
+
+    def test_loaded_once_per_scope(self):
+        with identity_map.scope():
+            zaaktype = self.loader.load(ZAAKTYPE, ZaakType)
+
+            self.assertIs(self.loader.load(ZAAKTYPE, ZaakType), zaaktype)
+            self.assertEqual(identity_map.hits, 1)
+            self.assertEqual(identity_map.misses, 1)
+
+        self.assertEqual(self.mocker.call_count, 1)
+        self.assertFalse(identity_map.active)
+
+    def test_not_shared_between_scopes(self):
+        with identity_map.scope():
+            self.loader.load(ZAAKTYPE, ZaakType)
+
+        with identity_map.scope():
+            self.loader.load(ZAAKTYPE, ZaakType)
+
+        self.assertEqual(self.mocker.call_count, 2)
+
+    def test_no_scope(self):
+        self.loader.load(ZAAKTYPE, ZaakType)
+        self.loader.load(ZAAKTYPE, ZaakType)
+
+        self.assertEqual(self.mocker.call_count, 2)
+
+
+class LoadManyTests(TestCase):
+    urls = [
+        f"https://external.documenten.nl/api/v1/enkelvoudiginformatieobjecten/{i}"
+        for i in range(5)
+    ]
+
+    def setUp(self):
+        super().setUp()
+
+        self.mocker = requests_mock.Mocker()
+        self.mocker.start()
+        self.addCleanup(self.mocker.stop)
+        for url in self.urls:
+            self.mocker.get(url, json=get_eio_response(url))
+
+    def test_load_many(self):
+        eios = list(EIOLoader().load_many(self.urls * 2, EnkelvoudigInformatieObject))
+
+        self.assertEqual({eio._loose_fk_data["url"] for eio in eios}, set(self.urls))
+        self.assertEqual(self.mocker.call_count, 5)
+
+    def test_shared_with_identity_map(self):
+        loader = EIOLoader()
+
+        with identity_map.scope():
+            eio = loader.load(self.urls[0], EnkelvoudigInformatieObjectCanonical)
+            eios = list(loader.load_many(self.urls, EnkelvoudigInformatieObject))
+            for url in self.urls:
+                loader.load(url, EnkelvoudigInformatieObjectCanonical)
+
+        self.assertIn(eio, eios)
+        self.assertEqual(self.mocker.call_count, 5)
+
+
+class PrefetchLooseFkTests(TestCase):
+    urls = [
+        f"https://external.documenten.nl/api/v1/enkelvoudiginformatieobjecten/{i}"
+        for i in range(3)
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        zaak = ZaakFactory.create()
+        for url in cls.urls:
+            ZaakInformatieObjectFactory.create(zaak=zaak, informatieobject=url)
+        ZaakInformatieObjectFactory.create(zaak=zaak)
+
+    def setUp(self):
+        super().setUp()
+
+        self.mocker = requests_mock.Mocker()
+        self.mocker.start()
+        self.addCleanup(self.mocker.stop)
+        for url in self.urls:
+            self.mocker.get(url, json=get_eio_response(url))
+
+    def test_loaded_in_one_batch_on_access(self):
+        with identity_map.scope():
+            zios = list(
+                ZaakInformatieObject.objects.prefetch_loose_fk("informatieobject")
+            )
+            self.assertEqual(self.mocker.call_count, 0)
+
+            zios[0].informatieobject
+            self.assertEqual(self.mocker.call_count, 3)
+
+            for zio in zios:
+                zio.informatieobject
+            self.assertEqual(self.mocker.call_count, 3)
+
+    def test_without_scope(self):
+        zios = ZaakInformatieObject.objects.prefetch_loose_fk("informatieobject")
+
+        for zio in zios:
+            zio.informatieobject
+
+        self.assertEqual(self.mocker.call_count, 3)
@@ -0,0 +1,38 @@
+from django.test import SimpleTestCase
+
+from djangorestframework_camel_case.util import underscoreize
+
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.utils import get_zaak_response
+from openzaak.loaders import (
+    AuthorizedRequestsLoader,
+    get_model_instance_with_gegevensgroeps,
+    get_model_metadata,
+)
+
+ZAAK = "https://externe.zaken.nl/api/v1/zaken/d781cd1b-f100-4051-9543-153b93299da4"
+ZAAKTYPE = (
+    "https://externe.catalogus.nl/api/v1/zaaktypen/b71f72ef-198d-44d8-af64-ae1932df830a"
+)
+
+
+class ModelInstanceTests(SimpleTestCase):
+    def test_gegevensgroeps(self):
+        data = get_zaak_response(ZAAK, ZAAKTYPE)
+        data["verlenging"] = {"reden": "some reden", "duur": "P5D"}
+
+        zaak = get_model_instance_with_gegevensgroeps(
+            Zaak, underscoreize(data), loader=AuthorizedRequestsLoader()
+        )
+
+        self.assertEqual(zaak.verlenging_reden, "some reden")
+        self.assertEqual(zaak.verlenging_duur, "P5D")
+        self.assertEqual(zaak.omschrijving, "some zaak")
+        self.assertEqual(zaak._initial_data["verlenging"]["reden"], "some reden")
+
+    def test_metadata_cached(self):
+        metadata = get_model_metadata(Zaak)
+
+        self.assertIs(get_model_metadata(Zaak), metadata)
+        self.assertIn("zaaktype", metadata.field_names)
+        self.assertIn("verlenging", dict(metadata.gegevensgroeps))
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openzaak import metrics
+from openzaak.utils.tests import ClearCachesMixin
+
+API_ROOT = "https://externe.catalogus.nl/api/v1/"
+
+
+class MetricsTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        Service.objects.create(
+            api_root=API_ROOT,
+            api_type=APITypes.ztc,
+            auth_type=AuthTypes.no_auth,
+            label="external ZTC",
+        )
+
+    def test_counted_in_process(self):
+        with patch("openzaak.metrics._incr") as incr:
+            metrics.observe(API_ROOT, 0.2, False)
+            metrics.observe(API_ROOT, 0.3, True)
+
+        incr.assert_not_called()
+
+        (result,) = metrics.collect()
+
+        self.assertEqual(result["api_root"], API_ROOT)
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(result["errors"], 1)
+        self.assertEqual(result["sum"], 0.5)
+
+    @patch("openzaak.metrics.FLUSH_INTERVAL", 0)
+    def test_flushed_after_interval(self):
+        metrics.observe(API_ROOT, 0.2, False)
+
+        cache = caches["default"]
+        self.assertEqual(cache.get(metrics._get_key(API_ROOT, "count")), 1)
+        self.assertEqual(cache.get(metrics._get_root_key(API_ROOT)), API_ROOT)
+
+    def test_unknown_roots_not_collected(self):
+        metrics.observe("https://example.com/api/v1/", 0.2, False)
+
+        self.assertEqual(metrics.collect(), [])
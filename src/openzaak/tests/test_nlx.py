@@ -0,0 +1,54 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+import requests_mock
+
+from openzaak.config.constants import NLXDirectories
+from openzaak.config.models import NLXConfig
+from openzaak.nlx.api import get_services
+from openzaak.utils.tests import ClearCachesMixin
+
+LIST_SERVICES = "https://directory.demo.nlx.io/api/directory/list-services"
+
+SERVICES = [
+    {
+        "organization_name": "gemeente",
+        "service_name": "zaken",
+        "inway_addresses": ["inway.gemeente.nl:443"],
+        "documentation_url": "https://gemeente.nl/zaken/schema/openapi.yaml",
+    },
+    {
+        "organization_name": "gemeente",
+        "service_name": "documenten",
+        "inway_addresses": ["inway.gemeente.nl:443"],
+    },
+]
+
+
+@requests_mock.Mocker()
+class DirectoryTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        config = NLXConfig.get_solo()
+        config.directory = NLXDirectories.demo
+        config.save()
+
+    def test_cached(self, m):
+        m.get(LIST_SERVICES, json={"services": SERVICES})
+
+        get_services()
+        services = get_services()
+
+        self.assertEqual(services, SERVICES)
+        self.assertEqual(m.call_count, 1)
+
+    def test_refresh_command(self, m):
+        m.get(LIST_SERVICES, json={"services": SERVICES})
+        get_services()
+
+        call_command("refresh_nlx_directory", stdout=StringIO())
+
+        self.assertEqual(m.call_count, 2)
@@ -2,22 +2,23 @@ import logging
 from typing import Optional
 
 from zgw_consumers.client import ZGWClient
-from zgw_consumers.models import Service
+
+from openzaak.config.cache import services_index
 
 logger = logging.getLogger(__name__)
 
 
 def get_auth(url: str) -> dict:
     logger.info("Authenticating for %s", url)
-    auth_header = Service.get_auth_header(url)
+    service = services_index.get_service(url)
 
-    if auth_header is not None:
-        return auth_header
+    if service is not None:
+        return services_index.get_auth_header(service)
 
     logger.warning("Could not authenticate for %s", url)
     return {}
 
 
 def get_client(url: str) -> Optional[ZGWClient]:
-    client = Service.get_client(url)
+    client = services_index.get_client(url)
     return client
@@ -1,3 +1,6 @@
+from django.utils.translation import ugettext_lazy as _
+
+from djchoices import ChoiceItem, DjangoChoices
 from vng_api_common.constants import ComponentTypes
 
 COMPONENT_MAPPING = {
@@ -7,3 +10,8 @@ COMPONENT_MAPPING = {
     "documenten": ComponentTypes.drc,
     "besluiten": ComponentTypes.brc,
 }
+
+
+class AuthorizationsFilterStrategies(DjangoChoices):
+    case = ChoiceItem("case", _("Case/when-expressie per autorisatie"))
+    join = ChoiceItem("join", _("IN-filter per vertrouwelijkheidaanduiding"))
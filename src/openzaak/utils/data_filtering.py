@@ -25,12 +25,13 @@ class ListFilterByAuthorizationsMixin:
         if not self.action == "list":
             return base
 
-        # get the auth apps that are relevant for this particular request
-        apps = self.request.jwt_auth.applicaties
+        # the authorizations of the auth apps relevant for this particular
+        # request, compiled once per request
+        index = self.request.jwt_auth.authorizations_index
 
         # as soon as there's one matching app that gives you all permissions,
         # you're good - no further detailed data filtering is applied
-        if any(app.heeft_alle_autorisaties for app in apps):
+        if index.heeft_alle_autorisaties:
             return base
 
         scope_needed = self.required_scopes[self.action]
@@ -1,34 +1,135 @@
+import logging
+import time
 from functools import wraps
+from typing import Optional
 
 from django.core.cache import caches
 
+logger = logging.getLogger(__name__)
+
+# time in seconds to wait for another process computing the same value
+LOCK_TIMEOUT = 30
+LOCK_POLL_INTERVAL = 0.1
+
+
+class CachedValue:
+    """
+    A cached result and the time until which it is fresh.
+    """
+
+    def __init__(self, value, fresh_until: Optional[float]):
+        self.value = value
+        self.fresh_until = fresh_until
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.fresh_until is None or time.time() < self.fresh_until
+
+
+def get_cached_value(
+    key: str,
+    func: callable,
+    alias: str = "default",
+    timeout: Optional[int] = None,
+    stale_timeout: int = 0,
+    lock_timeout: int = LOCK_TIMEOUT,
+    refresh: bool = False,
+):
+    """
+    Return the cached result of ``func``, calling it on a miss.
+
+    Only one process computes a missing or expired value at a time, the others
+    wait for the result (on a miss) or get the stale value for at most
+    ``stale_timeout`` seconds after it expired. With ``refresh``, the value is
+    always computed and stored.
+    """
+    _cache = caches[alias]
+    lock_key = f"{key}:lock"
+
+    def compute():
+        value = func()
+        fresh_until = time.time() + timeout if timeout is not None else None
+        cache_timeout = timeout + stale_timeout if timeout is not None else None
+        _cache.set(key, CachedValue(value, fresh_until), timeout=cache_timeout)
+        return value
+
+    if refresh:
+        return compute()
+
+    cached = _cache.get(key)
+    if isinstance(cached, CachedValue) and cached.is_fresh:
+        return cached.value
+
+    if not _cache.add(lock_key, True, timeout=lock_timeout):
+        if isinstance(cached, CachedValue):
+            return cached.value
+
+        deadline = time.time() + lock_timeout
+        while time.time() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            cached = _cache.get(key)
+            if isinstance(cached, CachedValue):
+                return cached.value
+            if _cache.get(lock_key) is None:
+                break
+
+        logger.warning("Computing %s without waiting for the lock", key)
+        return compute()
+
+    try:
+        return compute()
+    except Exception:
+        if not isinstance(cached, CachedValue):
+            raise
+        logger.exception("Serving stale %s, it could not be refreshed", key)
+        return cached.value
+    finally:
+        _cache.delete(lock_key)
+
+
+def cache(
+    key: str,
+    alias: str = "default",
+    timeout: Optional[int] = None,
+    stale_timeout: int = 0,
+    lock_timeout: int = LOCK_TIMEOUT,
+):
+    """
+    Cache the result of the decorated function, see :func:`get_cached_value`.
+
+    The cached value can be replaced with ``func.refresh(*args, **kwargs)``.
+    """
 
-def cache(key: str, alias: str = "default", **set_options):
     def decorator(func: callable):
+        def call(args, kwargs, refresh: bool):
+            return get_cached_value(
+                key,
+                lambda: func(*args, **kwargs),
+                alias=alias,
+                timeout=timeout,
+                stale_timeout=stale_timeout,
+                lock_timeout=lock_timeout,
+                refresh=refresh,
+            )
+
         @wraps(func)
         def wrapped(*args, **kwargs):
-            _cache = caches[alias]
-            result = _cache.get(key)
-            if result is not None:
-                return result
-
-            result = func(*args, **kwargs)
-            _cache.set(key, result, **set_options)
-            return result
+            return call(args, kwargs, refresh=False)
 
+        wrapped.refresh = lambda *args, **kwargs: call(args, kwargs, refresh=True)
         return wrapped
 
     return decorator
 
 
-def cache_uuid(key, timeout):
+def cache_uuid(key, timeout, **options):
     def decorator(func: callable):
         @wraps(func)
         def wrapped(*args, **kwargs):
             # use first argument of function to extract uuid
             uuid = args[0].split("/")[-1]
             key_uuid = f"{key}-{uuid}"
-            cached_func = cache(key_uuid, timeout=timeout)(func)
+            cached_func = cache(key_uuid, timeout=timeout, **options)(func)
             result = cached_func(*args, **kwargs)
             return result
 
@@ -1,4 +1,7 @@
+from django.db import models
+
 from relativedeltafield import RelativeDeltaField
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 from ..forms.fields import RelativeDeltaField as RelativeDeltaFormField
 
@@ -8,3 +11,30 @@ class DurationField(RelativeDeltaField):
         if form_class is None:
             form_class = RelativeDeltaFormField
         return super().formfield(form_class=form_class, **kwargs)
+
+
+class VertrouwelijkheidsAanduidingOrderField(models.PositiveSmallIntegerField):
+    """
+    Store the order of the vertrouwelijkheidaanduiding of the instance.
+
+    The value is derived on save, so that filtering on the confidentiality
+    level can use an index instead of mapping the string values in each query.
+    """
+
+    def __init__(self, *args, source: str = "vertrouwelijkheidaanduiding", **kwargs):
+        self.source = source
+        kwargs.setdefault("null", True)
+        kwargs.setdefault("editable", False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.source != "vertrouwelijkheidaanduiding":
+            kwargs["source"] = self.source
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.source)
+        order = VertrouwelijkheidsAanduiding.get_choice(value).order if value else None
+        setattr(model_instance, self.attname, order)
+        return order
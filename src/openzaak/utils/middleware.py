@@ -1,7 +1,11 @@
 import logging
+import re
+from functools import lru_cache
 from typing import Dict, Optional
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.http import HttpRequest, HttpResponseNotFound
 
 from rest_framework.response import Response
@@ -11,7 +15,8 @@ from vng_api_common.middleware import (
     APIVersionHeaderMiddleware as _APIVersionHeaderMiddleware,
 )
 
-from openzaak.config.models import InternalService
+from openzaak.config.cache import internal_services
+from openzaak.loaders import identity_map
 
 from .constants import COMPONENT_MAPPING
 
@@ -42,12 +47,55 @@ def get_version_mapping() -> Dict[str, str]:
     }
 
 
-class APIVersionHeaderMiddleware(_APIVersionHeaderMiddleware):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+class PathRouter:
+    """
+    Map request paths to the API component and API version they belong to.
+
+    The prefixes are compiled into regular expressions once, so that a lookup
+    is a single match rather than a scan over all prefixes.
+    """
+
+    def __init__(self, version_mapping: Dict[str, str]):
+        script_name = re.escape((settings.FORCE_SCRIPT_NAME or "").rstrip("/"))
+        components = "|".join(re.escape(component) for component in COMPONENT_MAPPING)
+        self._component_pattern = re.compile(
+            rf"^{script_name}/(?P<component>{components})(?:/|$)"
+        )
+
+        # longest prefixes first, so the most specific prefix wins
+        prefixes = sorted(version_mapping, key=len, reverse=True)
+        self._versions = [version_mapping[prefix] for prefix in prefixes]
+        self._version_pattern = re.compile(
+            "|".join(f"({re.escape(prefix)})" for prefix in prefixes)
+        )
+
+    def get_component_type(self, path: str) -> Optional[str]:
+        match = self._component_pattern.match(path)
+        if match is None:
+            return None
+        return COMPONENT_MAPPING[match.group("component")]
+
+    def get_version(self, path: str) -> Optional[str]:
+        if not self._versions:
+            return None
+        match = self._version_pattern.match(path)
+        if match is None:
+            return None
+        return self._versions[match.lastindex - 1]
+
+
+@lru_cache(maxsize=None)
+def get_path_router() -> PathRouter:
+    return PathRouter(get_version_mapping())
+
 
-        self.version_mapping = get_version_mapping()
+@receiver(setting_changed, dispatch_uid="utils.reset_path_router")
+def reset_path_router(setting: str, **kwargs) -> None:
+    if setting in ("ROOT_URLCONF", "FORCE_SCRIPT_NAME", "REST_FRAMEWORK"):
+        get_path_router.cache_clear()
 
+
+class APIVersionHeaderMiddleware(_APIVersionHeaderMiddleware):
     def __call__(self, request):
         if self.get_response is None:
             return None
@@ -66,13 +114,17 @@ class APIVersionHeaderMiddleware(_APIVersionHeaderMiddleware):
         return response
 
     def _get_version(self, path: str) -> Optional[str]:
-        for prefix, version in self.version_mapping.items():
-            if path.startswith(prefix):
-                return version
-        return None
+        return get_path_router().get_version(path)
 
 
 class EnabledMiddleware:
+    """
+    Respond with HTTP 404 for the APIs that are disabled.
+
+    The enabled state is answered from an in-process snapshot, see
+    :mod:`openzaak.config.cache`.
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
 
@@ -80,20 +132,23 @@ class EnabledMiddleware:
         response = self.get_response(request)
         return response
 
-    @staticmethod
-    def get_component_type(request):
-        url = request.path
-        if settings.FORCE_SCRIPT_NAME and url.startswith(settings.FORCE_SCRIPT_NAME):
-            url = url.replace(settings.FORCE_SCRIPT_NAME, "", 1)
-        # All component names match the first parts of urls
-        component = url.strip("/").split("/")[0]
-        return COMPONENT_MAPPING.get(component)
-
     def process_view(self, request, view_func, view_args, view_kwargs):
-        component_type = self.get_component_type(request)
-        disabled = InternalService.objects.filter(
-            api_type=component_type, enabled=False
-        ).exists()
-        if not disabled:
+        component_type = get_path_router().get_component_type(request.path)
+        if component_type is None or internal_services.is_enabled(component_type):
             return None
         return HttpResponseNotFound()
+
+
+class RemoteObjectsMiddleware:
+    """
+    Load every remote object at most once per request.
+
+    See :class:`openzaak.loaders.IdentityMap`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with identity_map.scope():
+            return self.get_response(request)
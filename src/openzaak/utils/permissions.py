@@ -7,10 +7,12 @@ from django.core.exceptions import (
     ImproperlyConfigured,
     ValidationError as DjangoValidationError,
 )
+from django.db import models
 from django.db.models import ObjectDoesNotExist
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
+from django_loose_fk.fields import FkOrURLField
 from rest_framework import permissions
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.request import Request
@@ -19,6 +21,35 @@ from vng_api_common.permissions import bypass_permissions, get_required_scopes
 from vng_api_common.utils import get_resource_for_path
 
 
+def get_permission_field_value(obj: models.Model, field_name: str, request) -> Any:
+    """
+    Read the value of a permission field straight from the model instance.
+
+    Relations are returned as the absolute API URL of the related object, which
+    is equal to the value in the API representation of ``obj``. For loose-fk
+    fields, an external URL is returned as-is without loading the object.
+    """
+    field = obj._meta.get_field(field_name)
+
+    if isinstance(field, FkOrURLField):
+        url = getattr(obj, field.url_field)
+        if url:
+            return url
+        related = getattr(obj, field.fk_field)
+    elif field.is_relation:
+        related = getattr(obj, field_name)
+    else:
+        return getattr(obj, field_name)
+
+    if related is None:
+        return None
+    return related.get_absolute_api_url(request=request)
+
+
+def get_permission_fields(obj: models.Model, fields, request) -> Dict[str, Any]:
+    return {field: get_permission_field_value(obj, field, request) for field in fields}
+
+
 class AuthRequired(permissions.BasePermission):
     """
     Look at the scopes required for the current action
@@ -34,11 +65,8 @@ class AuthRequired(permissions.BasePermission):
     def get_fields(self, data):
         return {field: data.get(field) for field in self.permission_fields}
 
-    def format_data(self, obj, request) -> dict:
-        main_resource = self.get_main_resource()
-        serializer_class = main_resource.serializer_class
-        serializer = serializer_class(obj, context={"request": request})
-        return serializer.data
+    def get_object_fields(self, obj, request) -> dict:
+        return get_permission_fields(obj, self.permission_fields, request)
 
     def get_main_resource(self):
         if not self.main_resource:
@@ -101,7 +129,7 @@ class AuthRequired(permissions.BasePermission):
 
         if view.action == "create":
             if view.__class__ is main_resource:
-                main_object_data = request.data
+                fields = self.get_fields(request.data)
 
             else:
                 main_object_url = request.data[view.permission_main_object]
@@ -123,9 +151,8 @@ class AuthRequired(permissions.BasePermission):
                     )
                     raise ValidationError(err_dict)
 
-                main_object_data = self.format_data(main_object, request)
+                fields = self.get_object_fields(main_object, request)
 
-            fields = self.get_fields(main_object_data)
             return request.jwt_auth.has_auth(scopes_required, component, **fields)
 
         # detect if this is an unsupported method - if it's a viewset and the
@@ -153,6 +180,5 @@ class AuthRequired(permissions.BasePermission):
         else:
             main_object = self.get_main_object(obj, view.permission_main_object)
 
-        main_object_data = self.format_data(main_object, request)
-        fields = self.get_fields(main_object_data)
+        fields = self.get_object_fields(main_object, request)
         return request.jwt_auth.has_auth(scopes_required, component, **fields)
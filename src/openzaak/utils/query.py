@@ -1,15 +1,35 @@
-from typing import Union
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.db import models
-from django.db.models import Case, IntegerField, Value, When
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.base import ModelBase
+from django.db.models.query import ModelIterable
 from django.http.request import validate_host
 
-from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
 from vng_api_common.utils import get_resource_for_path
 
+from openzaak.components.autorisaties.index import CompiledAutorisatie
+
+from .constants import AuthorizationsFilterStrategies
+
+
+def is_local_url(url: str) -> bool:
+    host = urlparse(url).hostname
+    return validate_host(host, settings.ALLOWED_HOSTS)
+
+
+def get_uuid_from_url(url: str) -> Optional[uuid.UUID]:
+    path = urlparse(url).path.rstrip("/")
+    try:
+        return uuid.UUID(path.rsplit("/", 1)[-1])
+    except ValueError:
+        return None
+
 
 class QueryBlocked(Exception):
     pass
@@ -38,11 +58,67 @@ class BlockChangeMixin:
     delete.queryset_only = True
 
 
+class LooseFkPrefetchMixin:
+    """
+    Batch the loading of remote objects referenced by ``FkOrURLField`` fields.
+
+    Similar to ``prefetch_related``: when the queryset is evaluated, the
+    distinct remote URLs of the given fields are collected. The first time one
+    of these objects is accessed, all of them are fetched concurrently. This
+    requires an active identity map scope, which is opened for every request.
+    """
+
+    _loose_fk_lookups = ()
+
+    def prefetch_loose_fk(self, *field_names: str):
+        clone = self._chain()
+        clone._loose_fk_lookups = self._loose_fk_lookups + field_names
+        return clone
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._loose_fk_lookups = self._loose_fk_lookups
+        return clone
+
+    def _fetch_all(self):
+        evaluated = self._result_cache is not None
+        super()._fetch_all()
+        if (
+            not evaluated
+            and self._loose_fk_lookups
+            and issubclass(self._iterable_class, ModelIterable)
+        ):
+            prefetch_loose_fk_objects(self._result_cache, self._loose_fk_lookups)
+
+
+def prefetch_loose_fk_objects(instances: List[models.Model], field_names) -> None:
+    from openzaak.loaders import identity_map
+
+    if not instances or not identity_map.active:
+        return
+
+    for name in field_names:
+        field = instances[0]._meta.get_field(name)
+        loader = field.loader
+        if not hasattr(loader, "load_many"):
+            continue
+
+        urls = {getattr(instance, field.url_field) for instance in instances}
+        urls = {url for url in urls if url and not loader.is_local_url(url)}
+        if not urls:
+            continue
+
+        model = loader.get_remote_model(field._fk_field.related_model)
+        identity_map.defer(loader, model, urls)
+
+
 class LooseFkAuthorizationsFilterMixin:
     auth_fields = []
     loose_fk_field = None
     vertrouwelijkheidaanduiding_use = True
     authorizations_lookup = None
+    # overrides the AUTHORIZATIONS_FILTER_STRATEGY setting
+    authorizations_strategy = None
 
     @property
     def prefix(self):
@@ -62,19 +138,9 @@ class LooseFkAuthorizationsFilterMixin:
         return loose_fk_object
 
     def build_queryset(self, filters) -> models.QuerySet:
-        if self.vertrouwelijkheidaanduiding_use:
-            # annotate the queryset so we can map a string value to a logical number
-            order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-                f"{self.prefix}vertrouwelijkheidaanduiding"
-            )
-            annotations = {"_va_order": order_case}
-            # bring it all together now to build the resulting queryset
-            queryset = self.annotate(**annotations).filter(**filters)
-
-        else:
-            del filters["_va_order__lte"]
-            queryset = self.filter(**filters)
-        return queryset
+        if not self.vertrouwelijkheidaanduiding_use:
+            del filters[f"{self.prefix}_va_order__lte"]
+        return self.filter(**filters)
 
     def get_filters(self, scope, authorizations, local=True) -> dict:
         prefix = self.prefix
@@ -96,14 +162,12 @@ class LooseFkAuthorizationsFilterMixin:
             loose_fk_object = self.get_loose_fk_object(authorization, local)
             loose_fk_objecten.append(loose_fk_object)
 
-            # extract the order and map it to the database value
-            choice_item = VertrouwelijkheidsAanduiding.get_choice(
-                authorization.max_vertrouwelijkheidaanduiding
-            )
+            # the order of the max_vertrouwelijkheidaanduiding is pre-computed
+            # in the authorizations index
             vertrouwelijkheidaanduiding_whens.append(
                 When(
                     **{f"{prefix}{loose_fk_field}": loose_fk_object},
-                    then=Value(choice_item.order),
+                    then=Value(authorization.max_va_order),
                 )
             )
 
@@ -113,7 +177,9 @@ class LooseFkAuthorizationsFilterMixin:
         #   confidentiality level
         filters = {
             f"{prefix}{loose_fk_field}__in": loose_fk_objecten,
-            "_va_order__lte": Case(
+            # the order of the vertrouwelijkheidaanduiding is stored on the
+            # objects, see VertrouwelijkheidsAanduidingOrderField
+            f"{prefix}_va_order__lte": Case(
                 *vertrouwelijkheidaanduiding_whens, output_field=IntegerField()
             ),
         }
@@ -125,8 +191,25 @@ class LooseFkAuthorizationsFilterMixin:
         return queryset.values_list("pk", flat=True)
 
     def filter_for_authorizations(
-        self, scope: Scope, authorizations: models.QuerySet
+        self,
+        scope: Scope,
+        authorizations: List[CompiledAutorisatie],
+        strategy: Optional[str] = None,
     ) -> models.QuerySet:
+        """
+        Filter the queryset on the objects the authorizations give access to.
+
+        :param strategy: one of :class:`AuthorizationsFilterStrategies`, defaults
+          to the ``authorizations_strategy`` of the queryset or the
+          ``AUTHORIZATIONS_FILTER_STRATEGY`` setting
+        """
+        strategy = (
+            strategy
+            or self.authorizations_strategy
+            or settings.AUTHORIZATIONS_FILTER_STRATEGY
+        )
+        if strategy == AuthorizationsFilterStrategies.join:
+            return self.filter_for_authorizations_join(scope, authorizations)
 
         # todo implement error if no loose-fk field
 
@@ -134,9 +217,7 @@ class LooseFkAuthorizationsFilterMixin:
         authorizarions_external = []
 
         for auth in authorizations:
-            loose_fk_host = urlparse(getattr(auth, self.loose_fk_field)).hostname
-            allowed_hosts = settings.ALLOWED_HOSTS
-            if validate_host(loose_fk_host, allowed_hosts):
+            if is_local_url(getattr(auth, self.loose_fk_field)):
                 authorizations_local.append(auth)
             else:
                 authorizarions_external.append(auth)
@@ -146,3 +227,102 @@ class LooseFkAuthorizationsFilterMixin:
         queryset = self.filter(pk__in=ids_local.union(ids_external))
 
         return queryset
+
+    # join strategy
+
+    def get_authorizations_model(self) -> ModelBase:
+        """
+        Return the model holding the loose-fk field the authorizations apply to.
+        """
+        model = self.model
+        if self.authorizations_lookup:
+            for bit in self.authorizations_lookup.split("__"):
+                model = model._meta.get_field(bit).related_model
+        return model
+
+    def filter_authorized(self, authorized: models.QuerySet) -> models.QuerySet:
+        """
+        Limit the queryset to the related, authorized objects.
+        """
+        return self.filter(**{f"{self.authorizations_lookup}__in": authorized})
+
+    def get_authorized_types(
+        self, scope: Scope, authorizations: List[CompiledAutorisatie]
+    ) -> Tuple[Dict[int, Optional[int]], Dict[str, Optional[int]]]:
+        """
+        Map the authorized loose-fk objects to the max confidentiality order.
+
+        Local objects are keyed by primary key, external objects by URL.
+        """
+        local_orders = {}
+        external_orders = {}
+
+        for authorization in authorizations:
+            if not scope.is_contained_in(authorization.scopes):
+                continue
+
+            order = authorization.max_va_order
+            # without confidentiality level, nothing is allowed
+            if self.vertrouwelijkheidaanduiding_use and order is None:
+                continue
+
+            url = getattr(authorization, self.loose_fk_field)
+            orders = local_orders if is_local_url(url) else external_orders
+            if orders.get(url) is None or (order or 0) > orders[url]:
+                orders[url] = order
+
+        # resolve the local objects in a single query
+        uuids = {get_uuid_from_url(url): url for url in local_orders}
+        uuids.pop(None, None)
+
+        field = self.get_authorizations_model()._meta.get_field(self.loose_fk_field)
+        type_model = field._fk_field.related_model
+        local_pks = type_model.objects.filter(uuid__in=uuids).values_list("uuid", "pk")
+        local = {pk: local_orders[uuids[_uuid]] for _uuid, pk in local_pks}
+        return local, external_orders
+
+    def get_authorizations_join_filter(
+        self, local: Dict[int, Optional[int]], external: Dict[str, Optional[int]]
+    ) -> Q:
+        """
+        Build the condition matching the objects against the authorizations.
+
+        The authorized types are grouped by their max confidentiality order, so
+        that the condition has an ``IN`` filter per order rather than a ``CASE``
+        branch per authorization.
+        """
+        field = self.get_authorizations_model()._meta.get_field(self.loose_fk_field)
+
+        condition = Q()
+        lookups = ((field._fk_field.name, local), (field._url_field.name, external))
+        for lookup, orders in lookups:
+            if not orders:
+                continue
+
+            if not self.vertrouwelijkheidaanduiding_use:
+                condition |= Q(**{f"{lookup}__in": list(orders)})
+                continue
+
+            by_order = defaultdict(list)
+            for loose_fk, order in orders.items():
+                by_order[order].append(loose_fk)
+
+            for order, loose_fks in sorted(by_order.items()):
+                condition |= Q(**{f"{lookup}__in": loose_fks, "_va_order__lte": order})
+
+        return condition
+
+    def filter_for_authorizations_join(
+        self, scope: Scope, authorizations: List[CompiledAutorisatie]
+    ) -> models.QuerySet:
+        local, external = self.get_authorized_types(scope, authorizations)
+        if not local and not external:
+            return self.none()
+
+        condition = self.get_authorizations_join_filter(local, external)
+        if not self.authorizations_lookup:
+            return self.filter(condition)
+
+        model = self.get_authorizations_model()
+        authorized = model._default_manager.filter(condition)
+        return self.filter_authorized(authorized)
@@ -12,7 +12,10 @@ from vng_api_common.models import JWTSecret
 from vng_api_common.tests import generate_jwt_auth, reverse
 from zds_client.tests.mocks import MockClient
 
+from openzaak import metrics
 from openzaak.accounts.models import User
+from openzaak.components.autorisaties.cache import invalidate_authorizations_cache
+from openzaak.config.cache import services_index
 
 
 class JWTAuthMixin:
@@ -76,6 +79,9 @@ class JWTAuthMixin:
     def setUp(self):
         super().setUp()
 
+        # rolled back test data may still be present in the cache
+        invalidate_authorizations_cache()
+
         token = generate_jwt_auth(
             client_id=self.client_id,
             secret=self.secret,
@@ -93,6 +99,8 @@ class ClearCachesMixin:
     def _clear_caches(self):
         for cache in caches.all():
             cache.clear()
+        services_index.clear()
+        metrics.counters.clear()
 
 
 class AdminTestMixin: